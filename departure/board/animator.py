@@ -16,6 +16,8 @@ class BoardAnimator(threading.Thread):
         time_step_in_s: float,
         board_lock: threading.RLock,
         end_event: threading.Event,
+        use_framebuffer: bool = False,  # requires numpy
+        use_regions: bool = False,  # requires Renderer.render_regions()
     ):
         super().__init__()
         self.board = board
@@ -23,10 +25,26 @@ class BoardAnimator(threading.Thread):
         self.time_step_in_s = time_step_in_s
         self.board_lock = board_lock
         self.end_event = end_event
+        self.use_framebuffer = use_framebuffer
+
+        # full frames if the renderer can't redraw regions
+        self.use_regions = use_regions and (
+            type(renderer).render_regions is not Renderer.render_regions
+        )
+        if use_regions and not self.use_regions:
+            logger.warning("renderer can't render regions, rendering full frames")
 
     def update(self, delta_time: int):
         self.board.update(delta_time)
-        self.renderer.render_frame(self.board.pixels())
+        if self.use_regions:
+            # only send sections that have changed
+            regions = self.board.changed_regions()
+            if regions:
+                self.renderer.render_regions(regions)
+        elif self.use_framebuffer:
+            self.renderer.render_framebuffer(self.board.framebuffer())
+        else:
+            self.renderer.render_frame(self.board.pixels())
 
     def run(self):
         self.board.reset()
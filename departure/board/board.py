@@ -1,9 +1,20 @@
-from typing import Tuple, List
+from collections import OrderedDict
+from typing import Tuple, List, Set, Union
 
 import departure.board.movement as movement
+from departure.board.commons import BoardException
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, only required for framebuffer mode
+    np = None
 
 Pixel = Tuple[int, int, Tuple[int, int, int]]
 Pixels = List[Pixel]
+Region = Tuple[int, int, int, int]  # x, y, w, h in board coordinates
+
+# max number of frames cached per section for periodic movements
+FRAME_CACHE_SIZE = 256
 
 
 def repeated_offsets(
@@ -73,6 +84,174 @@ def visible_pixels_multiple_offsets(
     return output_pixels
 
 
+def wrap_offset(
+    x_offset: int, y_offset: int, content_w: int, content_h: int
+) -> Tuple[int, int, bool]:
+    offset_wrapped = False
+
+    # wrap to between -content_w+1 and 0 if x_offset leq than -content_w
+    if content_w <= 0:
+        wrapped_x_offset = 0
+    elif x_offset <= -content_w:
+        wrapped_x_offset = ((x_offset - 1) % content_w) - content_w + 1
+        offset_wrapped = True
+    else:
+        wrapped_x_offset = x_offset
+
+    # wrap to between -content_h+1 and 0 if y_offset leq than -content_h
+    if content_h <= 0:
+        wrapped_y_offset = 0
+    elif y_offset <= -content_h:
+        wrapped_y_offset = ((y_offset - 1) % content_h) - content_h + 1
+        offset_wrapped = True
+    else:
+        wrapped_y_offset = y_offset
+
+    return wrapped_x_offset, wrapped_y_offset, offset_wrapped
+
+
+def cycle_offsets(
+    x_offset: int,
+    y_offset: int,
+    offset_deltas: List[Tuple[int, int]],
+    repeating: bool,
+    content_w: int,
+    content_h: int,
+    max_offsets: int,
+) -> Union[Set[Tuple[int, int]], None]:
+    # distinct (wrapped) offsets visited by applying offset_deltas from
+    # (x_offset, y_offset), repeatedly if the movement is repeating, or None if
+    # there are more than max_offsets of them (e.g. long or non-periodic
+    # movement)
+    offsets = {(x_offset, y_offset)}
+    cycle_start_offsets = set()
+
+    while (x_offset, y_offset) not in cycle_start_offsets:
+        cycle_start_offsets.add((x_offset, y_offset))
+
+        for delta_x, delta_y in offset_deltas:
+            x_offset += delta_x
+            y_offset += delta_y
+            wrapped_x_offset, wrapped_y_offset, offset_wrapped = wrap_offset(
+                x_offset, y_offset, content_w, content_h
+            )
+            if offset_wrapped:
+                x_offset, y_offset = wrapped_x_offset, wrapped_y_offset
+
+            offsets.add((x_offset, y_offset))
+            if len(offsets) > max_offsets:
+                return None
+
+        if not (repeating and offset_deltas):
+            break
+
+    return offsets
+
+
+def check_numpy() -> None:
+    if np is None:
+        raise BoardException("framebuffer mode requires numpy")
+
+
+def rasterise_pixels(pixels: Pixels, content_w: int, content_h: int):
+    """Rasterises pixels into an (h, w, 3) uint8 array and an (h, w) mask of lit
+    pixels, covering both the virtual bounding box and any pixel outside of it.
+
+    Returns (array, mask, x_origin, y_origin), where (x_origin, y_origin) are the
+    content coordinates of the array's top-left pixel."""
+    check_numpy()
+
+    if len(pixels) == 0:
+        return (
+            np.zeros((0, 0, 3), dtype=np.uint8),
+            np.zeros((0, 0), dtype=bool),
+            0,
+            0,
+        )
+
+    raw_pixels = np.array([(x, y, *c) for x, y, c in pixels], dtype=np.int64)
+    xs, ys = raw_pixels[:, 0], raw_pixels[:, 1]
+
+    x_origin = min(0, int(xs.min()))
+    y_origin = min(0, int(ys.min()))
+    array_w = max(content_w, int(xs.max()) + 1) - x_origin
+    array_h = max(content_h, int(ys.max()) + 1) - y_origin
+
+    array = np.zeros((array_h, array_w, 3), dtype=np.uint8)
+    mask = np.zeros((array_h, array_w), dtype=bool)
+    array[ys - y_origin, xs - x_origin] = raw_pixels[:, 2:]
+    mask[ys - y_origin, xs - x_origin] = True
+
+    return array, mask, x_origin, y_origin
+
+
+def blit(dst, dst_mask, src, src_mask, x: int, y: int) -> None:
+    """Copies lit pixels of src onto dst with src's top-left at (x, y), clipping
+    to the bounds of dst."""
+    dst_h, dst_w = dst.shape[:2]
+    src_h, src_w = src.shape[:2]
+
+    # clipped destination area
+    x_start, x_end = max(x, 0), min(x + src_w, dst_w)
+    y_start, y_end = max(y, 0), min(y + src_h, dst_h)
+    if x_start >= x_end or y_start >= y_end:
+        return
+
+    src_area = (slice(y_start - y, y_end - y), slice(x_start - x, x_end - x))
+    dst_area = (slice(y_start, y_end), slice(x_start, x_end))
+
+    np.copyto(dst[dst_area], src[src_area], where=src_mask[src_area][..., None])
+    dst_mask[dst_area] |= src_mask[src_area]
+
+
+def visible_frame_multiple_offsets(
+    content_raster,
+    x_offsets: List[int],
+    y_offsets: List[int],
+    content_w: int,
+    content_h: int,
+    display_w: int,
+    display_h: int,
+):
+    """Array equivalent of visible_pixels_multiple_offsets(), returns an
+    (display_h, display_w, 3) frame and its (display_h, display_w) mask."""
+    array, mask, x_origin, y_origin = content_raster
+
+    frame = np.zeros((display_h, display_w, 3), dtype=np.uint8)
+    frame_mask = np.zeros((display_h, display_w), dtype=bool)
+
+    for x_offset in x_offsets:
+        for y_offset in y_offsets:
+            # ignore repetitions that wouldn't be visible
+            if (
+                (x_offset >= display_w)
+                or (x_offset + content_w + display_w < 0)
+                or (y_offset >= display_h)
+                or (y_offset + content_h + display_h < 0)
+            ):
+                continue
+
+            blit(
+                frame,
+                frame_mask,
+                array,
+                mask,
+                x_offset + x_origin,
+                y_offset + y_origin,
+            )
+
+    return frame, frame_mask
+
+
+def framebuffer_pixels(framebuffer) -> Pixels:
+    """Converts a framebuffer back to a list of lit (non-black) pixels."""
+    ys, xs = np.nonzero(framebuffer.any(axis=2))
+    colours = framebuffer[ys, xs].tolist()
+    return [
+        (x, y, tuple(colour)) for x, y, colour in zip(xs.tolist(), ys.tolist(), colours)
+    ]
+
+
 class BoardSectionContent:
     def __init__(
         self,
@@ -93,6 +272,16 @@ class BoardSectionContent:
         self.repeat_x = repeat_x
         self.repeat_y = repeat_y
 
+        # rasterised content (framebuffer mode), computed on first use
+        self._content_raster = None
+
+    def content_raster(self):
+        if self._content_raster is None:
+            self._content_raster = rasterise_pixels(
+                self.content_pixels, self.content_w, self.content_h
+            )
+        return self._content_raster
+
 
 class BoardSection:
     def __init__(
@@ -103,6 +292,7 @@ class BoardSection:
         output_h: int,
         content: BoardSectionContent,
         movement: movement.Movement = movement.NoMovement(),
+        frame_cache_size: int = FRAME_CACHE_SIZE,  # 0: no cache
     ):
         # area on the departure board where this section is displayed
         self.output_x = output_x
@@ -119,17 +309,40 @@ class BoardSection:
         # pixels in absolute coordinates
         self.section_pixels = None
 
+        # section pixels by offset for the current content, filled as offsets
+        # are visited if the offsets of the movement's period fit in the cache
+        self.frame_cache_size = frame_cache_size
+        self._frame_cache = OrderedDict()
+        self._frame_cache_checked = False
+        self._frame_cache_enabled = False
+
+        # frame and mask relative to section (framebuffer mode), and the
+        # content/offsets they were computed for
+        self.section_frame = None
+        self._section_frame_key = None
+
         self._has_changed = True
 
     def reset(self):
         self._movement.reset()
 
+    def region(self) -> Region:
+        return self.output_x, self.output_y, self.output_w, self.output_h
+
+    def has_changed(self) -> bool:
+        # content or offsets changed since pixels were last requested
+        return self._has_changed
+
     def update_content(self, content: BoardSectionContent) -> None:
         self._content = content
+        self._frame_cache.clear()
+        self._frame_cache_checked = False
         self._has_changed = True
 
     def update_movement(self, movement: movement.Movement) -> None:
         self._movement = movement
+        # frames only depend on content and offsets, but the period may differ
+        self._frame_cache_checked = False
         self._has_changed = True
 
     def update(self, delta_time: int) -> bool:
@@ -142,50 +355,74 @@ class BoardSection:
         return self._has_changed
 
     def _wrap_offset(self) -> None:
-        offset_wrapped = False
-
-        # wrap to between -content_w+1 and 0 if x_offset leq than -content_w
-        if self._content.content_w <= 0:
-            x_offset = 0
-        elif self._movement.x_offset <= -self._content.content_w:
-            x_offset = (
-                ((self._movement.x_offset - 1) % self._content.content_w)
-                - self._content.content_w
-                + 1
-            )
-            offset_wrapped = True
-        else:
-            x_offset = self._movement.x_offset
-
-        # wrap to between -self._content.content_h+1 and 0 if self._movement.y_offset leq than
-        # -self._content.content_h
-        if self._content.content_h <= 0:
-            y_offset = 0
-        elif self._movement.y_offset <= -self._content.content_h:
-            y_offset = (
-                ((self._movement.y_offset - 1) % self._content.content_h)
-                - self._content.content_h
-                + 1
-            )
-            offset_wrapped = True
-        else:
-            y_offset = self._movement.y_offset
+        x_offset, y_offset, offset_wrapped = wrap_offset(
+            self._movement.x_offset,
+            self._movement.y_offset,
+            self._content.content_w,
+            self._content.content_h,
+        )
 
         # update movement offset if it has wrapped
         if offset_wrapped:
             # don't mark as changed as displayed pixels are identical
             self._movement.set_offset(x_offset, y_offset)
 
+    def _check_frame_cache(self) -> None:
+        # cache frames only if the offsets of the movement's period (from the
+        # start of the period) fit in the cache, e.g. not for long or
+        # non-periodic movements
+        self._frame_cache_checked = True
+
+        if self.frame_cache_size <= 0:
+            self._frame_cache_enabled = False
+            return
+
+        offset_deltas, repeating = self._movement.offset_deltas()
+        offsets = cycle_offsets(
+            self._movement.x_offset_init,
+            self._movement.y_offset_init,
+            offset_deltas,
+            repeating,
+            self._content.content_w,
+            self._content.content_h,
+            self.frame_cache_size,
+        )
+        self._frame_cache_enabled = offsets is not None
+
+        if not self._frame_cache_enabled:
+            self._frame_cache.clear()
+
     def pixels(self) -> Pixels:
         # return current section pixels if neither content nor movement has
         # changed
-        if not self._has_changed:
+        if not self._has_changed and self.section_pixels is not None:
             return self.section_pixels
 
+        if not self._frame_cache_checked:
+            self._check_frame_cache()
+
+        offset = (self._movement.x_offset, self._movement.y_offset)
+
+        if offset in self._frame_cache:
+            self.section_pixels = self._frame_cache[offset]
+        else:
+            self.section_pixels = self._offset_pixels(*offset)
+
+            # bounded cache, e.g. offsets visited outside of the period
+            if self._frame_cache_enabled:
+                if len(self._frame_cache) >= self.frame_cache_size:
+                    self._frame_cache.popitem(last=False)
+                self._frame_cache[offset] = self.section_pixels
+
+        self._has_changed = False
+
+        return self.section_pixels
+
+    def _offset_pixels(self, x_offset: int, y_offset: int) -> Pixels:
         # get repeated offsets
         x_offsets, y_offsets = repeated_offsets(
-            self._movement.x_offset,
-            self._movement.y_offset,
+            x_offset,
+            y_offset,
             self._content.content_w,
             self._content.content_h,
             self.output_w,
@@ -206,13 +443,48 @@ class BoardSection:
         )
 
         # translate pixels to location of board section
-        self.section_pixels = []
-        for x, y, c in repeated_pixels:
-            self.section_pixels.append([x + self.output_x, y + self.output_y, c])
+        return [[x + self.output_x, y + self.output_y, c] for x, y, c in repeated_pixels]
 
+    def frame(self):
+        """Returns the (output_h, output_w, 3) frame of the section and its
+        (output_h, output_w) mask of lit pixels."""
+        frame_key = (self._content, self._movement.x_offset, self._movement.y_offset)
+
+        # changes are accounted for by the returned frame
         self._has_changed = False
 
-        return self.section_pixels
+        # return current frame if neither content nor offsets have changed
+        if frame_key == self._section_frame_key:
+            return self.section_frame
+
+        # section pixels are out of date
+        self.section_pixels = None
+
+        # get repeated offsets
+        x_offsets, y_offsets = repeated_offsets(
+            self._movement.x_offset,
+            self._movement.y_offset,
+            self._content.content_w,
+            self._content.content_h,
+            self.output_w,
+            self.output_h,
+            self._content.repeat_x,
+            self._content.repeat_y,
+        )
+
+        # composite repeated content
+        self.section_frame = visible_frame_multiple_offsets(
+            self._content.content_raster(),
+            x_offsets,
+            y_offsets,
+            self._content.content_w,
+            self._content.content_h,
+            self.output_w,
+            self.output_h,
+        )
+        self._section_frame_key = frame_key
+
+        return self.section_frame
 
 
 class Board:
@@ -223,6 +495,10 @@ class Board:
         self.display_pixels = None
         self._has_changed = True
 
+        # framebuffer mode
+        self.display_framebuffer = None
+        self._section_frames = None
+
     def reset(self):
         for section in self.sections:
             section.reset()
@@ -233,7 +509,7 @@ class Board:
         return self._has_changed
 
     def pixels(self) -> Pixels:
-        if not self._has_changed:
+        if not self._has_changed and self.display_pixels is not None:
             return self.display_pixels
 
         self.display_pixels = []
@@ -243,3 +519,62 @@ class Board:
         self._has_changed = False
 
         return self.display_pixels
+
+    def changed_regions(self) -> List[Tuple[Region, Pixels]]:
+        # areas of sections whose content or offsets have changed since their
+        # pixels were last requested, each with the section's current pixels
+        # (all lit pixels within the area, the area itself should be cleared
+        # before drawing them)
+        regions = []
+        for section in self.sections:
+            if section.has_changed():
+                regions.append((section.region(), section.pixels()))
+
+        # board pixels are out of date if any section changed
+        if regions:
+            self.display_pixels = None
+        self._has_changed = False
+
+        return regions
+
+    def framebuffer(self):
+        """Returns the board as a (board_h, board_w, 3) uint8 array (requires
+        numpy)."""
+        check_numpy()
+
+        section_frames = [section.frame() for section in self.sections]
+        self._has_changed = False
+
+        # return current framebuffer if no section frame has changed
+        if (
+            self._section_frames is not None
+            and len(section_frames) == len(self._section_frames)
+            and all(
+                section_frame is previous_section_frame
+                for section_frame, previous_section_frame in zip(
+                    section_frames, self._section_frames
+                )
+            )
+        ):
+            return self.display_framebuffer
+
+        self.display_framebuffer = np.zeros(
+            (self.board_h, self.board_w, 3), dtype=np.uint8
+        )
+        display_mask = np.zeros((self.board_h, self.board_w), dtype=bool)
+        for section, (frame, frame_mask) in zip(self.sections, section_frames):
+            blit(
+                self.display_framebuffer,
+                display_mask,
+                frame,
+                frame_mask,
+                section.output_x,
+                section.output_y,
+            )
+
+        self._section_frames = section_frames
+
+        # board pixels are out of date
+        self.display_pixels = None
+
+        return self.display_framebuffer
@@ -1,18 +1,74 @@
 import threading
 import os
 import logging
+from typing import Dict, List
 
 import grpc
 
 import departure.board.departure_pb2_grpc as departure_pb2_grpc
 
 from . import data_updater, view_model
+from .commons import BoardException
 
 logger = logging.getLogger(__name__)
 
+BOARD_SERVER_PORT = 50051
+DEFAULT_BOARD_ID = "default"
+MAX_BOARD_SESSIONS = int(os.environ.get("DEPARTURE_MAX_BOARD_SESSIONS", "16"))
+
+# gRPC channels, shared by all clients of the same board server
+_channels = {}
+_channels_lock = threading.Lock()
+
+
+def default_board_server() -> str:
+    # set departure board server
+    if "DEPARTURE_BOARD_SERVER" in os.environ:
+        departure_board_server = os.environ["DEPARTURE_BOARD_SERVER"]
+        server_info_str = "DEPARTURE_BOARD_SERVER env var set - "
+    else:
+        server_info_str = "DEPARTURE_BOARD_SERVER env var not set - "
+        departure_board_server = "127.0.0.1"
+    logger.info("%s using %s as server", server_info_str, departure_board_server)
+
+    return departure_board_server
+
+
+def board_server_target(board_server: str) -> str:
+    # host, or host:port (IPv6 address, or [IPv6 address]:port)
+    if board_server.startswith("["):
+        if "]:" in board_server:
+            return board_server
+        return f"{board_server}:{BOARD_SERVER_PORT}"
+
+    if board_server.count(":") > 1:
+        return f"[{board_server}]:{BOARD_SERVER_PORT}"
+
+    if ":" in board_server:
+        return board_server
+    return f"{board_server}:{BOARD_SERVER_PORT}"
+
+
+def shared_channel(target: str) -> grpc.Channel:
+    with _channels_lock:
+        if target not in _channels:
+            _channels[target] = grpc.insecure_channel(target)
+        return _channels[target]
+
 
 class BoardClient:  # pylint: disable=too-few-public-methods
-    def __init__(self):
+    def __init__(self, board_server: str = None):
+        # board server: host or host:port (default: DEPARTURE_BOARD_SERVER env var)
+        self.board_server = board_server
+        self.running = False
+        self._stop_event = threading.Event()
+        self._clear_board = True
+
+    def stop(self, clear_board: bool = True):
+        # effective even if run has not started yet; clear_board False leaves
+        # the board as is (e.g. when another client takes over the board)
+        self._clear_board = clear_board
+        self._stop_event.set()
         self.running = False
 
     def run(
@@ -24,17 +80,12 @@ class BoardClient:  # pylint: disable=too-few-public-methods
 
         end_event = threading.Event()
 
-        # set departure board server
-        if "DEPARTURE_BOARD_SERVER" in os.environ:
-            departure_board_server = os.environ["DEPARTURE_BOARD_SERVER"]
-            server_info_str = "DEPARTURE_BOARD_SERVER env var set - "
-        else:
-            server_info_str = "DEPARTURE_BOARD_SERVER env var not set - "
-            departure_board_server = "127.0.0.1"
-        logger.info("%s using %s as server", server_info_str, departure_board_server)
+        board_server = self.board_server
+        if board_server is None:
+            board_server = default_board_server()
 
         # open channel to board server
-        channel = grpc.insecure_channel(f"{departure_board_server}:50051")
+        channel = shared_channel(board_server_target(board_server))
 
         # set up client parameters
         board_manager_stub = departure_pb2_grpc.BoardManagerStub(channel)
@@ -52,12 +103,133 @@ class BoardClient:  # pylint: disable=too-few-public-methods
 
         self.running = True
 
-        # run until self.running is set to false
-        while self.running:
+        # run until self.running is set to false or stop is called
+        while self.running and not self._stop_event.is_set():
             end_event.wait(0.5)
 
         # clean and exit
         logger.info("stopping")
         end_event.set()
         data_updater_thread.join()
-        target_view_model.update(None)
+        if self._clear_board:
+            target_view_model.update(None)
+
+
+class BoardSession:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        board_id: str,
+        board_server: str,
+        board_client: BoardClient,
+        thread: threading.Thread,
+        description: dict,
+    ):
+        self.board_id = board_id
+        self.board_server = board_server
+        self.board_client = board_client
+        self.thread = thread
+        self.description = description
+
+    def status(self) -> dict:
+        return {
+            "board_id": self.board_id,
+            "board_server": self.board_server,
+            "running": self.thread.is_alive(),
+            **self.description,
+        }
+
+
+class BoardSessionManager:
+    """Runs one board client per board, each with its own target board server
+    and updater thread, keyed by board ID.
+
+    Starting a session for a board replaces the board's current session, and
+    the number of sessions is capped to max_sessions."""
+
+    def __init__(self, max_sessions: int = MAX_BOARD_SESSIONS):
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, BoardSession] = {}
+        self._lock = threading.RLock()
+
+    def start(
+        self,
+        board_id: str,
+        view_model_class: view_model.ViewModel,
+        data_updater_class: data_updater.DataUpdater,
+        data_updater_extra_arguments: dict,
+        board_server: str = None,
+        stop_timeout_in_s: float = 1,
+    ) -> BoardSession:
+        with self._lock:
+            # the new session drives the board: don't let the current session
+            # clear it when it ends, possibly after the new session started
+            self.stop(board_id, stop_timeout_in_s, clear_board=False)
+
+            # forget sessions that ended by themselves
+            for ended_board_id in [
+                session.board_id
+                for session in self._sessions.values()
+                if not session.thread.is_alive()
+            ]:
+                del self._sessions[ended_board_id]
+
+            if len(self._sessions) >= self.max_sessions:
+                raise BoardException(
+                    f"too many board sessions (maximum: {self.max_sessions})"
+                )
+
+            if board_server is None:
+                board_server = default_board_server()
+
+            board_client = BoardClient(board_server)
+            thread = threading.Thread(
+                target=board_client.run,
+                args=[
+                    view_model_class,
+                    data_updater_class,
+                    data_updater_extra_arguments,
+                ],
+                name=f"board-{board_id}",
+            )
+            session = BoardSession(
+                board_id,
+                board_server,
+                board_client,
+                thread,
+                {
+                    "view_model": view_model_class.__name__,
+                    "parameters": data_updater_extra_arguments,
+                },
+            )
+            self._sessions[board_id] = session
+            thread.start()
+
+            return session
+
+    def stop(
+        self, board_id: str, timeout_in_s: float = 1, clear_board: bool = True
+    ) -> bool:
+        # returns False if there was no session for board
+        with self._lock:
+            session = self._sessions.pop(board_id, None)
+        if session is None:
+            return False
+
+        session.board_client.stop(clear_board)
+        session.thread.join(timeout_in_s)
+        return True
+
+    def stop_all(self, timeout_in_s: float = 1):
+        with self._lock:
+            board_ids = list(self._sessions)
+        for board_id in board_ids:
+            self.stop(board_id, timeout_in_s)
+
+    def is_running(self, board_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.get(board_id)
+        return session is not None and session.thread.is_alive()
+
+    def sessions(self) -> List[dict]:
+        with self._lock:
+            return [session.status() for session in self._sessions.values()]
@@ -0,0 +1,201 @@
+"""
+Compact binary font format, compiled from BDF fonts and memory-mapped
+
+File layout (little-endian):
+- header: magic, version, source BDF size and mtime (to detect stale files),
+  FONT_ASCENT, FONT_DESCENT, number of glyphs
+- glyph index, sorted by code point: code point, advance, bounding box, offset of
+  bitmap in data area
+- data area: glyph bitmaps, one big-endian row of ceil(bbW / 8) bytes per line
+"""
+
+import logging
+import mmap
+import os
+import pathlib
+import struct
+from typing import NamedTuple, List
+
+from bdflib import reader
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DPFT"
+VERSION = 1
+COMPILED_FONT_SUFFIX = ".dfont"
+
+HEADER = struct.Struct("<4sHQQhhI")
+GLYPH = struct.Struct("<IhhhHHI")
+
+
+class CompiledFontException(Exception):
+    pass
+
+
+class CompiledGlyph(NamedTuple):
+    # same attributes as bdflib glyphs (as used by BoardText)
+    codepoint: int
+    advance: int
+    bbX: int
+    bbY: int
+    bbW: int
+    bbH: int
+    data: List[int]
+
+
+def _row_size(bb_w: int) -> int:
+    return (bb_w + 7) // 8
+
+
+def _source_signature(bdf_path: pathlib.Path):
+    stat = bdf_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def compile_bdf_font(bdf_path: pathlib.Path) -> bytes:
+    with bdf_path.open("rb") as bdf_file:
+        font = reader.read_bdf(bdf_file)
+
+    glyph_index = b""
+    glyph_data = b""
+    # ignore unencoded glyphs
+    glyphs = [
+        glyph
+        for code_point, glyph in sorted(font.glyphs_by_codepoint.items())
+        if code_point >= 0
+    ]
+
+    for glyph in glyphs:
+        glyph_index += GLYPH.pack(
+            glyph.codepoint,
+            glyph.advance,
+            glyph.bbX,
+            glyph.bbY,
+            glyph.bbW,
+            glyph.bbH,
+            len(glyph_data),
+        )
+        row_size = _row_size(glyph.bbW)
+        glyph_data += b"".join(row.to_bytes(row_size, "big") for row in glyph.data)
+
+    source_size, source_mtime = _source_signature(bdf_path)
+
+    return (
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            source_size,
+            source_mtime,
+            font[b"FONT_ASCENT"],
+            font[b"FONT_DESCENT"],
+            len(glyphs),
+        )
+        + glyph_index
+        + glyph_data
+    )
+
+
+class CompiledFont:
+    """Read-only font backed by a compiled font buffer (typically memory-mapped),
+    supporting the subset of the bdflib Font interface used by BoardText, i.e.
+    font[code_point] and font[b"FONT_ASCENT"/b"FONT_DESCENT"]."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+        (
+            magic,
+            version,
+            self.source_size,
+            self.source_mtime,
+            self.ascent,
+            self.descent,
+            glyph_count,
+        ) = HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+            raise CompiledFontException("invalid compiled font")
+
+        # code point -> position of glyph in index
+        self._index = {}
+        for i in range(glyph_count):
+            code_point = struct.unpack_from(
+                "<I", buffer, HEADER.size + i * GLYPH.size
+            )[0]
+            self._index[code_point] = i
+
+        self._data_offset = HEADER.size + glyph_count * GLYPH.size
+        self._glyphs = {}
+
+    def __getitem__(self, key):
+        if key == b"FONT_ASCENT":
+            return self.ascent
+        if key == b"FONT_DESCENT":
+            return self.descent
+
+        # decode glyphs on first access only
+        if key not in self._glyphs:
+            self._glyphs[key] = self._glyph(self._index[key])
+
+        return self._glyphs[key]
+
+    def __contains__(self, code_point):
+        return code_point in self._index
+
+    def _glyph(self, i):
+        code_point, advance, bb_x, bb_y, bb_w, bb_h, data_offset = GLYPH.unpack_from(
+            self._buffer, HEADER.size + i * GLYPH.size
+        )
+
+        row_size = _row_size(bb_w)
+        row_offset = self._data_offset + data_offset
+        data = [
+            int.from_bytes(
+                self._buffer[
+                    row_offset + row * row_size : row_offset + (row + 1) * row_size
+                ],
+                "big",
+            )
+            for row in range(bb_h)
+        ]
+
+        return CompiledGlyph(code_point, advance, bb_x, bb_y, bb_w, bb_h, data)
+
+    def is_stale(self, bdf_path: pathlib.Path) -> bool:
+        return (self.source_size, self.source_mtime) != _source_signature(bdf_path)
+
+
+def load_compiled_font(bdf_path: pathlib.Path) -> CompiledFont:
+    """Loads the compiled version of a BDF font, (re)compiling it next to the BDF
+    font if missing or stale."""
+    compiled_font_path = bdf_path.with_suffix(COMPILED_FONT_SUFFIX)
+
+    # memory-map compiled font if up to date
+    if compiled_font_path.exists():
+        try:
+            with compiled_font_path.open("rb") as compiled_font_file:
+                buffer = mmap.mmap(
+                    compiled_font_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            font = CompiledFont(buffer)
+            if not font.is_stale(bdf_path):
+                return font
+        except (OSError, ValueError, struct.error, CompiledFontException) as e:
+            logger.warning("ignoring compiled font %s: %s", compiled_font_path, e)
+
+    # otherwise compile it...
+    compiled_font = compile_bdf_font(bdf_path)
+
+    # ... and save it for next time if possible (atomically, as other processes
+    # may have the previous version memory-mapped)
+    temp_compiled_font_path = compiled_font_path.with_name(
+        f"{compiled_font_path.name}.{os.getpid()}.tmp"
+    )
+    try:
+        with temp_compiled_font_path.open("wb") as compiled_font_file:
+            compiled_font_file.write(compiled_font)
+        os.replace(temp_compiled_font_path, compiled_font_path)
+    except OSError as e:
+        logger.warning("could not save compiled font %s: %s", compiled_font_path, e)
+
+    return CompiledFont(compiled_font)
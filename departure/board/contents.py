@@ -1,7 +1,21 @@
 import pathlib
+import threading
+import weakref
+from collections import OrderedDict
 
 from bdflib import reader
 
+from . import compiled_font
+
+# glyph atlases (code point -> (pixel coordinates, advance)), shared by all
+# BoardText instances using the same font
+_glyph_atlases = weakref.WeakKeyDictionary()
+
+
+# fonts loaded by load_font(), shared process-wide
+_fonts = {}
+_fonts_lock = threading.Lock()
+
 
 def read_bdf_font(font_filename):
     font_path = pathlib.Path(__file__).parents[0] / font_filename
@@ -9,15 +23,81 @@ def read_bdf_font(font_filename):
         return reader.read_bdf(f)
 
 
+def load_font(font_filename):
+    # compiled version of BDF font, loaded once per process
+    with _fonts_lock:
+        if font_filename not in _fonts:
+            _fonts[font_filename] = compiled_font.load_compiled_font(
+                pathlib.Path(__file__).parents[0] / font_filename
+            )
+        return _fonts[font_filename]
+
+
 class BoardTextException(Exception):
     pass
 
 
+class TextRunCache:
+    """Bounded LRU cache of rendered text runs, i.e. (pixels, size) tuples."""
+
+    def __init__(self, max_size: int = 1024):  # 0: no caching
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, render):
+        # return cached run if any, otherwise render and cache it
+        with self._lock:
+            if key in self._runs:
+                self._runs.move_to_end(key)
+                self.hits += 1
+                return self._runs[key]
+            self.misses += 1
+
+        run = render()
+
+        with self._lock:
+            if self.max_size > 0:
+                self._runs[key] = run
+                while len(self._runs) > self.max_size:
+                    self._runs.popitem(last=False)
+
+        return run
+
+    def clear(self):
+        with self._lock:
+            self._runs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._runs),
+                "max_size": self.max_size,
+            }
+
+
+# default cache, shared by all BoardText instances
+TEXT_RUN_CACHE = TextRunCache()
+
+
 class BoardText:
-    def __init__(self, font, colour_map=None, tabs=None):
+    def __init__(self, font, colour_map=None, tabs=None, text_run_cache=None):
         self.font = font
         self.colour_map = colour_map
         self.tabs = tabs
+        self._glyph_atlas = None
+
+        # rendered runs are keyed on font, actual colours and tabs, so the cache
+        # can be shared between instances
+        if text_run_cache is None:
+            text_run_cache = TEXT_RUN_CACHE
+        self.text_run_cache = text_run_cache
 
     def _glyph_pixels(self, glyph, x_offset, y_offset, colour=(255, 255, 255)):
         # pixel coordinate system (x,y) = (0,0) => top left
@@ -31,26 +111,63 @@ class BoardText:
             if glyph.data[y] & (1 << (glyph.bbW - x - 1))
         ]
 
+    def _atlas_glyph(self, code_point):
+        # rasterise glyph on first use, relative to x == 0 and first line
+        if self._glyph_atlas is None:
+            self._glyph_atlas = _glyph_atlases.setdefault(self.font, {})
+
+        if code_point not in self._glyph_atlas:
+            glyph = self.font[code_point]
+            self._glyph_atlas[code_point] = (
+                [
+                    (x, y)
+                    for x, y, _ in self._glyph_pixels(
+                        glyph, 0, self.font[b"FONT_ASCENT"] - 1
+                    )
+                ],
+                glyph.advance,
+            )
+
+        return self._glyph_atlas[code_point]
+
     def monochrome_text_pixels(
         self, text, colour=(255, 255, 255), max_width=0  # 0 == no max width
     ):
         pixels = []
         advance = 0
         for c in text:
-            glyph = self.font[ord(c)]
-            pixels += self._glyph_pixels(
-                glyph, advance, self.font[b"FONT_ASCENT"] - 1, colour
-            )
-            advance += glyph.advance
+            glyph_coordinates, glyph_advance = self._atlas_glyph(ord(c))
+            pixels += [(advance + x, y, colour) for x, y in glyph_coordinates]
+            advance += glyph_advance
             if max_width > 0 and advance > max_width:
                 break
 
         return pixels, (advance, self.font[b"FONT_ASCENT"] + self.font[b"FONT_DESCENT"])
 
+    def _text_parts_key(self, text_parts):
+        # text parts with resolved colours and default max width
+        return tuple(
+            (
+                text_part[0],
+                self.colour_map[text_part[1]],
+                text_part[2] if len(text_part) == 3 else 0,
+            )
+            for text_part in text_parts
+        )
+
+    def _tabs_key(self):
+        return tuple(tuple(tab) for tab in self.tabs)
+
     def colour_text_pixels(self, text_array):
         if self.colour_map is None:
             raise BoardTextException("missing colour map")
 
+        return self.text_run_cache.get(
+            ("colour_text", self.font, self._text_parts_key(text_array)),
+            lambda: self._colour_text_pixels(text_array),
+        )
+
+    def _colour_text_pixels(self, text_array):
         x_size, y_size = 0, 0
         output_pixels = []
 
@@ -72,6 +189,17 @@ class BoardText:
         if self.tabs is None:
             raise BoardTextException("missing tabs")
 
+        return self.text_run_cache.get(
+            (
+                "colour_text_tabbed_row",
+                self.font,
+                self._tabs_key(),
+                self._text_parts_key(text_row),
+            ),
+            lambda: self._colour_text_tabbed_row_pixels(text_row),
+        )
+
+    def _colour_text_tabbed_row_pixels(self, text_row):
         output_pixels = []
         x_size = 0
         for i, text_part in enumerate(text_row):
@@ -102,6 +230,21 @@ class BoardText:
         return output_pixels, (x_size, y_size)
 
     def colour_text_tabbed_rows_pixels(self, text_rows, row_height):
+        if self.tabs is None:
+            raise BoardTextException("missing tabs")
+
+        return self.text_run_cache.get(
+            (
+                "colour_text_tabbed_rows",
+                self.font,
+                self._tabs_key(),
+                tuple(self._text_parts_key(text_row) for text_row in text_rows),
+                row_height,
+            ),
+            lambda: self._colour_text_tabbed_rows_pixels(text_rows, row_height),
+        )
+
+    def _colour_text_tabbed_rows_pixels(self, text_rows, row_height):
         pixels = []
         x_size = 0
         i = 0
@@ -18,6 +18,7 @@ class DataUpdater(threading.Thread):
         self.view_model = target_view_model
         self.data_refresh_delay_in_s = data_refresh_delay_in_s
         self.end_event = end_event
+        self.tick_interval_in_s = None  # if set, tick between updates
 
     def run(self):
         while not self.end_event.is_set():
@@ -27,11 +28,29 @@ class DataUpdater(threading.Thread):
             self.update()
 
             if next_loop_start_time > time.monotonic():
-                self.end_event.wait(next_loop_start_time - time.monotonic())
+                self.wait_until(next_loop_start_time)
             else:
                 logger.warning("exceeded data update refresh delay")
 
         logger.info("data updater stopped running")
 
+    def wait_until(self, end_time: float):
+        # wait until end_time (or end event), ticking every tick_interval_in_s
+        while True:
+            remaining_time = end_time - time.monotonic()
+            if (
+                self.tick_interval_in_s is None
+                or remaining_time <= self.tick_interval_in_s
+            ):
+                self.end_event.wait(max(remaining_time, 0))
+                return
+
+            if self.end_event.wait(self.tick_interval_in_s):
+                return
+            self.tick()
+
     def update(self):
         raise NotImplementedError()
+
+    def tick(self):
+        pass  # e.g. to refresh interpolated data between updates
@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     serialized_pb=_b(
-        '\n\x1f\x64\x65parture/board/departure.proto\x12\x0f\x64\x65parture.proto">\n\x05Pixel\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01r\x18\x03 \x01(\x05\x12\t\n\x01g\x18\x04 \x01(\x05\x12\t\n\x01\x62\x18\x05 \x01(\x05"\x87\x01\n\x13\x42oardSectionContent\x12&\n\x06pixels\x18\x01 \x03(\x0b\x32\x16.departure.proto.Pixel\x12\x11\n\tcontent_w\x18\x02 \x01(\x05\x12\x11\n\tcontent_h\x18\x03 \x01(\x05\x12\x10\n\x08repeat_x\x18\x04 \x01(\x08\x12\x10\n\x08repeat_y\x18\x05 \x01(\x08":\n\nNoMovement\x12\x15\n\rx_offset_init\x18\x01 \x01(\x05\x12\x15\n\ry_offset_init\x18\x02 \x01(\x05"U\n\rStaticContent\x12\x16\n\x0etotal_duration\x18\x01 \x01(\x05\x12\x15\n\rx_offset_init\x18\x02 \x01(\x05\x12\x15\n\ry_offset_init\x18\x03 \x01(\x05"\xa0\x01\n\x10ScrollingContent\x12\x15\n\rstep_duration\x18\x01 \x01(\x05\x12\x13\n\x0btotal_steps\x18\x02 \x01(\x05\x12\x18\n\x10\x64\x65lta_x_per_step\x18\x03 \x01(\x05\x12\x18\n\x10\x64\x65lta_y_per_step\x18\x04 \x01(\x05\x12\x15\n\rx_offset_init\x18\x05 \x01(\x05\x12\x15\n\ry_offset_init\x18\x06 \x01(\x05"\xc4\x01\n\x08Movement\x12\x32\n\x0bno_movement\x18\x01 \x01(\x0b\x32\x1b.departure.proto.NoMovementH\x00\x12\x38\n\x0estatic_content\x18\x02 \x01(\x0b\x32\x1e.departure.proto.StaticContentH\x00\x12>\n\x11scrolling_content\x18\x03 \x01(\x0b\x32!.departure.proto.ScrollingContentH\x00\x42\n\n\x08movement"\xcd\x01\n\x1b\x42oardSectionOperationStatus\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12O\n\x06status\x18\x02 \x01(\x0e\x32?.departure.proto.BoardSectionOperationStatus.BoardSectionStatus"F\n\x12\x42oardSectionStatus\x12\x06\n\x02OK\x10\x00\x12\x14\n\x10SECTION_NOEXISTS\x10\x01\x12\x12\n\x0eSECTION_EXISTS\x10\x02"\xb1\x01\n\x19\x42oardSectionUpdateRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12\x35\n\x07\x63ontent\x18\x02 \x01(\x0b\x32$.departure.proto.BoardSectionContent\x12+\n\x08movement\x18\x03 \x03(\x0b\x32\x19.departure.proto.Movement\x12\x19\n\x11\x63ontinue_movement\x18\x04 \x01(\x08"Z\n\x1a\x42oardSectionsUpdateRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionUpdateRequest"[\n\x1b\x42oardSectionsUpdateResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus"z\n\x19\x42oardSectionCreateRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12\x10\n\x08output_x\x18\x02 \x01(\x05\x12\x10\n\x08output_y\x18\x03 \x01(\x05\x12\x10\n\x08output_w\x18\x04 \x01(\x05\x12\x10\n\x08output_h\x18\x05 \x01(\x05"Z\n\x1a\x42oardSectionsCreateRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionCreateRequest"[\n\x1b\x42oardSectionsCreateResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus"2\n\x19\x42oardSectionDeleteRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05"Z\n\x1a\x42oardSectionsDeleteRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionDeleteRequest"[\n\x1b\x42oardSectionsDeleteResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus2\x80\x01\n\x0c\x42oardManager\x12p\n\x13\x42oardSectionsUpdate\x12+.departure.proto.BoardSectionsUpdateRequest\x1a,.departure.proto.BoardSectionsUpdateResponseb\x06proto3'
+        '\n\x1f\x64\x65parture/board/departure.proto\x12\x0f\x64\x65parture.proto">\n\x05Pixel\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01r\x18\x03 \x01(\x05\x12\t\n\x01g\x18\x04 \x01(\x05\x12\t\n\x01\x62\x18\x05 \x01(\x05"q\n\x0cPackedPixels\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01w\x18\x03 \x01(\x05\x12\t\n\x01h\x18\x04 \x01(\x05\x12\x0f\n\x07palette\x18\x05 \x03(\r\x12\x16\n\x0e\x62its_per_pixel\x18\x06 \x01(\x05\x12\x0c\n\x04\x64\x61ta\x18\x07 \x01(\x0c"\xbd\x01\n\x13\x42oardSectionContent\x12&\n\x06pixels\x18\x01 \x03(\x0b\x32\x16.departure.proto.Pixel\x12\x11\n\tcontent_w\x18\x02 \x01(\x05\x12\x11\n\tcontent_h\x18\x03 \x01(\x05\x12\x10\n\x08repeat_x\x18\x04 \x01(\x08\x12\x10\n\x08repeat_y\x18\x05 \x01(\x08\x12\x34\n\rpacked_pixels\x18\x06 \x01(\x0b\x32\x1d.departure.proto.PackedPixels":\n\nNoMovement\x12\x15\n\rx_offset_init\x18\x01 \x01(\x05\x12\x15\n\ry_offset_init\x18\x02 \x01(\x05"U\n\rStaticContent\x12\x16\n\x0etotal_duration\x18\x01 \x01(\x05\x12\x15\n\rx_offset_init\x18\x02 \x01(\x05\x12\x15\n\ry_offset_init\x18\x03 \x01(\x05"\xa0\x01\n\x10ScrollingContent\x12\x15\n\rstep_duration\x18\x01 \x01(\x05\x12\x13\n\x0btotal_steps\x18\x02 \x01(\x05\x12\x18\n\x10\x64\x65lta_x_per_step\x18\x03 \x01(\x05\x12\x18\n\x10\x64\x65lta_y_per_step\x18\x04 \x01(\x05\x12\x15\n\rx_offset_init\x18\x05 \x01(\x05\x12\x15\n\ry_offset_init\x18\x06 \x01(\x05"\xc4\x01\n\x08Movement\x12\x32\n\x0bno_movement\x18\x01 \x01(\x0b\x32\x1b.departure.proto.NoMovementH\x00\x12\x38\n\x0estatic_content\x18\x02 \x01(\x0b\x32\x1e.departure.proto.StaticContentH\x00\x12>\n\x11scrolling_content\x18\x03 \x01(\x0b\x32!.departure.proto.ScrollingContentH\x00\x42\n\n\x08movement"\xcd\x01\n\x1b\x42oardSectionOperationStatus\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12O\n\x06status\x18\x02 \x01(\x0e\x32?.departure.proto.BoardSectionOperationStatus.BoardSectionStatus"F\n\x12\x42oardSectionStatus\x12\x06\n\x02OK\x10\x00\x12\x14\n\x10SECTION_NOEXISTS\x10\x01\x12\x12\n\x0eSECTION_EXISTS\x10\x02"\xb1\x01\n\x19\x42oardSectionUpdateRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12\x35\n\x07\x63ontent\x18\x02 \x01(\x0b\x32$.departure.proto.BoardSectionContent\x12+\n\x08movement\x18\x03 \x03(\x0b\x32\x19.departure.proto.Movement\x12\x19\n\x11\x63ontinue_movement\x18\x04 \x01(\x08"Z\n\x1a\x42oardSectionsUpdateRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionUpdateRequest"[\n\x1b\x42oardSectionsUpdateResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus"z\n\x19\x42oardSectionCreateRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05\x12\x10\n\x08output_x\x18\x02 \x01(\x05\x12\x10\n\x08output_y\x18\x03 \x01(\x05\x12\x10\n\x08output_w\x18\x04 \x01(\x05\x12\x10\n\x08output_h\x18\x05 \x01(\x05"Z\n\x1a\x42oardSectionsCreateRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionCreateRequest"[\n\x1b\x42oardSectionsCreateResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus"2\n\x19\x42oardSectionDeleteRequest\x12\x15\n\rsection_index\x18\x01 \x01(\x05"Z\n\x1a\x42oardSectionsDeleteRequest\x12<\n\x08requests\x18\x01 \x03(\x0b\x32*.departure.proto.BoardSectionDeleteRequest"[\n\x1b\x42oardSectionsDeleteResponse\x12<\n\x06status\x18\x01 \x03(\x0b\x32,.departure.proto.BoardSectionOperationStatus2\x80\x01\n\x0c\x42oardManager\x12p\n\x13\x42oardSectionsUpdate\x12+.departure.proto.BoardSectionsUpdateRequest\x1a,.departure.proto.BoardSectionsUpdateResponseb\x06proto3'
     ),
 )
 
@@ -47,8 +47,8 @@ _BOARDSECTIONOPERATIONSTATUS_BOARDSECTIONSTATUS = _descriptor.EnumDescriptor(
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=899,
-    serialized_end=969,
+    serialized_start=1068,
+    serialized_end=1138,
 )
 _sym_db.RegisterEnumDescriptor(_BOARDSECTIONOPERATIONSTATUS_BOARDSECTIONSTATUS)
 
@@ -164,6 +164,153 @@ _PIXEL = _descriptor.Descriptor(
 )
 
 
+_PACKEDPIXELS = _descriptor.Descriptor(
+    name="PackedPixels",
+    full_name="departure.proto.PackedPixels",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="x",
+            full_name="departure.proto.PackedPixels.x",
+            index=0,
+            number=1,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="y",
+            full_name="departure.proto.PackedPixels.y",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="w",
+            full_name="departure.proto.PackedPixels.w",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="h",
+            full_name="departure.proto.PackedPixels.h",
+            index=3,
+            number=4,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="palette",
+            full_name="departure.proto.PackedPixels.palette",
+            index=4,
+            number=5,
+            type=13,
+            cpp_type=3,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bits_per_pixel",
+            full_name="departure.proto.PackedPixels.bits_per_pixel",
+            index=5,
+            number=6,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="data",
+            full_name="departure.proto.PackedPixels.data",
+            index=6,
+            number=7,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b(""),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=116,
+    serialized_end=229,
+)
+
+
 _BOARDSECTIONCONTENT = _descriptor.Descriptor(
     name="BoardSectionContent",
     full_name="departure.proto.BoardSectionContent",
@@ -261,6 +408,24 @@ _BOARDSECTIONCONTENT = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="packed_pixels",
+            full_name="departure.proto.BoardSectionContent.packed_pixels",
+            index=5,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -270,8 +435,8 @@ _BOARDSECTIONCONTENT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=117,
-    serialized_end=252,
+    serialized_start=232,
+    serialized_end=421,
 )
 
 
@@ -327,8 +492,8 @@ _NOMOVEMENT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=254,
-    serialized_end=312,
+    serialized_start=423,
+    serialized_end=481,
 )
 
 
@@ -402,8 +567,8 @@ _STATICCONTENT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=314,
-    serialized_end=399,
+    serialized_start=483,
+    serialized_end=568,
 )
 
 
@@ -531,8 +696,8 @@ _SCROLLINGCONTENT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=402,
-    serialized_end=562,
+    serialized_start=571,
+    serialized_end=731,
 )
 
 
@@ -614,8 +779,8 @@ _MOVEMENT = _descriptor.Descriptor(
             fields=[],
         ),
     ],
-    serialized_start=565,
-    serialized_end=761,
+    serialized_start=734,
+    serialized_end=930,
 )
 
 
@@ -673,8 +838,8 @@ _BOARDSECTIONOPERATIONSTATUS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=764,
-    serialized_end=969,
+    serialized_start=933,
+    serialized_end=1138,
 )
 
 
@@ -766,8 +931,8 @@ _BOARDSECTIONUPDATEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=972,
-    serialized_end=1149,
+    serialized_start=1141,
+    serialized_end=1318,
 )
 
 
@@ -805,8 +970,8 @@ _BOARDSECTIONSUPDATEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1151,
-    serialized_end=1241,
+    serialized_start=1320,
+    serialized_end=1410,
 )
 
 
@@ -844,8 +1009,8 @@ _BOARDSECTIONSUPDATERESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1243,
-    serialized_end=1334,
+    serialized_start=1412,
+    serialized_end=1503,
 )
 
 
@@ -955,8 +1120,8 @@ _BOARDSECTIONCREATEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1336,
-    serialized_end=1458,
+    serialized_start=1505,
+    serialized_end=1627,
 )
 
 
@@ -994,8 +1159,8 @@ _BOARDSECTIONSCREATEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1460,
-    serialized_end=1550,
+    serialized_start=1629,
+    serialized_end=1719,
 )
 
 
@@ -1033,8 +1198,8 @@ _BOARDSECTIONSCREATERESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1552,
-    serialized_end=1643,
+    serialized_start=1721,
+    serialized_end=1812,
 )
 
 
@@ -1072,8 +1237,8 @@ _BOARDSECTIONDELETEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1645,
-    serialized_end=1695,
+    serialized_start=1814,
+    serialized_end=1864,
 )
 
 
@@ -1111,8 +1276,8 @@ _BOARDSECTIONSDELETEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1697,
-    serialized_end=1787,
+    serialized_start=1866,
+    serialized_end=1956,
 )
 
 
@@ -1150,11 +1315,12 @@ _BOARDSECTIONSDELETERESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1789,
-    serialized_end=1880,
+    serialized_start=1958,
+    serialized_end=2049,
 )
 
 _BOARDSECTIONCONTENT.fields_by_name["pixels"].message_type = _PIXEL
+_BOARDSECTIONCONTENT.fields_by_name["packed_pixels"].message_type = _PACKEDPIXELS
 _MOVEMENT.fields_by_name["no_movement"].message_type = _NOMOVEMENT
 _MOVEMENT.fields_by_name["static_content"].message_type = _STATICCONTENT
 _MOVEMENT.fields_by_name["scrolling_content"].message_type = _SCROLLINGCONTENT
@@ -1203,6 +1369,7 @@ _BOARDSECTIONSDELETERESPONSE.fields_by_name[
     "status"
 ].message_type = _BOARDSECTIONOPERATIONSTATUS
 DESCRIPTOR.message_types_by_name["Pixel"] = _PIXEL
+DESCRIPTOR.message_types_by_name["PackedPixels"] = _PACKEDPIXELS
 DESCRIPTOR.message_types_by_name["BoardSectionContent"] = _BOARDSECTIONCONTENT
 DESCRIPTOR.message_types_by_name["NoMovement"] = _NOMOVEMENT
 DESCRIPTOR.message_types_by_name["StaticContent"] = _STATICCONTENT
@@ -1251,6 +1418,17 @@ Pixel = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(Pixel)
 
+PackedPixels = _reflection.GeneratedProtocolMessageType(
+    "PackedPixels",
+    (_message.Message,),
+    dict(
+        DESCRIPTOR=_PACKEDPIXELS,
+        __module__="departure.board.departure_pb2"
+        # @@protoc_insertion_point(class_scope:departure.proto.PackedPixels)
+    ),
+)
+_sym_db.RegisterMessage(PackedPixels)
+
 BoardSectionContent = _reflection.GeneratedProtocolMessageType(
     "BoardSectionContent",
     (_message.Message,),
@@ -1423,8 +1601,8 @@ _BOARDMANAGER = _descriptor.ServiceDescriptor(
     file=DESCRIPTOR,
     index=0,
     serialized_options=None,
-    serialized_start=1883,
-    serialized_end=2011,
+    serialized_start=2052,
+    serialized_end=2180,
     methods=[
         _descriptor.MethodDescriptor(
             name="BoardSectionsUpdate",
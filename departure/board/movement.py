@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 
 class MovementException(Exception):
@@ -31,6 +31,16 @@ class Movement:
         self.x_offset = x_offset
         self.y_offset = y_offset
 
+    def offset_deltas(self) -> Tuple[List[Tuple[int, int]], bool]:
+        # successive offset changes over one period of the movement, and
+        # whether the movement repeats them indefinitely
+        return [], False
+
+    def offset_at(self, elapsed_time: int) -> Tuple[int, int]:
+        # offset elapsed_time ms after reset(), computed without updating the
+        # movement (offsets are not wrapped)
+        return self.x_offset_init, self.y_offset_init
+
 
 class NoMovement(Movement):
     pass
@@ -152,10 +162,30 @@ class ScrollingContent(MovementSegment):
 
         return delta_step_num > 0
 
+    def offset_at(self, elapsed_time):
+        # first scroll at t==0, then one scroll per step (up to last step if
+        # bounded)
+        step_num = elapsed_time // self.step_duration
+        if self.total_steps != 0:
+            step_num = min(step_num, self.total_steps - 1)
+
+        return (
+            self.x_offset_init + (step_num + 1) * self.delta_x_per_step,
+            self.y_offset_init + (step_num + 1) * self.delta_y_per_step,
+        )
+
+    def offset_deltas(self):
+        # perpetual scroll: one step, repeated
+        if self.total_steps == 0:
+            return [(self.delta_x_per_step, self.delta_y_per_step)], True
+
+        return [(self.delta_x_per_step, self.delta_y_per_step)] * self.total_steps, False
+
 
 class MovementCycle(Movement):
     def __init__(self, anim_sequence: List[MovementSegment]):
-        super().__init__()
+        # initial offset of the cycle is that of its first segment
+        super().__init__(anim_sequence[0].x_offset_init, anim_sequence[0].y_offset_init)
         self.anim_sequence = anim_sequence
         self.cur_segment = None
         self._started = False
@@ -171,9 +201,61 @@ class MovementCycle(Movement):
 
         self._started = True
 
+    def cycle_duration(self) -> int:
+        # 0: cycle never completes (a segment lasts forever)
+        if any(segment.total_duration == 0 for segment in self.anim_sequence):
+            return 0
+        return sum(segment.total_duration for segment in self.anim_sequence)
+
+    def cycle_displacement(self) -> Tuple[int, int]:
+        # net offset change over a full cycle
+        delta_x, delta_y = 0, 0
+        for segment_delta_x, segment_delta_y in self.offset_deltas()[0]:
+            delta_x += segment_delta_x
+            delta_y += segment_delta_y
+        return delta_x, delta_y
+
+    def offset_at(self, elapsed_time):
+        x_offset, y_offset = self.x_offset_init, self.y_offset_init
+
+        # skip whole cycles
+        cycle_duration = self.cycle_duration()
+        if cycle_duration > 0:
+            cycles, elapsed_time = divmod(elapsed_time, cycle_duration)
+            delta_x, delta_y = self.cycle_displacement()
+            x_offset += cycles * delta_x
+            y_offset += cycles * delta_y
+
+        # then find segment (each segment starts where the previous one ended)
+        for segment in self.anim_sequence:
+            if segment.total_duration == 0 or elapsed_time < segment.total_duration:
+                break
+            segment_end_x_offset, segment_end_y_offset = segment.offset_at(
+                segment.total_duration
+            )
+            x_offset += segment_end_x_offset - segment.x_offset_init
+            y_offset += segment_end_y_offset - segment.y_offset_init
+            elapsed_time -= segment.total_duration
+
+        segment_x_offset, segment_y_offset = segment.offset_at(elapsed_time)
+        return (
+            x_offset + segment_x_offset - segment.x_offset_init,
+            y_offset + segment_y_offset - segment.y_offset_init,
+        )
+
     def update(self, delta_time):
         super().update(delta_time)
 
+        # skip whole cycles arithmetically (e.g. large delta after a stall)
+        cycle_duration = self.cycle_duration()
+        if cycle_duration > 0 and delta_time >= cycle_duration:
+            cycles, delta_time = divmod(delta_time, cycle_duration)
+            delta_x, delta_y = self.cycle_displacement()
+            segment = self.anim_sequence[self.cur_segment]
+            segment.set_offset(
+                segment.x_offset + cycles * delta_x, segment.y_offset + cycles * delta_y
+            )
+
         while True:
             # update current segment by delta_time
             self.anim_sequence[self.cur_segment].update(delta_time)
@@ -205,3 +287,9 @@ class MovementCycle(Movement):
     def set_offset(self, x_offset, y_offset):
         super().set_offset(x_offset, y_offset)
         self.anim_sequence[self.cur_segment].set_offset(x_offset, y_offset)
+
+    def offset_deltas(self):
+        deltas = []
+        for segment in self.anim_sequence:
+            deltas += segment.offset_deltas()[0]
+        return deltas, True
@@ -1,21 +1,70 @@
+import os
 from typing import List, Union
 
 import departure.board.departure_pb2 as departure_pb2
 import departure.board.board as board
 import departure.board.movement as movement
 
+PACKED_BITS_PER_PIXEL = (1, 2, 4, 8)
+
+
+def use_packed_pixels() -> bool:
+    # packed pixels are opt-in, as older board servers only read repeated pixels
+    return os.environ.get("DEPARTURE_PACKED_PIXELS", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
 
 def deserialise_Pixel(pixel: departure_pb2.Pixel):
     return pixel.x, pixel.y, (pixel.r, pixel.g, pixel.b)
 
 
+def deserialise_PackedPixels(packed_pixels: departure_pb2.PackedPixels):
+    # palette index 0 is an unlit pixel, index k is colour palette[k - 1]
+    palette = [
+        ((colour >> 16) & 0xFF, (colour >> 8) & 0xFF, colour & 0xFF)
+        for colour in packed_pixels.palette
+    ]
+    if packed_pixels.w == 0 or packed_pixels.h == 0:  # no lit pixels
+        return []
+
+    bits_per_pixel = packed_pixels.bits_per_pixel
+    if bits_per_pixel not in PACKED_BITS_PER_PIXEL:
+        raise ValueError(f"unsupported bits per pixel: {bits_per_pixel}")
+
+    mask = (1 << bits_per_pixel) - 1
+    row_size = (packed_pixels.w * bits_per_pixel + 7) // 8
+    data = packed_pixels.data
+
+    pixels = []
+    for row in range(packed_pixels.h):
+        row_bits = int.from_bytes(data[row * row_size : (row + 1) * row_size], "big")
+        shift = row_size * 8
+        for col in range(packed_pixels.w):
+            shift -= bits_per_pixel
+            index = (row_bits >> shift) & mask
+            if 0 < index <= len(palette):
+                pixels.append(
+                    (packed_pixels.x + col, packed_pixels.y + row, palette[index - 1])
+                )
+    return pixels
+
+
 def deserialise_BoardSectionContent(
     board_section_content: departure_pb2.BoardSectionContent,
 ) -> board.BoardSectionContent:
-    return board.BoardSectionContent(
-        content_pixels=[
+    # packed pixels take precedence over (legacy) repeated pixels
+    if board_section_content.HasField("packed_pixels"):
+        content_pixels = deserialise_PackedPixels(board_section_content.packed_pixels)
+    else:
+        content_pixels = [
             deserialise_Pixel(pixel) for pixel in board_section_content.pixels
-        ],
+        ]
+
+    return board.BoardSectionContent(
+        content_pixels=content_pixels,
         content_w=board_section_content.content_w,
         content_h=board_section_content.content_h,
         repeat_x=board_section_content.repeat_x,
@@ -101,3 +150,79 @@ def serialise_pixels(pixels) -> List[departure_pb2.Pixel]:
             departure_pb2.Pixel(x=x, y=y, r=colour[0], g=colour[1], b=colour[2])
         )
     return serialised_pixels
+
+
+def serialise_packed_pixels(pixels) -> Union[departure_pb2.PackedPixels, None]:
+    # returns None if pixels cannot be packed (too many colours)
+    if len(pixels) == 0:
+        return departure_pb2.PackedPixels()
+
+    palette_indexes = {}
+    for _, _, colour in pixels:
+        if colour not in palette_indexes:
+            palette_indexes[colour] = len(palette_indexes) + 1
+
+    bits_per_pixel = next(
+        (
+            bits
+            for bits in PACKED_BITS_PER_PIXEL
+            if len(palette_indexes) < (1 << bits)
+        ),
+        None,
+    )
+    if bits_per_pixel is None:
+        return None
+
+    min_x = min(x for x, _, _ in pixels)
+    min_y = min(y for _, y, _ in pixels)
+    w = max(x for x, _, _ in pixels) - min_x + 1
+    h = max(y for _, y, _ in pixels) - min_y + 1
+
+    # last pixel wins if a position is set more than once
+    indexes = {
+        (x - min_x, y - min_y): palette_indexes[colour] for x, y, colour in pixels
+    }
+
+    # one integer per row, leftmost pixel in the most significant bits
+    row_size = (w * bits_per_pixel + 7) // 8
+    rows = [0] * h
+    for (col, row), index in indexes.items():
+        rows[row] |= index << (row_size * 8 - (col + 1) * bits_per_pixel)
+
+    return departure_pb2.PackedPixels(
+        x=min_x,
+        y=min_y,
+        w=w,
+        h=h,
+        palette=[(r << 16) | (g << 8) | b for r, g, b in palette_indexes],
+        bits_per_pixel=bits_per_pixel,
+        data=b"".join(row.to_bytes(row_size, "big") for row in rows),
+    )
+
+
+def serialise_BoardSectionContent(
+    pixels,
+    content_w: int,
+    content_h: int,
+    repeat_x: bool,
+    repeat_y: bool,
+    packed: bool = None,
+) -> departure_pb2.BoardSectionContent:
+    if packed is None:
+        packed = use_packed_pixels()
+
+    board_section_content = departure_pb2.BoardSectionContent(
+        content_w=content_w,
+        content_h=content_h,
+        repeat_x=repeat_x,
+        repeat_y=repeat_y,
+    )
+
+    packed_pixels = serialise_packed_pixels(pixels) if packed else None
+    if packed_pixels is not None:
+        board_section_content.packed_pixels.CopyFrom(packed_pixels)
+        board_section_content.packed_pixels.SetInParent()  # even if no pixels
+    else:  # fall back to repeated pixels
+        board_section_content.pixels.extend(serialise_pixels(pixels))
+
+    return board_section_content
@@ -1,3 +1,6 @@
+import departure.board.board as board
+
+
 class Renderer:
     def initialise(self):
         raise NotImplementedError()
@@ -5,5 +8,14 @@ class Renderer:
     def render_frame(self, pixels):
         raise NotImplementedError()
 
+    def render_framebuffer(self, framebuffer):
+        # default: fall back to pixels, override to render arrays directly
+        self.render_frame(board.framebuffer_pixels(framebuffer))
+
+    def render_regions(self, regions):
+        # optional: redraw only the given (region, pixels) pairs, see
+        # Board.changed_regions() (BoardAnimator renders full frames otherwise)
+        raise NotImplementedError()
+
     def terminate(self):
         raise NotImplementedError()
@@ -1,3 +1,49 @@
+import hashlib
+import time
+
+
 class ViewModel:  # pylint: disable=too-few-public-methods
     def update(self, **kwargs):
         raise NotImplementedError()
+
+
+class SectionUpdateTracker:
+    """Keeps a hash of the last update request sent for each section index, to
+    only send section update requests that changed since the last update.
+
+    All sections are resent after full_update_interval_in_s, so that a board
+    server that restarted (and lost its contents) eventually catches up."""
+
+    def __init__(self, full_update_interval_in_s: float = 300):
+        self.full_update_interval_in_s = full_update_interval_in_s
+        self._section_hashes = {}
+        self._last_full_update_time = None
+
+    def full_update_due(self) -> bool:
+        # i.e. next changed_requests will return all requests
+        return (
+            self._last_full_update_time is None
+            or time.monotonic() - self._last_full_update_time
+            >= self.full_update_interval_in_s
+        )
+
+    def changed_requests(self, requests: list) -> list:
+        if self.full_update_due():
+            self._section_hashes = {}
+            self._last_full_update_time = time.monotonic()
+
+        changed_requests = []
+        for request in requests:
+            section_hash = hashlib.blake2b(
+                request.SerializeToString(deterministic=True), digest_size=16
+            ).digest()
+            if self._section_hashes.get(request.section_index) != section_hash:
+                self._section_hashes[request.section_index] = section_hash
+                changed_requests.append(request)
+
+        return changed_requests
+
+    def reset(self):
+        # forces all sections to be sent next time, e.g. if the last update failed
+        self._section_hashes = {}
+        self._last_full_update_time = None
@@ -0,0 +1,127 @@
+"""
+Shared HTTP sessions, one per host, with keep-alive connection pools and retries
+
+Defaults can be set using the DEPARTURE_HTTP_POOL_MAXSIZE, DEPARTURE_HTTP_RETRIES
+and DEPARTURE_HTTP_BACKOFF_FACTOR env vars, and overridden per host using
+configure_host().
+"""
+
+import logging
+import os
+import threading
+import urllib.parse
+from typing import NamedTuple
+
+import requests
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class SessionConfig(NamedTuple):
+    pool_maxsize: int = int(os.environ.get("DEPARTURE_HTTP_POOL_MAXSIZE", "10"))
+    retries: int = int(os.environ.get("DEPARTURE_HTTP_RETRIES", "2"))
+    backoff_factor: float = float(
+        os.environ.get("DEPARTURE_HTTP_BACKOFF_FACTOR", "0.5")
+    )
+
+
+_host_configs = {}
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _retry(config: SessionConfig) -> Retry:
+    # only idempotent requests are retried, on connection errors and on
+    # transient HTTP errors, honouring any Retry-After header; read errors
+    # aren't retried, so that a request can't block for more than its timeout
+    # when reading
+    retry_arguments = {
+        "total": config.retries,
+        "read": False,  # re-raise read errors (e.g. read timeouts)
+        "backoff_factor": config.backoff_factor,
+        "status_forcelist": RETRY_STATUS_CODES,
+        "raise_on_status": False,
+    }
+    methods = frozenset(["GET", "HEAD"])
+
+    try:
+        return Retry(allowed_methods=methods, **retry_arguments)
+    except TypeError:  # urllib3 < 1.26
+        return Retry(method_whitelist=methods, **retry_arguments)
+
+
+def create_session(config: SessionConfig = SessionConfig()) -> requests.Session:
+    retry = _retry(config)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=config.pool_maxsize, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _host(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc
+
+
+def configure_host(host: str, config: SessionConfig):
+    # replaces the session for host (if any), existing connections are dropped
+    with _sessions_lock:
+        _host_configs[host] = config
+        session = _sessions.pop(host, None)
+    if session is not None:
+        session.close()
+
+
+def session(url: str) -> requests.Session:
+    """Returns the shared session for the host of url, created on first use."""
+    host = _host(url)
+    with _sessions_lock:
+        if host not in _sessions:
+            logger.debug("creating HTTP session for %s", host)
+            _sessions[host] = create_session(_host_configs.get(host, SessionConfig()))
+        return _sessions[host]
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return session(url).get(url, **kwargs)
+
+
+def pool_stats() -> dict:
+    """Returns connection pool statistics by host, e.g. for monitoring: number
+    of requests sent, of connections opened (fewer than requests if connections
+    are reused), of idle connections in the pool, and maximum pool size."""
+    with _sessions_lock:
+        sessions = dict(_sessions)
+
+    stats = {}
+    for host, host_session in sessions.items():
+        host_stats = {"requests": 0, "connections": 0, "idle_connections": 0}
+        for adapter in set(host_session.adapters.values()):
+            host_stats["pool_maxsize"] = adapter._pool_maxsize  # pylint: disable=W0212
+            for pool_key in adapter.poolmanager.pools.keys():
+                pool = adapter.poolmanager.pools.get(pool_key)
+                if pool is None:
+                    continue
+                host_stats["requests"] += pool.num_requests
+                host_stats["connections"] += pool.num_connections
+                if pool.pool is not None:
+                    host_stats["idle_connections"] += sum(
+                        1 for conn in list(pool.pool.queue) if conn is not None
+                    )
+        stats[host] = host_stats
+
+    return stats
+
+
+def close_sessions():
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for host_session in sessions:
+        host_session.close()
@@ -0,0 +1,25 @@
+import sys
+import threading
+from typing import Callable, Dict
+
+
+def lazy_attributes(module_name: str, loaders: Dict[str, Callable]) -> Callable:
+    """Returns a module-level __getattr__ function (PEP 562) that loads the
+    module's attributes listed in loaders on first access, e.g. station data,
+    so that importing the module is cheap.
+
+    Loaded values are stored in the module, so each loader runs at most once
+    (loaders may access other lazy attributes using the returned function)."""
+    module = sys.modules[module_name]
+    lock = threading.RLock()
+
+    def __getattr__(name):  # pylint: disable=invalid-name
+        if name not in loaders:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        with lock:
+            if name not in module.__dict__:
+                setattr(module, name, loaders[name]())
+        return module.__dict__[name]
+
+    return __getattr__
@@ -0,0 +1,67 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import os
+import threading
+from typing import Any, Callable, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# bound on blocking calls (e.g. provider API requests) run from the event loop
+BLOCKING_MAX_WORKERS = int(os.environ.get("DEPARTURE_BLOCKING_MAX_WORKERS", "8"))
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def shared_executor(name: str, max_workers: int) -> concurrent.futures.Executor:
+    """Returns the process-wide thread pool called name, created on first use,
+    so that concurrent callers share the same bound on worker threads."""
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=name
+            )
+        return _executors[name]
+
+
+def map_with_deadline(
+    function: Callable,
+    items: Iterable,
+    executor: concurrent.futures.Executor,
+    timeout_in_s: float,
+    default: Any = None,
+) -> List:
+    """Applies function to items concurrently, returning results in the order of
+    items. Items for which function fails or does not return within
+    timeout_in_s (for the whole batch) get default instead."""
+    futures = [executor.submit(function, item) for item in items]
+    done, not_done = concurrent.futures.wait(futures, timeout=timeout_in_s)
+
+    if not_done:
+        logger.warning("%d of %d tasks timed out", len(not_done), len(futures))
+
+    results = []
+    for future in futures:
+        if future not in done:
+            future.cancel()  # if not started yet
+            results.append(default)
+            continue
+
+        try:
+            results.append(future.result())
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("task failed: %s", str(e))
+            results.append(default)
+
+    return results
+
+
+async def run_blocking(function: Callable, *args, **kwargs) -> Any:
+    """Runs blocking function (e.g. I/O-bound provider code) in a bounded
+    thread pool, so that the event loop keeps serving other requests."""
+    return await asyncio.get_running_loop().run_in_executor(
+        shared_executor("blocking", BLOCKING_MAX_WORKERS),
+        functools.partial(function, *args, **kwargs),
+    )
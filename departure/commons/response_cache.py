@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import departure.commons.parallel as parallel
+
+logger = logging.getLogger(__name__)
+
+REFRESH_MAX_WORKERS = 4
+
+
+class ResponseCache:
+    """Bounded LRU cache of API responses, keyed e.g. on URL.
+
+    Responses are fresh for ttl_in_s. Stale responses (up to stale_ttl_in_s
+    after expiry) are still returned, while being refreshed in the background
+    (stale-while-revalidate). Failed requests (i.e. None responses) are not
+    cached."""
+
+    def __init__(
+        self, ttl_in_s: float, stale_ttl_in_s: float = 0, max_size: int = 256
+    ):
+        self.ttl_in_s = ttl_in_s
+        self.stale_ttl_in_s = stale_ttl_in_s
+        self.max_size = max_size
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._responses = OrderedDict()  # key -> (response, fetch time)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, key, fetch):
+        # return cached response if fresh (or stale and refreshable), otherwise
+        # fetch and cache it
+        with self._lock:
+            if key in self._responses:
+                response, fetch_time = self._responses[key]
+                age = time.monotonic() - fetch_time
+                if age < self.ttl_in_s:
+                    self._responses.move_to_end(key)
+                    self.hits += 1
+                    return response
+                if age < self.ttl_in_s + self.stale_ttl_in_s:
+                    self._responses.move_to_end(key)
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        parallel.shared_executor(
+                            "response-cache", REFRESH_MAX_WORKERS
+                        ).submit(self._refresh, key, fetch)
+                    return response
+            self.misses += 1
+
+        return self._fetch(key, fetch)
+
+    def _fetch(self, key, fetch):
+        response = fetch()
+
+        with self._lock:
+            if response is not None and self.max_size > 0:
+                self._responses[key] = (response, time.monotonic())
+                self._responses.move_to_end(key)
+                while len(self._responses) > self.max_size:
+                    self._responses.popitem(last=False)
+
+        return response
+
+    def _refresh(self, key, fetch):
+        try:
+            self._fetch(key, fetch)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("background refresh of %s failed: %s", key, str(e))
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+            self.hits = 0
+            self.stale_hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "size": len(self._responses),
+                "max_size": self.max_size,
+            }
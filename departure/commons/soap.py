@@ -0,0 +1,50 @@
+import logging
+import sqlite3
+import threading
+
+import zeep
+import zeep.cache
+import zeep.transports
+
+import departure.commons.http_sessions as http_sessions
+
+logger = logging.getLogger(__name__)
+
+# WSDL and XSD documents hardly ever change
+WSDL_CACHE_TIMEOUT_IN_S = 24 * 60 * 60
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _wsdl_cache():
+    # persistent cache if possible (e.g. cache directory is writable)
+    try:
+        return zeep.cache.SqliteCache(timeout=WSDL_CACHE_TIMEOUT_IN_S)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("using in-memory WSDL cache: %s", e)
+        return zeep.cache.InMemoryCache(timeout=WSDL_CACHE_TIMEOUT_IN_S)
+
+
+def _transport() -> zeep.transports.Transport:
+    return zeep.transports.Transport(
+        session=http_sessions.create_session(), cache=_wsdl_cache()
+    )
+
+
+def soap_client(wsdl: str) -> zeep.Client:
+    """Returns the process-wide SOAP client for a WSDL (local file or URL),
+    created on first use.
+
+    Clients share nothing per call, so they can be used from several threads
+    (pass SOAP headers to each call rather than setting them on the client)."""
+    with _clients_lock:
+        if wsdl not in _clients:
+            logger.debug("creating SOAP client for %s", wsdl)
+            _clients[wsdl] = zeep.Client(wsdl=wsdl, transport=_transport())
+        return _clients[wsdl]
+
+
+def clear_soap_clients():
+    with _clients_lock:
+        _clients.clear()
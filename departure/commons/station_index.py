@@ -0,0 +1,145 @@
+"""
+Compact station indexes, pre-built from raw station datasets
+
+Index files are tab-separated UTF-8 text, next to the raw dataset:
+- header: format version, size and SHA-256 of the raw dataset (to detect stale
+  indexes), and field names
+- one row per station: station id, then field values
+
+Indexes are shipped with their raw dataset, whose mtime isn't preserved by
+checkouts or copies, hence the content hash. Once an index has been checked,
+sizes and mtimes of the raw dataset and index are saved to a stamp file, so
+that later loads don't read the raw dataset (as for compiled fonts).
+"""
+
+import hashlib
+import logging
+import os
+import pathlib
+from typing import Callable, Dict, List, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".index.tsv"
+STAMP_SUFFIX = ".index.stamp"
+HEADER_PREFIX = "#departure-station-index"
+
+Stations = Dict[str, dict]
+
+
+def index_path(source_path: pathlib.Path) -> pathlib.Path:
+    return source_path.with_suffix(INDEX_SUFFIX)
+
+
+def stamp_path(source_path: pathlib.Path) -> pathlib.Path:
+    return source_path.with_suffix(STAMP_SUFFIX)
+
+
+def _file_signature(path: pathlib.Path) -> str:
+    stat = path.stat()
+    return f"size={stat.st_size} mtime_ns={stat.st_mtime_ns}"
+
+
+def _stamp(source_path: pathlib.Path) -> str:
+    return (
+        f"{_file_signature(source_path)} "
+        f"{_file_signature(index_path(source_path))}\n"
+    )
+
+
+def _source_signature(source_path: pathlib.Path) -> str:
+    sha256 = hashlib.sha256()
+    with source_path.open("rb") as source_file:
+        for chunk in iter(lambda: source_file.read(1 << 16), b""):
+            sha256.update(chunk)
+    return f"size={source_path.stat().st_size} sha256={sha256.hexdigest()}"
+
+
+def _clean(value: str) -> str:
+    return str(value).replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
+def build_station_index(
+    stations: Stations, fields: List[str], source_path: pathlib.Path
+) -> str:
+    lines = [
+        f"{HEADER_PREFIX} v{INDEX_VERSION} {_source_signature(source_path)}",
+        "\t".join(["id"] + fields),
+    ]
+    for station_id, station in stations.items():
+        values = [station_id] + [station[field] for field in fields]
+        lines.append("\t".join(_clean(value) for value in values))
+    return "\n".join(lines) + "\n"
+
+
+def read_station_index(
+    source_path: pathlib.Path,
+) -> Union[Stations, None]:
+    # returns None if index is missing, invalid or stale
+    try:
+        with index_path(source_path).open(encoding="utf-8") as index_file:
+            header = index_file.readline().rstrip("\n")
+            if not _is_index_fresh(source_path, header):
+                return None
+
+            fields = index_file.readline().rstrip("\n").split("\t")[1:]
+            stations = {}
+            for line in index_file:
+                station_id, *values = line.rstrip("\n").split("\t")
+                stations[station_id] = dict(zip(fields, values))
+            return stations
+    except (OSError, ValueError):
+        return None
+
+
+def _is_index_fresh(source_path: pathlib.Path, header: str) -> bool:
+    # fast path: index already checked against this raw dataset
+    stamp = _stamp(source_path)
+    try:
+        if stamp_path(source_path).read_text(encoding="utf-8") == stamp:
+            return True
+    except OSError:
+        pass
+
+    if header != f"{HEADER_PREFIX} v{INDEX_VERSION} {_source_signature(source_path)}":
+        return False
+
+    try:
+        stamp_path(source_path).write_text(stamp, encoding="utf-8")
+    except OSError as e:
+        logger.warning("could not save station index stamp: %s", e)
+    return True
+
+
+def write_station_index(
+    stations: Stations, fields: List[str], source_path: pathlib.Path
+):
+    # write atomically, as other processes may be reading the index
+    path = index_path(source_path)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as index_file:
+            index_file.write(build_station_index(stations, fields, source_path))
+        os.replace(temp_path, path)
+        stamp_path(source_path).write_text(_stamp(source_path), encoding="utf-8")
+    except OSError as e:
+        logger.warning("could not save station index %s: %s", path, e)
+
+
+def load_station_index(
+    source_path: pathlib.Path,
+    extract: Callable[[pathlib.Path], Stations],
+    fields: List[str],
+) -> Stations:
+    """Loads stations from the index of a raw dataset, falling back to
+    extracting them from the raw dataset (and rebuilding the index) if the index
+    is missing or stale."""
+    stations = read_station_index(source_path)
+    if stations is not None:
+        return stations
+
+    logger.info("station index for %s missing or stale, rebuilding", source_path)
+    stations = extract(source_path)
+    write_station_index(stations, fields, source_path)
+    return stations
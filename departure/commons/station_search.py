@@ -0,0 +1,110 @@
+"""
+Station search engine, matching queries anywhere in station names
+
+Names and queries are accent-folded and case-folded. Stations are indexed by
+all substrings of their folded names of up to NGRAM_SIZE characters, so short
+queries are answered by a single lookup, and longer queries by intersecting the
+stations of their n-grams, then checking actual matches.
+"""
+
+import heapq
+import unicodedata
+from typing import Any, Callable, Dict, Hashable, Union
+
+NGRAM_SIZE = 3
+
+
+def fold(string: str) -> str:
+    # e.g. "Gare de l'Est (Paris)" -> "gare de l'est (paris)", "Évry" -> "evry"
+    decomposed = unicodedata.normalize("NFKD", str(string))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+class StationSearchIndex:
+    def __init__(self, stations: Dict[Hashable, Any], name: Callable[[Any], str]):
+        # stations: station data by station id, name: returns name of a station
+        self.stations = stations
+        self._folded_names = {
+            station_id: fold(name(station)) for station_id, station in stations.items()
+        }
+        self._positions = {station_id: i for i, station_id in enumerate(stations)}
+
+        self._ngrams = {}
+        for station_id, folded_name in self._folded_names.items():
+            for size in range(1, NGRAM_SIZE + 1):
+                for start in range(len(folded_name) - size + 1):
+                    self._ngrams.setdefault(
+                        folded_name[start : start + size], set()
+                    ).add(station_id)
+
+        # ranked stations for short queries (i.e. n-grams), filled on demand
+        self._ranked_ngram_stations = {}
+
+    def _candidates(self, query: str) -> set:
+        if len(query) <= NGRAM_SIZE:
+            return self._ngrams.get(query, set())
+
+        # stations with all n-grams of query, starting with the rarest n-gram
+        ngram_stations = sorted(
+            (
+                self._ngrams.get(query[start : start + NGRAM_SIZE], set())
+                for start in range(len(query) - NGRAM_SIZE + 1)
+            ),
+            key=len,
+        )
+        candidates = set(ngram_stations[0])
+        for stations in ngram_stations[1:]:
+            if not candidates:
+                break
+            candidates &= stations
+
+        return {
+            station_id
+            for station_id in candidates
+            if query in self._folded_names[station_id]
+        }
+
+    def _rank(self, station_id, query: str):
+        # exact match, then name prefix, then word prefix, then anywhere;
+        # shorter names first, then original order
+        folded_name = self._folded_names[station_id]
+        if folded_name == query:
+            match_rank = 0
+        elif folded_name.startswith(query):
+            match_rank = 1
+        elif any(word.startswith(query) for word in folded_name.split()):
+            match_rank = 2
+        else:
+            match_rank = 3
+
+        return match_rank, len(folded_name), self._positions[station_id]
+
+    def _ranked(self, query: str) -> list:
+        return sorted(
+            self._candidates(query),
+            key=lambda station_id: self._rank(station_id, query),
+        )
+
+    def search(self, query: str, limit: Union[int, None] = None) -> dict:
+        """Returns stations whose names contain query, best matches first, up
+        to limit stations (all matching stations if limit is None)."""
+        query = fold(query)
+
+        # empty query matches all stations
+        if query == "":
+            station_ids = list(self.stations)[:limit]
+        elif len(query) <= NGRAM_SIZE:
+            # short queries match many stations: rank them once only
+            if query not in self._ranked_ngram_stations:
+                self._ranked_ngram_stations[query] = self._ranked(query)
+            station_ids = self._ranked_ngram_stations[query][:limit]
+        elif limit is None:
+            station_ids = self._ranked(query)
+        else:
+            station_ids = heapq.nsmallest(
+                limit,
+                self._candidates(query),
+                key=lambda station_id: self._rank(station_id, query),
+            )
+
+        return {station_id: self.stations[station_id] for station_id in station_ids}
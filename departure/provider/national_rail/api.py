@@ -1,7 +1,7 @@
 import os
-from zeep import Client
 from zeep import xsd
 
+import departure.commons.soap as soap
 
 from . import commons
 
@@ -26,7 +26,7 @@ def soap_client():
 
     return {
         "headers": [HEADER(TokenValue=os.environ["LDB_TOKEN"])],
-        "client": Client(wsdl=WSDL),
+        "client": soap.soap_client(WSDL),
     }
 
 
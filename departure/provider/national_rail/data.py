@@ -1,6 +1,9 @@
 import pathlib
 import csv
 
+import departure.commons.lazy as lazy
+import departure.commons.station_search as station_search
+
 
 STATION_CODES_FILENAME = "data/station_codes.csv"
 
@@ -19,4 +22,13 @@ def _stations(station_codes_filename):
     return stations
 
 
-STATIONS = _stations(STATION_CODES_FILENAME)
+# loaded on first access
+__getattr__ = lazy.lazy_attributes(
+    __name__,
+    {
+        "STATIONS": lambda: _stations(STATION_CODES_FILENAME),
+        "STATION_SEARCH_INDEX": lambda: station_search.StationSearchIndex(
+            __getattr__("STATIONS"), lambda station_name: station_name
+        ),
+    },
+)
@@ -15,18 +15,8 @@ def check_params(station_code: str) -> None:
             ) from Exception
 
 
-def stations_by_string(string):
-    string = str(string).lower().strip()
-    results = {}
-    stations = data.STATIONS
-
-    # iterate over stations
-    for station_id in stations:
-        # match?
-        if string in stations[station_id].lower():
-            results[station_id] = stations[station_id]
-
-    return results
+def stations_by_string(string, limit: int = None):
+    return data.STATION_SEARCH_INDEX.search(str(string).strip(), limit)
 
 
 def services_from_station_board_with_details(station_board_with_details):
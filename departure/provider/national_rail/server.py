@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import national_rail, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -15,11 +18,15 @@ router = APIRouter()
 
 class Station(BaseModel):
     code: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 @router.get("/search/{search_string}")
-async def search(search_string):
-    return national_rail.stations_by_string(search_string)
+async def search(search_string, limit: int = None):
+    return await parallel.run_blocking(
+        national_rail.stations_by_string, search_string, limit
+    )
 
 
 # debugging only
@@ -28,7 +35,9 @@ async def next_departures(station_code):
     # request next services
     station_code = station_code.upper()
     try:
-        response = national_rail.next_services(station_code)
+        response = await parallel.run_blocking(
+            national_rail.next_services, station_code
+        )
     except commons.NationalRailException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
@@ -47,24 +56,23 @@ async def start_client(station: Station, request: Request):
     station_code = station.code.upper()
     try:
         commons.check_env_vars()
-        national_rail.check_params(station_code)
+        await parallel.run_blocking(national_rail.check_params, station_code)
     except commons.NationalRailException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station.board_id,
             view_model.ViewModelNationalRail_192_32_3_Rows_To_ProtocolBuffers,
             data_updater.DataUpdaterNationalRail,
             {"station_id": station_code},
-        ],
-    ).start()
+            board_server=station.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
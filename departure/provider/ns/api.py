@@ -8,16 +8,22 @@ import logging
 
 import requests
 
+import departure.commons.http_sessions as http_sessions
+import departure.commons.response_cache as response_cache
+
 from . import commons
 
 logger = logging.getLogger(__name__)
 
+# journeys change less often than departures
+JOURNEY_CACHE = response_cache.ResponseCache(ttl_in_s=60, stale_ttl_in_s=120)
+
 
 def api_request(url: str, payload: dict) -> str:
     commons.check_env_vars()
 
     try:
-        response = requests.get(
+        response = http_sessions.get(
             url,
             params=payload,
             timeout=15,
@@ -47,4 +53,4 @@ def departures(station_code):
 def journey(train_number):
     url = "https://gateway.apiportal.ns.nl/reisinformatie-api/api/v2/journey"
     payload = {"train": train_number, "lang": "en"}
-    return api_request(url, payload)
+    return JOURNEY_CACHE.get(train_number, lambda: api_request(url, payload))
@@ -1,6 +1,9 @@
 import pathlib
 import csv
 
+import departure.commons.lazy as lazy
+import departure.commons.station_search as station_search
+
 
 DATA_DIRNAME = "data"
 DATA_FILENAME = "stations-2020-01-nl.csv"
@@ -39,5 +42,18 @@ def _stations_by_uic(stations_by_ns_code_dict):
     return stations
 
 
-STATIONS_BY_NS_CODE = _stations_by_ns_code(DATA_DIRNAME, DATA_FILENAME)
-STATIONS_BY_UIC = _stations_by_uic(STATIONS_BY_NS_CODE)
+# loaded on first access
+__getattr__ = lazy.lazy_attributes(
+    __name__,
+    {
+        "STATIONS_BY_NS_CODE": lambda: _stations_by_ns_code(
+            DATA_DIRNAME, DATA_FILENAME
+        ),
+        "STATIONS_BY_UIC": lambda: _stations_by_uic(
+            __getattr__("STATIONS_BY_NS_CODE")
+        ),
+        "STATION_SEARCH_INDEX": lambda: station_search.StationSearchIndex(
+            __getattr__("STATIONS_BY_NS_CODE"), lambda station: station["name_long"]
+        ),
+    },
+)
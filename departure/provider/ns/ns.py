@@ -2,8 +2,14 @@
 Core functions for Nederlandse Spoorwegen
 """
 
+import departure.commons.parallel as parallel
+
 from . import api, data, commons
 
+# journeys are looked up concurrently, within a deadline for all trains
+JOURNEY_MAX_WORKERS = 8
+JOURNEY_TIMEOUT_IN_S = 10
+
 
 def check_params(station_code: str):
     stations = data.STATIONS_BY_NS_CODE
@@ -13,14 +19,26 @@ def check_params(station_code: str):
 
 
 def departures_with_schedule(
-    station_code: str, timetable_for_all_trains: bool = False
+    station_code: str,
+    timetable_for_all_trains: bool = False,
+    max_workers: int = JOURNEY_MAX_WORKERS,
+    timeout_in_s: float = JOURNEY_TIMEOUT_IN_S,
 ) -> list:
     trains = departures(station_code)
 
-    for train in trains:
-        train["schedule"] = stops(train["train_number"])
-        if not timetable_for_all_trains:
-            break  # then stop after first train
+    # schedule of first train only, unless requested for all trains
+    scheduled_trains = trains if timetable_for_all_trains else trains[:1]
+
+    # empty schedule if journey lookup failed or timed out
+    schedules = parallel.map_with_deadline(
+        stops,
+        [train["train_number"] for train in scheduled_trains],
+        executor=parallel.shared_executor(f"ns-journey-{max_workers}", max_workers),
+        timeout_in_s=timeout_in_s,
+        default=[],
+    )
+    for train, schedule in zip(scheduled_trains, schedules):
+        train["schedule"] = schedule
 
     return trains
 
@@ -84,14 +102,5 @@ def stops(train_number: str) -> list:
     return schedule
 
 
-def search(station_name_query: str) -> dict:
-    stations = data.STATIONS_BY_NS_CODE
-    station_name_query = str(station_name_query).lower()
-
-    results = {}
-
-    for station_code in stations:
-        if station_name_query in stations[station_code]["name_long"].lower():
-            results[station_code] = stations[station_code]
-
-    return results
+def search(station_name_query: str, limit: int = None) -> dict:
+    return data.STATION_SEARCH_INDEX.search(station_name_query, limit)
@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import ns, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -15,6 +18,8 @@ router = APIRouter()
 
 class Station(BaseModel):
     code: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 def check_params(station_code):
@@ -26,8 +31,8 @@ def check_params(station_code):
 
 
 @router.get("/search/{search_string}")
-async def search(search_string):
-    return ns.search(search_string)
+async def search(search_string, limit: int = None):
+    return await parallel.run_blocking(ns.search, search_string, limit)
 
 
 # debugging only
@@ -37,7 +42,9 @@ async def next_departures(station_code):
     station_code = station_code.upper()
 
     try:
-        response = ns.departures_with_schedule(station_code)
+        response = await parallel.run_blocking(
+            ns.departures_with_schedule, station_code
+        )
     except commons.NSException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
@@ -55,25 +62,24 @@ async def start_client(station: Station, request: Request):
     # check parameters
     station_code = station.code.upper()
     try:
-        ns.check_params(station_code)
+        await parallel.run_blocking(ns.check_params, station_code)
         commons.check_env_vars()
     except commons.NSException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station.board_id,
             view_model.ViewModelNS192x32x3ToProtocolBuffers,
             data_updater.DataUpdaterNS,
             {"station_code": station_code},
-        ],
-    ).start()
+            board_server=station.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
@@ -40,7 +40,7 @@ class ViewModelNS(view_model.ViewModel):
 class ViewModelNS192x32x3(ViewModelNS):  # pylint: disable=abstract-method
     def __init__(self):
         self.board_text = contents.BoardText(
-            font=contents.read_bdf_font("fonts/6x10_condensed.bdf"),
+            font=contents.load_font("fonts/6x10_condensed.bdf"),
             colour_map={
                 "orange": (255, 204, 0),
                 "red": (255, 0, 0),
@@ -168,6 +168,7 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
     def __init__(self, board_manager_stub: departure_pb2_grpc.BoardManagerStub):
         super().__init__()
         self.board_manager_stub = board_manager_stub
+        self.section_update_tracker = view_model.SectionUpdateTracker()
 
         self.next_train_tracker = [
             departure_pb2.Movement(
@@ -204,8 +205,8 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=0,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(top_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=top_section_content_pixels,
                     content_w=top_section_content_pixels_size[0],
                     content_h=top_section_content_pixels_size[1],
                     repeat_x=False,
@@ -220,8 +221,8 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=1,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(middle_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=middle_section_content_pixels,
                     content_w=middle_section_content_pixels_size[0] + 192,
                     content_h=middle_section_content_pixels_size[1],
                     repeat_x=True,
@@ -250,8 +251,8 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=2,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(bottom_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=bottom_section_content_pixels,
                     content_w=bottom_section_content_pixels_size[0],
                     content_h=bottom_section_content_pixels_size[1],
                     repeat_x=True,
@@ -262,6 +263,11 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
             )
         )
 
+        # only send sections that changed since the last update
+        requests_data = self.section_update_tracker.changed_requests(requests_data)
+        if len(requests_data) == 0:
+            return
+
         # send gRPC message
         try:
             self.board_manager_stub.BoardSectionsUpdate(
@@ -270,3 +276,4 @@ class ViewModelNS192x32x3ToProtocolBuffers(ViewModelNS192x32x3):
         # pylint: disable=protected-access
         except (grpc._channel._Rendezvous, grpc._channel._InactiveRpcError):
             logger.warning("connection to board failed")
+            self.section_update_tracker.reset()
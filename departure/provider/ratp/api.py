@@ -1,12 +1,12 @@
 import os
 
-from zeep import Client
+import departure.commons.soap as soap
 
 WSDL_FILENAME = "data/Wsiv.wsdl"
 
 
 def soap_client():
-    return Client(wsdl=os.path.join(os.path.dirname(__file__), WSDL_FILENAME))
+    return soap.soap_client(os.path.join(os.path.dirname(__file__), WSDL_FILENAME))
 
 
 def get_lines_realtime_realm():
@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import ratp, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -17,38 +20,42 @@ class StationDirection(BaseModel):
     line_id: str
     line_station_id: str
     direction: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 @router.get("/stations/{station_name_query}")
 async def search_stations(station_name_query: str):
-    return ratp.stations_by_name(station_name_query)
+    return await parallel.run_blocking(ratp.stations_by_name, station_name_query)
 
 
 @router.get("/stations-line/{line_id}")
 async def stations_line(line_id: str):
-    return ratp.stations_by_line(line_id)
+    return await parallel.run_blocking(ratp.stations_by_line, line_id)
 
 
 @router.get("/lines/{line_name_query}")
 async def search_lines(line_name_query: str):
-    return ratp.lines_by_name(line_name_query)
+    return await parallel.run_blocking(ratp.lines_by_name, line_name_query)
 
 
 @router.get("/lines-by-code/{code_query}")
 async def search_lines_by_code(code_query: str):
-    return ratp.lines_by_code(code_query)
+    return await parallel.run_blocking(ratp.lines_by_code, code_query)
 
 
 @router.get("/directions/{line_id}")
 async def directions(line_id: str):
-    return ratp.directions(line_id)
+    return await parallel.run_blocking(ratp.directions, line_id)
 
 
 # debugging only
 @router.get("/next/{line_id}/{line_station_id}/{direction}")
 async def next_departures(line_id: str, line_station_id: str, direction: str):
     try:
-        departures = ratp.next_departures(line_id, line_station_id, direction)
+        departures = await parallel.run_blocking(
+            ratp.next_departures, line_id, line_station_id, direction
+        )
     except commons.RatpException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
@@ -62,7 +69,8 @@ async def next_departures(line_id: str, line_station_id: str, direction: str):
 async def start_client(station_direction: StationDirection, request: Request):
     # check params
     try:
-        ratp.check_params(
+        await parallel.run_blocking(
+            ratp.check_params,
             station_direction.line_id,
             station_direction.line_station_id,
             station_direction.direction,
@@ -71,15 +79,11 @@ async def start_client(station_direction: StationDirection, request: Request):
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station_direction.board_id,
             view_model.ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers,
             data_updater.DataUpdaterRatp,
             {
@@ -87,7 +91,10 @@ async def start_client(station_direction: StationDirection, request: Request):
                 "line_station_id": station_direction.line_station_id,
                 "direction": station_direction.direction,
             },
-        ],
-    ).start()
+            board_server=station_direction.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
@@ -19,7 +19,7 @@ class ViewModelRatp(view_model.ViewModel):  # pylint: disable=abstract-method
 class ViewModelRatp_192_32(ViewModelRatp):  # pylint: disable=abstract-method
     def __init__(self):
         self.board_text = contents.BoardText(
-            font=contents.read_bdf_font("fonts/6x10_condensed.bdf"),
+            font=contents.load_font("fonts/6x10_condensed.bdf"),
             colour_map={
                 "orange": (255, 204, 0),
                 "red": (255, 0, 0),
@@ -128,6 +128,7 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
     def __init__(self, board_manager_stub: departure_pb2_grpc.BoardManagerStub):
         super().__init__()
         self.board_manager_stub = board_manager_stub
+        self.section_update_tracker = view_model.SectionUpdateTracker()
 
         self.next_mission_tracker = [
             departure_pb2.Movement(
@@ -174,8 +175,8 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=0,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=board_protobuf.serialise_pixels(top_section_content_pixels),
+                content=board_protobuf.serialise_BoardSectionContent(
+                    pixels=top_section_content_pixels,
                     content_w=top_section_content_pixels_size[0],
                     content_h=top_section_content_pixels_size[1],
                     repeat_x=False,
@@ -190,10 +191,8 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=1,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=board_protobuf.serialise_pixels(
-                        middle_section_content_pixels
-                    ),
+                content=board_protobuf.serialise_BoardSectionContent(
+                    pixels=middle_section_content_pixels,
                     content_w=middle_section_content_pixels_size[0],
                     content_h=middle_section_content_pixels_size[1],
                     repeat_x=False,
@@ -222,10 +221,8 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=2,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=board_protobuf.serialise_pixels(
-                        bottom_section_content_pixels
-                    ),
+                content=board_protobuf.serialise_BoardSectionContent(
+                    pixels=bottom_section_content_pixels,
                     content_w=bottom_section_content_pixels_size[0],
                     content_h=bottom_section_content_pixels_size[1],
                     repeat_x=repeat_x,
@@ -236,6 +233,11 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
             )
         )
 
+        # only send sections that changed since the last update
+        requests_data = self.section_update_tracker.changed_requests(requests_data)
+        if len(requests_data) == 0:
+            return
+
         # send gRPC message
         try:
             self.board_manager_stub.BoardSectionsUpdate(
@@ -244,3 +246,4 @@ class ViewModelRatp_192_32_3_Rows_To_ProtocolBuffers(ViewModelRatp_192_32):
         # pylint: disable=protected-access
         except (grpc._channel._Rendezvous, grpc._channel._InactiveRpcError):
             logger.warning("connection to board failed")
+            self.section_update_tracker.reset()
@@ -4,16 +4,25 @@ import logging
 
 import requests
 
+import departure.commons.http_sessions as http_sessions
+import departure.commons.response_cache as response_cache
+
 from . import commons
 
 logger = logging.getLogger(__name__)
 
+# caches for responses that change less often than departures
+DISRUPTIONS_CACHE = response_cache.ResponseCache(ttl_in_s=60, stale_ttl_in_s=120)
+VEHICLE_JOURNEYS_CACHE = response_cache.ResponseCache(
+    ttl_in_s=300, stale_ttl_in_s=900
+)
+
 
 def api_request(url: str):
     commons.check_env_vars()
 
     try:
-        response = requests.get(
+        response = http_sessions.get(
             url,
             timeout=15,
             # http://doc.navitia.io/#authentication
@@ -43,9 +52,9 @@ def departures(station_id):
 
 def disruptions(disruption_id):
     url = f"https://api.navitia.io/v1/coverage/sncf/disruptions/{disruption_id}/"
-    return api_request(url)
+    return DISRUPTIONS_CACHE.get(url, lambda: api_request(url))
 
 
 def vehicle_journeys(vehicle_journey_id):
     url = f"https://api.navitia.io/v1/coverage/sncf/vehicle_journeys/{vehicle_journey_id}/"
-    return api_request(url)
+    return VEHICLE_JOURNEYS_CACHE.get(url, lambda: api_request(url))
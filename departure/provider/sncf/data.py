@@ -1,14 +1,18 @@
 import pathlib
 import json
 
+import departure.commons.lazy as lazy
+import departure.commons.station_search as station_search
+import departure.commons.station_index as station_index
+
 
 DATA_DIRNAME = "data"
 DATA_FILENAME = "referentiel-gares-voyageurs.json"
+DATA_PATH = pathlib.Path(__file__).parents[0] / DATA_DIRNAME / DATA_FILENAME
+INDEX_FIELDS = ["nom"]
 
 
-def _stations(data_dirname, data_filename):
-    data_path = pathlib.Path(__file__).parents[0] / data_dirname / data_filename
-
+def _stations_from_data_file(data_path):
     # read from stations data file
     with open(data_path) as data_file:
         raw_stations = json.load(data_file)
@@ -23,4 +27,25 @@ def _stations(data_dirname, data_filename):
     return stations
 
 
-STATIONS = _stations(DATA_DIRNAME, DATA_FILENAME)
+# loaded on first access
+__getattr__ = lazy.lazy_attributes(
+    __name__,
+    {
+        "STATIONS": lambda: station_index.load_station_index(
+            DATA_PATH, _stations_from_data_file, INDEX_FIELDS
+        ),
+        "STATION_SEARCH_INDEX": lambda: station_search.StationSearchIndex(
+            __getattr__("STATIONS"), lambda station: station["nom"]
+        ),
+    },
+)
+
+
+def build_station_index():
+    station_index.write_station_index(
+        _stations_from_data_file(DATA_PATH), INDEX_FIELDS, DATA_PATH
+    )
+
+
+if __name__ == "__main__":
+    build_station_index()
@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import sncf, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -15,11 +18,13 @@ router = APIRouter()
 
 class Station(BaseModel):
     stop_area_id: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 @router.get("/search/{search_string}")
-async def search(search_string):
-    return sncf.stations_by_string(search_string)
+async def search(search_string, limit: int = None):
+    return await parallel.run_blocking(sncf.stations_by_string, search_string, limit)
 
 
 # debugging only
@@ -28,7 +33,7 @@ async def next_trains(stop_area_id):
     stop_area_id = stop_area_id.upper()
 
     try:
-        response = sncf.next_trains(stop_area_id)
+        response = await parallel.run_blocking(sncf.next_trains, stop_area_id)
     except commons.SncfException as e:
         return {"status": "error", "message": str(e)}
 
@@ -43,24 +48,23 @@ async def start_client(station: Station, request: Request):
     stop_area_id = station.stop_area_id
     try:
         commons.check_env_vars()
-        sncf.check_params(stop_area_id)
+        await parallel.run_blocking(sncf.check_params, stop_area_id)
     except commons.SncfException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station.board_id,
             view_model.ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers,
             data_updater.DataUpdaterSncf,
             {"stop_area_id": stop_area_id},
-        ],
-    ).start()
+            board_server=station.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
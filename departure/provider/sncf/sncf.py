@@ -1,5 +1,11 @@
+import departure.commons.parallel as parallel
+
 from . import data, commons, api
 
+# timetables are fetched concurrently, within a deadline for all departures
+TIMETABLE_MAX_WORKERS = 8
+TIMETABLE_TIMEOUT_IN_S = 10
+
 
 def check_params(stop_area_id: str = None):
     if not any((stop_area_id)):
@@ -14,18 +20,8 @@ def check_params(stop_area_id: str = None):
             raise commons.SncfException(f"invalid stop area id {stop_area_id}") from e
 
 
-def stations_by_string(string):
-    string = str(string).lower()
-    results = {}
-    stations = data.STATIONS
-
-    # iterate over stations
-    for station_id in stations:
-        # match?
-        if string in stations[station_id]["nom"].lower():
-            results[station_id] = stations[station_id]
-
-    return results
+def stations_by_string(string, limit: int = None):
+    return data.STATION_SEARCH_INDEX.search(string, limit)
 
 
 def timetable_from_disruptions(disruptions):
@@ -116,7 +112,11 @@ def timetable_from_departure(current_departure):
     return timetable
 
 
-def next_trains(stop_area_id: str, timetable_for_all_trains: bool = False):
+def next_trains(
+    stop_area_id: str,
+    timetable_for_all_trains: bool = False,
+    timetable_timeout_in_s: float = TIMETABLE_TIMEOUT_IN_S,
+):
     # check parameters
     check_params(stop_area_id)
 
@@ -126,6 +126,7 @@ def next_trains(stop_area_id: str, timetable_for_all_trains: bool = False):
         return []
 
     trains = []
+    timetable_departures = []
 
     # extract data for each depature
     for i, current_departure in enumerate(departures["departures"]):
@@ -155,8 +156,19 @@ def next_trains(stop_area_id: str, timetable_for_all_trains: bool = False):
 
         # get timetables for 2nd and following trains if requested
         if i == 0 or timetable_for_all_trains:
-            train_data["timetable"] = timetable_from_departure(current_departure)
+            timetable_departures.append((train_data, current_departure))
 
         trains.append(train_data)
 
+    # fetch timetables concurrently (empty timetable if failed or too slow)
+    timetables = parallel.map_with_deadline(
+        timetable_from_departure,
+        [current_departure for _, current_departure in timetable_departures],
+        executor=parallel.shared_executor("sncf-timetable", TIMETABLE_MAX_WORKERS),
+        timeout_in_s=timetable_timeout_in_s,
+        default=[],
+    )
+    for (train_data, _), timetable in zip(timetable_departures, timetables):
+        train_data["timetable"] = timetable
+
     return trains
@@ -23,7 +23,7 @@ class ViewModelSncf(view_model.ViewModel):
 class ViewModelSncf_192_32(ViewModelSncf):
     def __init__(self):
         self.board_text = contents.BoardText(
-            font=contents.read_bdf_font("fonts/6x10_condensed.bdf"),
+            font=contents.load_font("fonts/6x10_condensed.bdf"),
             colour_map={
                 "orange": (255, 204, 0),
                 "red": (255, 0, 0),
@@ -158,6 +158,7 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
     def __init__(self, board_manager_stub: departure_pb2_grpc.BoardManagerStub):
         super().__init__()
         self.board_manager_stub = board_manager_stub
+        self.section_update_tracker = view_model.SectionUpdateTracker()
 
         self.next_train_tracker = [
             departure_pb2.Movement(
@@ -193,8 +194,8 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=0,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(top_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=top_section_content_pixels,
                     content_w=top_section_content_pixels_size[0],
                     content_h=top_section_content_pixels_size[1],
                     repeat_x=False,
@@ -209,8 +210,8 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=1,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(middle_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=middle_section_content_pixels,
                     content_w=middle_section_content_pixels_size[0] + 192,
                     content_h=middle_section_content_pixels_size[1],
                     repeat_x=True,
@@ -239,8 +240,8 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=2,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(bottom_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=bottom_section_content_pixels,
                     content_w=bottom_section_content_pixels_size[0],
                     content_h=bottom_section_content_pixels_size[1],
                     repeat_x=True,
@@ -251,6 +252,11 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
             )
         )
 
+        # only send sections that changed since the last update
+        requests_data = self.section_update_tracker.changed_requests(requests_data)
+        if len(requests_data) == 0:
+            return
+
         # send gRPC message
         try:
             self.board_manager_stub.BoardSectionsUpdate(
@@ -259,3 +265,4 @@ class ViewModelSncf_192_32_3_Rows_To_ProtocolBuffers(ViewModelSncf_192_32):
         # pylint: disable=protected-access
         except (grpc._channel._Rendezvous, grpc._channel._InactiveRpcError):
             logger.warning("connection to board failed")
+            self.section_update_tracker.reset()
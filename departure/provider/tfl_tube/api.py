@@ -5,6 +5,8 @@ from typing import List
 
 import requests
 
+import departure.commons.http_sessions as http_sessions
+
 from . import commons
 
 logger = logging.getLogger(__name__)
@@ -20,7 +22,7 @@ def unified_api_request(base_url: str, base_queries: List[str] = None):
         url = f"{url}&{'&'.join(base_queries)}"
 
     try:
-        response = requests.get(url, timeout=15)
+        response = http_sessions.get(url, timeout=15)
     except requests.exceptions.Timeout:
         logger.warning("TfL unified API HTTP request timed out")
         return None
@@ -42,6 +44,12 @@ def line_stoppoints(line_id):
     return stoppoints
 
 
+def line_route_sequence(line_id):
+    # ordered stop points of all routes of line (orderedLineRoutes)
+    base_url = f"https://api.tfl.gov.uk/Line/{line_id}/Route/Sequence/all"
+    return unified_api_request(base_url)
+
+
 def line_arrivals(
     line_ids: List[str], station_id: str = ""  # default: all stations on lines
 ):
@@ -49,6 +57,11 @@ def line_arrivals(
     return unified_api_request(base_url)
 
 
+def stoppoint_arrivals(stoppoint_ids: List[str]):
+    base_url = f"https://api.tfl.gov.uk/StopPoint/{','.join(stoppoint_ids)}/Arrivals"
+    return unified_api_request(base_url)
+
+
 def tube_arrivals(count: int = 2):
     base_url = "https://api.tfl.gov.uk/Mode/tube/Arrivals"
     base_queries = [f"count={count}"]
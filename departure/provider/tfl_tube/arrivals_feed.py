@@ -0,0 +1,129 @@
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple, Union
+
+from . import api, tfl_tube
+
+logger = logging.getLogger(__name__)
+
+# maximum age of shared arrivals, i.e. upstream refresh interval
+ARRIVALS_MAX_AGE_IN_S = float(os.environ.get("TFL_ARRIVALS_MAX_AGE_IN_S", "15"))
+
+
+class ArrivalsSnapshot:
+    """Arrivals on a set of lines at a point in time, indexed by line and
+    station, and by line and station where trains currently are."""
+
+    def __init__(self, line_ids: Iterable[str], arrivals: List[dict]):
+        self.line_ids = frozenset(line_ids)
+        self.fetch_time = time.monotonic()
+        self.arrivals = arrivals
+
+        self.by_line_station: Dict[Tuple[str, str], List[dict]] = {}
+        self.by_line_current_station: Dict[Tuple[str, str], List[dict]] = {}
+
+        for arrival in arrivals:
+            line_id = arrival["lineId"]
+            station_id = arrival["naptanId"]
+            self.by_line_station.setdefault((line_id, station_id), []).append(
+                arrival
+            )
+
+            (
+                current_station_id,
+                _,
+            ) = tfl_tube.current_station_platform_number_from_current_location(
+                arrival["currentLocation"],
+                line_id,
+                station_id,
+                arrival["platformName"],
+            )
+            if current_station_id is not None:
+                self.by_line_current_station.setdefault(
+                    (line_id, current_station_id), []
+                ).append(arrival)
+
+    def arrivals_at(self, line_ids: List[str], station_id: str) -> List[dict]:
+        return [
+            arrival
+            for line_id in line_ids
+            for arrival in self.by_line_station.get((line_id, station_id), [])
+        ]
+
+    def arrivals_currently_at(self, line_ids: List[str], station_id: str) -> List[dict]:
+        return [
+            arrival
+            for line_id in line_ids
+            for arrival in self.by_line_current_station.get((line_id, station_id), [])
+        ]
+
+
+class ArrivalsFeed:
+    """Arrivals on all lines subscribed to (e.g. by board data updaters),
+    fetched from the TfL API once per max_age_in_s whatever the number of
+    subscribers, and shared between them."""
+
+    def __init__(self, max_age_in_s: float = ARRIVALS_MAX_AGE_IN_S):
+        self.max_age_in_s = max_age_in_s
+        self.fetch_count = 0
+        self._subscriptions = Counter()
+        self._snapshot = None
+        self._last_fetch_time = None
+        self._lock = threading.Lock()  # also held while fetching (single fetch)
+
+    def subscribe(self, line_ids: Iterable[str]):
+        with self._lock:
+            self._subscriptions.update(line_ids)
+
+    def unsubscribe(self, line_ids: Iterable[str]):
+        with self._lock:
+            self._subscriptions.subtract(line_ids)
+            self._subscriptions = +self._subscriptions  # drop unsubscribed lines
+
+    def subscribed_line_ids(self) -> List[str]:
+        with self._lock:
+            return sorted(self._subscriptions)
+
+    def snapshot(self, line_ids: Iterable[str]) -> Union[ArrivalsSnapshot, None]:
+        # returns arrivals covering line_ids, fetched at most max_age_in_s ago,
+        # or None if fetch failed
+        line_ids = set(line_ids)
+
+        with self._lock:
+            is_fresh = (
+                self._last_fetch_time is not None
+                and time.monotonic() - self._last_fetch_time < self.max_age_in_s
+            )
+            if is_fresh and (
+                self._snapshot is None  # failed: don't retry before max age
+                or line_ids <= self._snapshot.line_ids
+            ):
+                return self._snapshot
+
+            fetch_line_ids = sorted(line_ids | set(self._subscriptions))
+            arrivals = api.line_arrivals(fetch_line_ids)
+            self.fetch_count += 1
+            self._last_fetch_time = time.monotonic()
+
+            if arrivals is None:
+                logger.warning("could not fetch arrivals for %s", fetch_line_ids)
+                self._snapshot = None
+            else:
+                self._snapshot = ArrivalsSnapshot(fetch_line_ids, arrivals)
+
+            return self._snapshot
+
+
+def use_shared_arrivals() -> bool:
+    # shared arrivals are opt-in: they cover whole lines, whereas boards
+    # fetching for themselves only fetch arrivals around their station (see
+    # tfl_tube.AT_PLATFORM_ARRIVALS), so sharing only pays off with many boards
+    # on the same lines
+    return os.environ.get("TFL_SHARED_ARRIVALS", "").lower() in ("1", "true", "yes")
+
+
+# shared by all TfL Tube boards of the process (None: boards fetch their own)
+FEED = ArrivalsFeed() if use_shared_arrivals() else None
@@ -1,14 +1,25 @@
 import json
+import logging
 import pathlib
 import os
+import threading
+import time
+from typing import Tuple, Union
 
 import departure.commons.helpers as helpers
-from . import api
+import departure.commons.lazy as lazy
+import departure.commons.station_search as station_search
+from . import api, direction_tables
+
+logger = logging.getLogger(__name__)
 
 DATA_DIRNAME = "data"
 DATA_PATH = pathlib.Path(__file__).parents[0] / DATA_DIRNAME
 STATIONS_DATA_FILENAME = "stations.json"
 
+# delay before downloading routes of a line again after a failed download
+ROUTES_RETRY_DELAY_IN_S = 300
+
 lines = {
     "bakerloo": {
         "name": "Bakerloo",
@@ -599,7 +610,22 @@ hainault_loop_real_canonical_directions = [  # reserved for possible future use
 ]
 
 
-def stoppoints_by_line(line_id: str):
+# parsed line data, by line id (shared, must not be modified), each loaded
+# under its own lock so that a slow download only blocks callers for that line
+_stoppoints_by_line = {}
+_naptan_ids_by_line = {}
+_routes_by_line = {}
+_routes_failure_times = {}  # line id -> time of last failed routes download
+_line_data_locks = {}  # (data kind, line id) -> lock
+_line_data_locks_lock = threading.Lock()
+
+
+def _line_data_lock(kind: str, line_id: str) -> threading.Lock:
+    with _line_data_locks_lock:
+        return _line_data_locks.setdefault((kind, line_id), threading.Lock())
+
+
+def _load_stoppoints(line_id: str):
     line_data_file_name = DATA_PATH / (line_id + ".json")
 
     if os.path.exists(line_data_file_name):
@@ -610,12 +636,128 @@ def stoppoints_by_line(line_id: str):
     else:
         # download missing line data otherwise
         stoppoints = api.line_stoppoints(line_id)
-        with open(line_data_file_name, "w") as line_data_file:
-            json.dump(stoppoints, line_data_file)
+        if stoppoints is not None:
+            with open(line_data_file_name, "w") as line_data_file:
+                json.dump(stoppoints, line_data_file)
 
     return stoppoints
 
 
+def stoppoints_by_line(line_id: str):
+    # loaded once per line
+    if line_id in _stoppoints_by_line:
+        return _stoppoints_by_line[line_id]
+
+    with _line_data_lock("stoppoints", line_id):
+        if line_id not in _stoppoints_by_line:
+            stoppoints = _load_stoppoints(line_id)
+            if stoppoints is None:  # download failed, try again next time
+                return None
+            _stoppoints_by_line[line_id] = stoppoints
+        return _stoppoints_by_line[line_id]
+
+
+def naptan_ids_by_line(line_id: str) -> Tuple[str, ...]:
+    if line_id in _naptan_ids_by_line:
+        return _naptan_ids_by_line[line_id]
+
+    stoppoints = stoppoints_by_line(line_id)
+    if stoppoints is None:
+        return ()
+
+    with _line_data_lock("stoppoints", line_id):
+        if line_id not in _naptan_ids_by_line:
+            _naptan_ids_by_line[line_id] = tuple(
+                stoppoint["naptanId"] for stoppoint in stoppoints
+            )
+        return _naptan_ids_by_line[line_id]
+
+
+def _load_routes(line_id: str):
+    line_routes_file_name = DATA_PATH / (line_id + ".routes.json")
+
+    if os.path.exists(line_routes_file_name):
+        # read data from file if it exists
+        with open(line_routes_file_name, "r", encoding="utf-8") as line_routes_file:
+            routes = json.load(line_routes_file)
+
+    else:
+        # download missing route data otherwise (only keeping stop point ids)
+        route_sequence = api.line_route_sequence(line_id)
+        if route_sequence is None:
+            return None
+        routes = [
+            ordered_route["naptanIds"]
+            for ordered_route in route_sequence.get("orderedLineRoutes", [])
+        ]
+
+        # cache to file if possible (e.g. not a read-only install), otherwise
+        # keep routes in memory only
+        try:
+            with open(line_routes_file_name, "w") as line_routes_file:
+                json.dump(routes, line_routes_file)
+        except OSError as e:
+            logger.warning("could not save routes %s: %s", line_routes_file_name, e)
+
+    return routes
+
+
+def routes_by_line(line_id: str):
+    # ordered stop point ids of each route of line, loaded once per line, or
+    # None if not available yet (being downloaded by another caller, or
+    # download failed less than ROUTES_RETRY_DELAY_IN_S ago)
+    if line_id in _routes_by_line:
+        return _routes_by_line[line_id]
+
+    line_lock = _line_data_lock("routes", line_id)
+    if not line_lock.acquire(blocking=False):
+        return None
+
+    try:
+        if line_id not in _routes_by_line:
+            failure_time = _routes_failure_times.get(line_id)
+            if (
+                failure_time is not None
+                and time.monotonic() - failure_time < ROUTES_RETRY_DELAY_IN_S
+            ):
+                return None
+
+            routes = _load_routes(line_id)
+            if routes is None:
+                logger.warning(
+                    "could not load routes of %s, retrying in %s s",
+                    line_id,
+                    ROUTES_RETRY_DELAY_IN_S,
+                )
+                _routes_failure_times[line_id] = time.monotonic()
+                return None
+            _routes_by_line[line_id] = routes
+        return _routes_by_line[line_id]
+    finally:
+        line_lock.release()
+
+
+def adjacent_station_ids(
+    line_id: str, station_id: str, max_stops: int = 2
+) -> Union[Tuple[str, ...], None]:
+    """Returns the stations up to max_stops stops away from station on line
+    (either side, on all routes), or None if the line's routes are unknown."""
+    routes = routes_by_line(line_id)
+    if not routes:
+        return None
+
+    station_ids = []
+    for route in routes:
+        for i, route_station_id in enumerate(route):
+            if route_station_id != station_id:
+                continue
+            for adjacent_station_id in route[max(i - max_stops, 0) : i + max_stops + 1]:
+                if adjacent_station_id not in station_ids:
+                    station_ids.append(adjacent_station_id)
+
+    return tuple(station_ids)
+
+
 def add_line_data_to_stations_dict(stations_dict: dict, line_id: str):
     stoppoints = stoppoints_by_line(line_id)
 
@@ -656,11 +798,11 @@ def _stations(data_path, stations_data_filename):
     # otherwise generate data from individual line files
     stations = {}
     for line_id in lines:
-        stations = add_line_data_to_stations_dict(_stations, line_id)
+        stations = add_line_data_to_stations_dict(stations, line_id)
 
-    # read data from file
+    # write data to file
     with open(stations_data_file_path, "w") as stations_file:
-        json.dump(_stations, stations_file)
+        json.dump(stations, stations_file)
 
     return stations
 
@@ -669,5 +811,20 @@ def _station_id_by_name(stations):
     return {stations[station_id]["name"]: station_id for station_id in stations}
 
 
-STATIONS = _stations(DATA_PATH, STATIONS_DATA_FILENAME)
-STATION_ID_BY_NAME = _station_id_by_name(STATIONS)
+# loaded on first access
+__getattr__ = lazy.lazy_attributes(
+    __name__,
+    {
+        "STATIONS": lambda: _stations(DATA_PATH, STATIONS_DATA_FILENAME),
+        "STATION_ID_BY_NAME": lambda: _station_id_by_name(__getattr__("STATIONS")),
+        "STATION_SEARCH_INDEX": lambda: station_search.StationSearchIndex(
+            __getattr__("STATIONS"), lambda station: station["name"]
+        ),
+        "DIRECTION_TABLES": lambda: direction_tables.DirectionTables(
+            lines,
+            platform_name_prefix_direction,
+            circle_line_outer_rail_westbound_stations,
+            hainault_loop_outer_rail_outbound_stations,
+        ),
+    },
+)
@@ -1,13 +1,17 @@
 import time
 import threading
 import logging
+from typing import Union
 
 import departure.board.data_updater as data_updater
 from departure.commons.log import log_function_stdout_to_debug
-from . import view_model, tfl_tube, ui
+from . import view_model, tfl_tube, ui, data, arrivals_feed, train_tracker
 
 logger = logging.getLogger(__name__)
 
+# board refresh interval between updates, with counted-down times to station
+INTERPOLATION_INTERVAL_IN_S = 5
+
 
 class DataUpdaterTflTube(data_updater.DataUpdater):
     def __init__(
@@ -18,27 +22,71 @@ class DataUpdaterTflTube(data_updater.DataUpdater):
         line_id: str,
         station_id: str,
         direction: str,
+        feed: Union[arrivals_feed.ArrivalsFeed, None] = arrivals_feed.FEED,
     ):
         super().__init__(target_view_model, data_refresh_delay_in_s, end_event)
         self.line_id = line_id
         self.station_id = station_id
         self.direction = direction
         self.trains = None
+        self.train_tracker = train_tracker.TrainTracker()
+        self.tick_interval_in_s = INTERPOLATION_INTERVAL_IN_S
+
+        # arrivals shared with other boards (None: fetch for this board only)
+        self.feed = feed
+        self.line_ids = [line_id] + data.lines[line_id].get("merged_lines", [])
+
+    def run(self):
+        if self.feed is None:
+            super().run()
+            return
+
+        self.feed.subscribe(self.line_ids)
+        try:
+            super().run()
+        finally:
+            self.feed.unsubscribe(self.line_ids)
+
+    def next_trains(self):
+        if self.feed is None:
+            return tfl_tube.next_trains(self.line_id, self.station_id, self.direction)
+
+        snapshot = self.feed.snapshot(self.line_ids)
+        if snapshot is None:
+            return {}
+
+        return tfl_tube.next_trains_from_snapshot(
+            snapshot, self.line_id, self.station_id, self.direction
+        )
 
     def update(self):
         update_start_time = time.monotonic()
         logger.info("data refresh started at %s", update_start_time)
 
-        trains = tfl_tube.next_trains(self.line_id, self.station_id, self.direction)
+        trains = self.next_trains()
 
         # debugging: capture list of trains to string, then log
         log_function_stdout_to_debug(logger, ui.list_trains_single_station, trains)
 
+        for event in self.train_tracker.update(trains):
+            logger.debug("train %s %s", event.train_id, event.kind)
+
         # update board only if there were changes
-        if trains == self.trains:
+        if not self.update_board():
             logger.info("no change - no update sent to board")
-        else:
-            self.view_model.update(trains)
-            self.trains = trains
 
         logger.info("data refresh duration %s", time.monotonic() - update_start_time)
+
+    def tick(self):
+        self.update_board()
+
+    def update_board(self) -> bool:
+        # returns True if trains changed (view model then only redraws sections
+        # with changed displayed text)
+        trains = self.train_tracker.trains()
+        if trains == self.trains:
+            return False
+
+        self.view_model.update(trains)
+        self.trains = trains
+        return True
@@ -0,0 +1,86 @@
+"""
+Direction resolution tables, compiled once from line data
+
+Lookups replacing walks through nested line data (and the exceptions raised by
+missing keys) when filtering arrivals, and memoised results for values that
+repeat across arrivals (e.g. platform names).
+"""
+
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Union
+
+PLATFORM_DIRECTIONS_MAX_SIZE = 4096
+
+
+class Terminus(NamedTuple):
+    is_inline: bool
+    arrival: str
+    arrival_canonical_direction: Union[str, None]
+    arrival_rail: Union[str, None]
+    inverse_terminating_stations: FrozenSet[str]
+
+
+class DirectionTables:
+    def __init__(
+        self,
+        lines: dict,
+        platform_name_prefix_direction: Dict[str, str],
+        circle_line_outer_rail_westbound_stations: Iterable[str],
+        hainault_loop_outer_rail_outbound_stations: Iterable[str],
+    ):
+        # line id -> platform direction -> canonical direction (none on circle)
+        self.canonical_directions: Dict[str, Dict[str, str]] = {
+            line_id: dict(line["canonical_directions"]) if line_id != "circle" else {}
+            for line_id, line in lines.items()
+        }
+
+        # line id -> terminus id -> terminus
+        self.termini: Dict[str, Dict[str, Terminus]] = {
+            line_id: {
+                terminus_id: Terminus(
+                    is_inline=terminus["is_inline"],
+                    arrival=terminus["arrival"],
+                    arrival_canonical_direction=line["canonical_directions"].get(
+                        terminus["arrival"]
+                    ),
+                    arrival_rail=terminus.get("arrival_rail"),
+                    inverse_terminating_stations=frozenset(
+                        terminus.get("stations_inverse_terminating_direction", [])
+                        if terminus["is_inline"]
+                        else []
+                    ),
+                )
+                for terminus_id, terminus in line["termini"].items()
+            }
+            for line_id, line in lines.items()
+        }
+
+        self.circle_line_outer_rail_westbound_stations = frozenset(
+            circle_line_outer_rail_westbound_stations
+        )
+        self.hainault_loop_outer_rail_outbound_stations = frozenset(
+            hainault_loop_outer_rail_outbound_stations
+        )
+
+        self._platform_name_prefixes = tuple(platform_name_prefix_direction.items())
+        self._platform_directions = {}  # platform name -> direction
+
+    def terminus(self, line_id: str, station_id: str) -> Union[Terminus, None]:
+        termini = self.termini.get(line_id)
+        return None if termini is None else termini.get(station_id)
+
+    def platform_direction(self, platform_name: str) -> Union[str, None]:
+        # direction from first matching platform name prefix, memoised as
+        # there are few distinct platform names
+        if platform_name in self._platform_directions:
+            return self._platform_directions[platform_name]
+
+        direction = None
+        for prefix, prefix_direction in self._platform_name_prefixes:
+            if platform_name.startswith(prefix):
+                direction = prefix_direction
+                break
+
+        if len(self._platform_directions) >= PLATFORM_DIRECTIONS_MAX_SIZE:
+            self._platform_directions.clear()
+        self._platform_directions[platform_name] = direction
+        return direction
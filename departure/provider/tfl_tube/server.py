@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import tfl_tube, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -17,11 +20,15 @@ class StationDirection(BaseModel):
     line_id: str
     station_id: str
     direction: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 @router.get("/stations/{station_string_query}")
-async def search_stations(station_string_query: str):
-    return tfl_tube.stations_by_string(station_string_query)
+async def search_stations(station_string_query: str, limit: int = None):
+    return await parallel.run_blocking(
+        tfl_tube.stations_by_string, station_string_query, limit
+    )
 
 
 @router.get("/lines")
@@ -31,7 +38,7 @@ async def lines():
 
 @router.get("/stations-line/{line_id}")
 async def stations_line(line_id: str):
-    return tfl_tube.stations_by_line(line_id)
+    return await parallel.run_blocking(tfl_tube.stations_by_line, line_id)
 
 
 @router.get("/directions/{line_id}")
@@ -43,7 +50,9 @@ async def directions(line_id: str):
 @router.get("/next/{line_id}/{station_id}/{direction}")
 async def next_trains(line_id: str, station_id: str, direction: str):
     try:
-        departures = tfl_tube.next_trains(line_id, station_id, direction)
+        departures = await parallel.run_blocking(
+            tfl_tube.next_trains, line_id, station_id, direction
+        )
     except commons.TflTubeException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
@@ -57,7 +66,8 @@ async def next_trains(line_id: str, station_id: str, direction: str):
 async def start_client(station_direction: StationDirection, request: Request):
     # check params
     try:
-        tfl_tube.check_params(
+        await parallel.run_blocking(
+            tfl_tube.check_params,
             [station_direction.line_id],
             station_direction.station_id,
             station_direction.direction,
@@ -67,15 +77,11 @@ async def start_client(station_direction: StationDirection, request: Request):
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station_direction.board_id,
             view_model.ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers,
             data_updater.DataUpdaterTflTube,
             {
@@ -83,7 +89,10 @@ async def start_client(station_direction: StationDirection, request: Request):
                 "station_id": station_direction.station_id,
                 "direction": station_direction.direction,
             },
-        ],
-    ).start()
+            board_server=station_direction.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
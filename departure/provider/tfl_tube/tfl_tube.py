@@ -1,4 +1,5 @@
 import logging
+import os
 from typing import List, Any
 import re
 
@@ -6,6 +7,13 @@ from . import data, api, commons
 
 logger = logging.getLogger(__name__)
 
+# how to find trains currently at station (see arrivals_around_station)
+AT_PLATFORM_ARRIVALS = os.environ.get("TFL_AT_PLATFORM_ARRIVALS", "adjacent")
+
+# (towards, line id) -> station id
+STATION_IDS_BY_TOWARDS_MAX_SIZE = 4096
+_station_ids_by_towards = {}
+
 
 def check_params(line_ids: List[str] = None, station_id=None, direction=None):
     if not any((line_ids, station_id, direction)):
@@ -36,18 +44,8 @@ def check_params(line_ids: List[str] = None, station_id=None, direction=None):
                 )
 
 
-def stations_by_string(string: str) -> dict:
-    string = str(string).lower()
-    results = {}
-    stations = data.STATIONS
-
-    # iterate over stations
-    for station_id in stations:
-        # match?
-        if string in stations[station_id]["name"].lower():
-            results[station_id] = stations[station_id]
-
-    return results
+def stations_by_string(string: str, limit: int = None) -> dict:
+    return data.STATION_SEARCH_INDEX.search(string, limit)
 
 
 def lines() -> list:
@@ -55,14 +53,11 @@ def lines() -> list:
 
 
 def stations_by_line(line_id: str) -> dict:
-    results = {}
     stations = data.STATIONS
-    stoppoints = data.stoppoints_by_line(line_id)
 
-    for stoppoint in stoppoints:
-        results[stoppoint["naptanId"]] = stations[stoppoint["naptanId"]]
-
-    return results
+    return {
+        naptan_id: stations[naptan_id] for naptan_id in data.naptan_ids_by_line(line_id)
+    }
 
 
 def directions(line_id: str) -> dict:
@@ -297,7 +292,239 @@ def filter_trains_currently_at_platform(
     return trains
 
 
-def next_trains(line_id: str, station_id: str, requested_direction: str = None):
+class ArrivalColumns:  # pylint: disable=too-few-public-methods
+    """Arrivals as columns (one list per field), for batch filtering."""
+
+    def __init__(self, arrivals: List[Any]):
+        self.line_ids = [arrival["lineId"] for arrival in arrivals]
+        self.vehicle_ids = [arrival["vehicleId"] for arrival in arrivals]
+        self.station_ids = [arrival["naptanId"] for arrival in arrivals]
+        self.platform_names = [arrival["platformName"] for arrival in arrivals]
+        self.towards = [arrival["towards"] for arrival in arrivals]
+        self.current_locations = [
+            arrival.get("currentLocation", "") for arrival in arrivals
+        ]
+        self.canonical_directions = [arrival.get("direction") for arrival in arrivals]
+        self.destination_station_ids = [
+            arrival.get("destinationNaptanId") for arrival in arrivals
+        ]
+        self.times_to_station = [arrival.get("timeToStation") for arrival in arrivals]
+
+    def __len__(self):
+        return len(self.line_ids)
+
+    def first_rows_by_train(self) -> List[int]:
+        # index of first arrival of each train, in order
+        first_rows = {}
+        for row, train_key in enumerate(zip(self.line_ids, self.vehicle_ids)):
+            first_rows.setdefault(train_key, row)
+        return list(first_rows.values())
+
+
+def filter_trains_by_direction_of_departure_batch(
+    columns: ArrivalColumns,
+    requested_direction: str,
+    conservative: bool = False,  # also match uncertain directions
+):
+    """Same as filter_trains_by_direction_of_departure, resolving each distinct
+    towards value, platform name and set of direction inputs once per batch."""
+    trains = {}
+    departs = {}  # direction inputs -> will depart in requested direction
+
+    for row, (line_id, vehicle_id) in enumerate(
+        zip(columns.line_ids, columns.vehicle_ids)
+    ):
+        # ignore duplicate trains
+        if (line_id, vehicle_id) in trains:
+            continue
+
+        station_id = columns.station_ids[row]
+        towards_station_id = station_id_from_towards(columns.towards[row], line_id)
+        direction_inputs = (
+            line_id,
+            station_id,
+            towards_station_id,
+            departure_direction_from_platform_name(columns.platform_names[row]),
+            columns.canonical_directions[row],
+            columns.destination_station_ids[row],
+        )
+        if direction_inputs not in departs:
+            departs[direction_inputs] = (
+                will_arriving_train_depart_from_station_in_direction(
+                    line_id,
+                    station_id,
+                    requested_direction,
+                    towards_station_id,
+                    platform_departure_direction=direction_inputs[3],
+                    train_canonical_direction=direction_inputs[4],
+                    destination_station_id=direction_inputs[5],
+                )
+            )
+        will_depart_in_requested_direction = departs[direction_inputs]
+
+        # ignore if not departing in requested direction
+        if not will_depart_in_requested_direction:
+            continue
+
+        # ignore if can't determine departing direction and conservative
+        if will_depart_in_requested_direction is None and conservative:
+            continue
+
+        trains[(line_id, vehicle_id)] = {
+            "line_id": line_id,
+            "vehicle_id": vehicle_id,
+            "station_id": station_id,
+            "towards": columns.towards[row],
+            "towards_station_id": towards_station_id,
+            "platform_name": columns.platform_names[row],
+            "platform_number": number_from_platform_name(columns.platform_names[row]),
+            "destination_station_id": columns.destination_station_ids[row],
+            "time_to_station": columns.times_to_station[row],
+        }
+
+    return {
+        f"{line_id}-{vehicle_id}": train
+        for (line_id, vehicle_id), train in trains.items()
+    }
+
+
+def filter_trains_currently_at_platform_batch(
+    columns: ArrivalColumns,
+    line_ids: List[str] = None,
+    requested_station_id: str = None,
+    requested_direction: str = None,
+):
+    """Same as filter_trains_currently_at_platform, evaluating line and station
+    predicates first, and parsing each distinct current location once per
+    batch."""
+    rows = columns.first_rows_by_train()
+
+    # line predicate
+    if line_ids is not None:
+        line_ids = set(line_ids)
+        rows = [row for row in rows if columns.line_ids[row] in line_ids]
+
+    # current location of trains (if at a station)
+    locations = {}  # current location -> (location, platform number)
+    location_station_ids = {}  # (location, line id) -> station id
+    current_station_ids = {}  # row -> station id
+    for row in rows:
+        current_location = columns.current_locations[row]
+        if current_location not in locations:
+            locations[current_location] = location_platform_from_current_location(
+                current_location
+            )
+        location, _ = locations[current_location]
+
+        if location == "<current>":
+            current_station_id = columns.station_ids[row]
+        else:
+            location_key = (location, columns.line_ids[row])
+            if location_key not in location_station_ids:
+                location_station_ids[location_key] = station_from_location(
+                    location, None, columns.line_ids[row]
+                )
+            current_station_id = location_station_ids[location_key]
+
+        # station predicate
+        if current_station_id is None or (
+            requested_station_id is not None
+            and current_station_id != requested_station_id
+        ):
+            continue
+        current_station_ids[row] = current_station_id
+
+    trains = {}
+    departs = {}  # direction inputs -> will depart in requested direction
+
+    for row, current_station_id in current_station_ids.items():
+        line_id = columns.line_ids[row]
+        towards_station_id = station_id_from_towards(columns.towards[row], line_id)
+
+        # direction predicate
+        if requested_direction is not None:
+            direction_inputs = (
+                current_station_id,
+                line_id,
+                columns.station_ids[row],
+                towards_station_id,
+                departure_direction_from_platform_name(columns.platform_names[row]),
+                columns.canonical_directions[row],
+                columns.destination_station_ids[row],
+            )
+            if direction_inputs not in departs:
+                departs[direction_inputs] = (
+                    will_arriving_train_depart_from_current_location_in_direction(
+                        direction_inputs[0],
+                        line_id,
+                        direction_inputs[2],
+                        requested_direction,
+                        towards_station_id,
+                        *direction_inputs[4:],
+                    )
+                )
+            if not departs[direction_inputs]:
+                continue
+
+        platform_number = locations[columns.current_locations[row]][1]
+        if platform_number == "<current>":
+            platform_number = number_from_platform_name(columns.platform_names[row])
+
+        vehicle_id = columns.vehicle_ids[row]
+        trains[f"{line_id}-{vehicle_id}"] = {
+            "line_id": line_id,
+            "vehicle_id": vehicle_id,
+            "station_id": current_station_id,
+            "towards": columns.towards[row],
+            "towards_station_id": towards_station_id,
+            "platform_number": platform_number,
+            "destination_station_id": columns.destination_station_ids[row],
+            "time_to_station": 0,
+        }
+
+    return trains
+
+
+def arrivals_around_station(
+    line_ids: List[str], station_id: str, strategy: str = AT_PLATFORM_ARRIVALS
+):
+    """Returns arrivals including those of trains currently at station, which
+    are only listed as arriving at the next stations on their line:
+    - "adjacent": arrivals at station and nearby stations on lines
+    - "line": arrivals at all stations on lines
+    - "network": arrivals at all stations on the whole network (largest)"""
+
+    if strategy == "adjacent":
+        station_ids = [station_id]
+        for line_id in line_ids:
+            adjacent_station_ids = data.adjacent_station_ids(line_id, station_id)
+            if adjacent_station_ids is None:  # unknown routes, fall back
+                strategy = "line"
+                break
+            station_ids.extend(
+                adjacent_station_id
+                for adjacent_station_id in adjacent_station_ids
+                if adjacent_station_id not in station_ids
+            )
+        else:
+            arrivals = api.stoppoint_arrivals(station_ids)
+            if arrivals is None:
+                return None
+            # stop points are served by other lines too
+            return [arrival for arrival in arrivals if arrival["lineId"] in line_ids]
+
+    if strategy == "line":
+        return api.line_arrivals(line_ids)
+
+    return api.tube_arrivals(count=2)  # use -1 for debugging
+
+
+def next_trains(
+    line_id: str,
+    station_id: str,
+    requested_direction: str = None,
+    at_platform_arrivals: str = AT_PLATFORM_ARRIVALS,
+):
     # check parameters
     check_params([line_id], station_id, requested_direction)
 
@@ -311,16 +538,18 @@ def next_trains(line_id: str, station_id: str, requested_direction: str = None):
 
     # filter by direction if requested
     if requested_direction is not None:
-        trains = filter_trains_by_direction_of_departure(arrivals, requested_direction)
+        trains = filter_trains_by_direction_of_departure_batch(
+            ArrivalColumns(arrivals), requested_direction
+        )
 
-    # get all trains including those at station of interest
-    arrivals = api.tube_arrivals(count=2)  # use -1 for debugging
+    # get trains including those at station of interest
+    arrivals = arrivals_around_station(line_ids, station_id, at_platform_arrivals)
     if arrivals is None:
         return trains
 
     # filter by current station (and direction of departure if requested)
-    trains_currently_at_platform = filter_trains_currently_at_platform(
-        arrivals, line_ids, station_id, requested_direction
+    trains_currently_at_platform = filter_trains_currently_at_platform_batch(
+        ArrivalColumns(arrivals), line_ids, station_id, requested_direction
     )
 
     # merge next and current (will overwrite next)
@@ -329,6 +558,31 @@ def next_trains(line_id: str, station_id: str, requested_direction: str = None):
     return trains
 
 
+def next_trains_from_snapshot(
+    snapshot, line_id: str, station_id: str, requested_direction: str = None
+):
+    # same as next_trains, from shared arrivals (see arrivals_feed)
+    check_params([line_id], station_id, requested_direction)
+
+    line_ids = [line_id] + data.lines[line_id].get("merged_lines", [])
+
+    trains = filter_trains_by_direction_of_departure_batch(
+        ArrivalColumns(snapshot.arrivals_at(line_ids, station_id)),
+        requested_direction,
+    )
+
+    trains.update(
+        filter_trains_currently_at_platform_batch(
+            ArrivalColumns(snapshot.arrivals_currently_at(line_ids, station_id)),
+            line_ids,
+            station_id,
+            requested_direction,
+        )
+    )
+
+    return trains
+
+
 def number_from_platform_name(platform_name: str):
     if "Platform " in platform_name:
         return platform_name.split("Platform ")[1]
@@ -336,25 +590,17 @@ def number_from_platform_name(platform_name: str):
 
 
 def departure_direction_from_platform_name(platform_name: str):
-    # platform name contains both direction and platform number
-    for prefix in data.platform_name_prefix_direction:
-        if platform_name.startswith(prefix):
-            return data.platform_name_prefix_direction[prefix]
-
-    # otherwise need to figure out things differently
-    return None
+    # platform name contains both direction and platform number, otherwise
+    # need to figure out things differently (None)
+    return data.DIRECTION_TABLES.platform_direction(platform_name)
 
 
 def canonical_direction_from_platform_direction(line_id, direction):
-    if line_id not in data.lines or line_id == "circle":
+    # None on Circle Line
+    canonical_directions = data.DIRECTION_TABLES.canonical_directions.get(line_id)
+    if canonical_directions is None:
         return None
-
-    try:
-        return data.lines[line_id]["canonical_directions"][direction]
-    except Exception:  # pylint: disable=broad-except
-        pass  # passthrough to default
-
-    return None
+    return canonical_directions.get(direction)
 
 
 def circle_line_rail_arriving_at_station(
@@ -363,30 +609,26 @@ def circle_line_rail_arriving_at_station(
     destination_station_id: str = None,
     towards_station_id: str = None,
 ):
+    tables = data.DIRECTION_TABLES
+
     # if destination is known
-    if destination_station_id is not None:
-        try:
-            return data.lines["circle"]["termini"][destination_station_id][
-                "arrival_rail"
-            ]
-        except Exception:  # pylint: disable=broad-except
-            pass
+    terminus = tables.termini["circle"].get(destination_station_id)
+    if terminus is not None:
+        return terminus.arrival_rail
 
     # if towards is known
-    if towards_station_id is not None:
-        try:
-            return data.lines["circle"]["termini"][towards_station_id]["arrival_rail"]
-        except Exception:  # pylint: disable=broad-except
-            pass
+    terminus = tables.termini["circle"].get(towards_station_id)
+    if terminus is not None:
+        return terminus.arrival_rail
 
     # if direction is known from platform name (should cover remaining cases)
     if platform_departure_direction == "Westbound":
-        if station_id in data.circle_line_outer_rail_westbound_stations:
+        if station_id in tables.circle_line_outer_rail_westbound_stations:
             return "Outer Rail"
         else:
             return "Inner Rail"
     elif platform_departure_direction == "Eastbound":
-        if station_id in data.circle_line_outer_rail_westbound_stations:
+        if station_id in tables.circle_line_outer_rail_westbound_stations:
             return "Inner Rail"
         else:
             return "Outer Rail"
@@ -403,31 +645,17 @@ def canonical_direction_of_train_from_station_terminating_at(
     line_id, station_id, terminus_station_id
 ):
     # normal terminating direction
-    try:
-        terminating_canonical_direction = data.lines[line_id]["canonical_directions"][
-            data.lines[line_id]["termini"][terminus_station_id]["arrival"]
-        ]
-    except Exception:  # pylint: disable=broad-except
+    terminus = data.DIRECTION_TABLES.terminus(line_id, terminus_station_id)
+    if terminus is None:
         return None  # not a terminus
 
     # handle stations with inverse terminating directions at inline stations,
     # e.g. trains from EBY/central at end of service, terminating at WYC
     # (normally a Westbound inline terminus)
-    try:
-        if (
-            data.lines[line_id]["termini"][terminus_station_id]["is_inline"]
-            and station_id
-            in data.lines[line_id]["termini"][terminus_station_id][
-                "stations_inverse_terminating_direction"
-            ]
-        ):
-            terminating_canonical_direction = inverse_canonical_direction(
-                terminating_canonical_direction
-            )
-    except Exception:  # pylint: disable=broad-except
-        pass
+    if station_id in terminus.inverse_terminating_stations:
+        return inverse_canonical_direction(terminus.arrival_canonical_direction)
 
-    return terminating_canonical_direction
+    return terminus.arrival_canonical_direction
 
 
 def resolve_train_canonical_direction(
@@ -493,7 +721,8 @@ def resolve_train_canonical_direction(
     if train_canonical_direction is not None:
         # inverse declared canonical direction if north of HLT on HLT loop
         # (see data)
-        if station_id in data.hainault_loop_outer_rail_outbound_stations:
+        tables = data.DIRECTION_TABLES
+        if station_id in tables.hainault_loop_outer_rail_outbound_stations:
             train_canonical_direction = inverse_canonical_direction(
                 train_canonical_direction
             )
@@ -623,12 +852,10 @@ def will_arriving_train_depart_from_current_location_in_direction(
 
     # if train terminates at station, get arrival direction from terminus data
     if is_station_terminus:
-        try:
-            platform_arrival_direction = data.lines[line_id]["termini"][station_id][
-                "arrival"
-            ]
-        except Exception:  # pylint: disable=broad-except
+        terminus = data.DIRECTION_TABLES.terminus(line_id, station_id)
+        if terminus is None:
             return False
+        platform_arrival_direction = terminus.arrival
     # otherwise arrival direction and departure direction are identical
     else:
         platform_arrival_direction = platform_departure_direction
@@ -701,6 +928,16 @@ def station_id_from_station_name(station_name: str, line_id: str):
 
 
 def station_id_from_towards(towards: str, line_id: str):
+    # memoised, as the same few towards values are found in most arrivals
+    key = (towards, line_id)
+    if key not in _station_ids_by_towards:
+        if len(_station_ids_by_towards) >= STATION_IDS_BY_TOWARDS_MAX_SIZE:
+            _station_ids_by_towards.clear()
+        _station_ids_by_towards[key] = _station_id_from_towards(towards, line_id)
+    return _station_ids_by_towards[key]
+
+
+def _station_id_from_towards(towards: str, line_id: str):
     if towards == "Check Front of Train":
         return None
 
@@ -734,10 +971,11 @@ def is_station_terminus_for_train(
         return station_id == towards_station_id
 
     # if station is a terminus
-    if station_id in data.lines[line_id]["termini"]:
+    terminus = data.DIRECTION_TABLES.terminus(line_id, station_id)
+    if terminus is not None:
         # can't tell if inline (e.g. BKG/HLT), no destinationNaptanId,
         # towards="Check Front of Train"
-        if data.lines[line_id]["termini"][station_id]["is_inline"]:
+        if terminus.is_inline:
             return None
         # non-inline (e.g. WIM)
         return True
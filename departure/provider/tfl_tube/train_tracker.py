@@ -0,0 +1,83 @@
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+# change of predicted time beyond local countdown reported as time change
+TIME_CHANGE_TOLERANCE_IN_S = 30
+
+Trains = Dict[str, dict]  # train id (line_id-vehicle_id) -> train
+
+
+class TrainEvent(NamedTuple):
+    kind: str  # "arrived", "departed", "changed" or "time_changed"
+    train_id: str
+    train: dict  # last known train data
+
+
+class TrainTracker:
+    """Tracks trains across polls of predictions, reporting trains appearing
+    (arrived), disappearing (departed), changing (e.g. platform, towards), or
+    with a time to station differing from the local countdown (time_changed).
+
+    Times to station are counted down locally between polls."""
+
+    def __init__(
+        self,
+        time_change_tolerance_in_s: float = TIME_CHANGE_TOLERANCE_IN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.time_change_tolerance_in_s = time_change_tolerance_in_s
+        self.clock = clock
+        self._trains: Trains = {}
+        self._poll_time = None
+
+    def update(self, trains: Trains, now: float = None) -> List[TrainEvent]:
+        if now is None:
+            now = self.clock()
+
+        expected_trains = self.trains(now)
+        events = []
+
+        for train_id, train in trains.items():
+            expected_train = expected_trains.get(train_id)
+            if expected_train is None:
+                events.append(TrainEvent("arrived", train_id, train))
+                continue
+
+            if any(
+                train[key] != expected_train.get(key)
+                for key in train
+                if key != "time_to_station"
+            ):
+                events.append(TrainEvent("changed", train_id, train))
+
+            if (
+                abs(train["time_to_station"] - expected_train["time_to_station"])
+                > self.time_change_tolerance_in_s
+            ):
+                events.append(TrainEvent("time_changed", train_id, train))
+
+        for train_id, train in expected_trains.items():
+            if train_id not in trains:
+                events.append(TrainEvent("departed", train_id, train))
+
+        self._trains = dict(trains)
+        self._poll_time = now
+
+        return events
+
+    def trains(self, now: float = None) -> Trains:
+        # trains as of last poll, with times to station counted down since
+        if not self._trains:
+            return {}
+
+        if now is None:
+            now = self.clock()
+        elapsed_time = int(now - self._poll_time)
+
+        return {
+            train_id: {
+                **train,
+                "time_to_station": max(train["time_to_station"] - elapsed_time, 0),
+            }
+            for train_id, train in self._trains.items()
+        }
@@ -22,7 +22,7 @@ class ViewModelTflTube(view_model.ViewModel):
 class ViewModelTflTube_192_32(ViewModelTflTube):
     def __init__(self):
         self.board_text = contents.BoardText(
-            font=contents.read_bdf_font("fonts/6x10_proportional.bdf"),
+            font=contents.load_font("fonts/6x10_proportional.bdf"),
             colour_map={
                 "orange": (255, 204, 0),
                 "red": (255, 0, 0),
@@ -32,80 +32,74 @@ class ViewModelTflTube_192_32(ViewModelTflTube):
             tabs=[[0, "l"], [10, "l"], [191, "r"]],
         )
 
-    def pixels_single_line(self, train, pos: str):
-        return self.board_text.colour_text_tabbed_row_pixels(
-            [
-                [pos, "orange"],
-                [train["towards"], "orange"],
-                [helpers.arrival_time_en(train["time_to_station"]), "orange"],
-            ]
+    @staticmethod
+    def row_text(train, pos: str) -> tuple:
+        return (
+            (pos, "orange"),
+            (train["towards"], "orange"),
+            (helpers.arrival_time_en(train["time_to_station"]), "orange"),
         )
 
-    def next_content(self, next_trains):
+    def section_texts(self, next_trains) -> tuple:
+        """Returns the text rows displayed in each section, i.e. what the board
+        shows (times in minutes) rather than raw train data."""
+
         # empty board if called with None
         if next_trains is None:
-            return [], (0, 0), [], (0, 0), [], (0, 0)
+            return (), (), ()
 
         # sort trains by time to station
         next_trains = sorted(next_trains.values(), key=lambda a: a["time_to_station"])
 
-        # top section
-        if len(next_trains) == 0:  # "No service" if no service
-            top_section_content_pixels = []
-            top_section_content_pixels_size = (0, 0)
-        else:  # otherwise: 1st train
-            (
-                top_section_content_pixels,
-                top_section_content_pixels_size,
-            ) = self.pixels_single_line(next_trains[0], "1")
-
-        # middle section
-        if len(next_trains) < 2:  # nothing if fewer than 2 trains
-            middle_section_content_pixels = []
-            middle_section_content_pixels_size = (0, 0)
-        else:  # otherwise: 2nd train
-            (
-                middle_section_content_pixels,
-                middle_section_content_pixels_size,
-            ) = self.pixels_single_line(next_trains[1], "2")
+        # top section: 1st train (nothing if no service)
+        top_section_texts = ()
+        if len(next_trains) >= 1:
+            top_section_texts = (self.row_text(next_trains[0], "1"),)
+
+        # middle section: 2nd train (nothing if fewer than 2 trains)
+        middle_section_texts = ()
+        if len(next_trains) >= 2:
+            middle_section_texts = (self.row_text(next_trains[1], "2"),)
 
         # bottom section
         if len(next_trains) < 3:  # nothing if fewer than 3 trains
-            bottom_section_content_pixels = []
-            bottom_section_content_pixels_size = (0, 0)
-
+            bottom_section_texts = ()
         elif len(next_trains) == 3:  # 3rd train (if only 3 trains)
-            (
-                bottom_section_content_pixels,
-                bottom_section_content_pixels_size,
-            ) = self.pixels_single_line(next_trains[1], "3")
-
+            bottom_section_texts = (self.row_text(next_trains[1], "3"),)
         else:  # 3rd-4th trains (if more than 3 trains)
-            (
-                bottom_section_content_pixels,
-                bottom_section_content_pixels_size,
-            ) = self.board_text.colour_text_tabbed_rows_pixels(
-                [
-                    [
-                        ["3", "orange"],
-                        [next_trains[2]["towards"], "orange"],
-                        [
-                            helpers.arrival_time_en(next_trains[2]["time_to_station"]),
-                            "orange",
-                        ],
-                    ],
-                    [
-                        ["4", "orange"],
-                        [next_trains[3]["towards"], "orange"],
-                        [
-                            helpers.arrival_time_en(next_trains[3]["time_to_station"]),
-                            "orange",
-                        ],
-                    ],
-                ],
-                row_height=11,
+            bottom_section_texts = (
+                self.row_text(next_trains[2], "3"),
+                self.row_text(next_trains[3], "4"),
             )
 
+        return top_section_texts, middle_section_texts, bottom_section_texts
+
+    def section_pixels(self, section_texts: tuple):
+        if len(section_texts) == 0:
+            return [], (0, 0)
+
+        if len(section_texts) == 1:
+            return self.board_text.colour_text_tabbed_row_pixels(section_texts[0])
+
+        return self.board_text.colour_text_tabbed_rows_pixels(
+            section_texts, row_height=11
+        )
+
+    def next_content(self, next_trains):
+        (
+            top_section_content_pixels,
+            top_section_content_pixels_size,
+        ), (
+            middle_section_content_pixels,
+            middle_section_content_pixels_size,
+        ), (
+            bottom_section_content_pixels,
+            bottom_section_content_pixels_size,
+        ) = (
+            self.section_pixels(section_texts)
+            for section_texts in self.section_texts(next_trains)
+        )
+
         return (
             top_section_content_pixels,
             top_section_content_pixels_size,
@@ -120,6 +114,12 @@ class ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers(ViewModelTflTube_192_32)
     def __init__(self, board_manager_stub: departure_pb2_grpc.BoardManagerStub):
         super().__init__()
         self.board_manager_stub = board_manager_stub
+        self.section_update_tracker = view_model.SectionUpdateTracker()
+
+        # texts and update requests of sections as last displayed, so that
+        # only sections with changed texts are redrawn
+        self.displayed_section_texts = None
+        self.section_requests = [None, None, None]
 
         self.next_service_tracker = [
             departure_pb2.Movement(
@@ -139,70 +139,70 @@ class ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers(ViewModelTflTube_192_32)
             departure_pb2.Movement(no_movement=departure_pb2.NoMovement())
         ]
 
-    def update(self, next_trains):  # pylint: disable=arguments-differ
-        requests_data = []
-
-        (
-            top_section_content_pixels,
-            top_section_content_pixels_size,
-            middle_section_content_pixels,
-            middle_section_content_pixels_size,
-            bottom_section_content_pixels,
-            bottom_section_content_pixels_size,
-        ) = self.next_content(next_trains)
-
-        # top section: 1st train
-        requests_data.append(
-            departure_pb2.BoardSectionUpdateRequest(
-                section_index=0,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(top_section_content_pixels),
-                    content_w=top_section_content_pixels_size[0],
-                    content_h=top_section_content_pixels_size[1],
-                    repeat_x=False,
-                    repeat_y=False,
-                ),
-                movement=self.no_movement,
-                continue_movement=False,  # force reset
-            )
-        )
-
-        # middle section: 2nd train
-        requests_data.append(
-            departure_pb2.BoardSectionUpdateRequest(
-                section_index=1,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(middle_section_content_pixels),
-                    content_w=middle_section_content_pixels_size[0],
-                    content_h=middle_section_content_pixels_size[1],
+    def section_request(self, section_index: int, section_texts: tuple):
+        pixels, pixels_size = self.section_pixels(section_texts)
+
+        # top and middle sections: 1st and 2nd trains
+        if section_index < 2:
+            return departure_pb2.BoardSectionUpdateRequest(
+                section_index=section_index,
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=pixels,
+                    content_w=pixels_size[0],
+                    content_h=pixels_size[1],
                     repeat_x=False,
                     repeat_y=False,
                 ),
                 movement=self.no_movement,
                 continue_movement=False,  # force reset
             )
-        )
 
-        # bottom section: 3rd train onwards
-        if next_trains is None or len(next_trains) <= 3:
+        # bottom section: 3rd train onwards (scrolling if 3rd and 4th trains)
+        if len(section_texts) <= 1:
             next_movement = self.no_movement
         else:
             next_movement = self.next_service_tracker
 
-        requests_data.append(
-            departure_pb2.BoardSectionUpdateRequest(
-                section_index=2,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(bottom_section_content_pixels),
-                    content_w=bottom_section_content_pixels_size[0],
-                    content_h=bottom_section_content_pixels_size[1],
-                    repeat_x=False,
-                    repeat_y=True,
-                ),
-                movement=next_movement,
-                continue_movement=True,
-            )
+        return departure_pb2.BoardSectionUpdateRequest(
+            section_index=section_index,
+            content=protobuf.serialise_BoardSectionContent(
+                pixels=pixels,
+                content_w=pixels_size[0],
+                content_h=pixels_size[1],
+                repeat_x=False,
+                repeat_y=True,
+            ),
+            movement=next_movement,
+            continue_movement=True,
+        )
+
+    def update(self, next_trains):  # pylint: disable=arguments-differ
+        section_texts = self.section_texts(next_trains)
+
+        # nothing to do if displayed texts (e.g. times in minutes) didn't change
+        if (
+            section_texts == self.displayed_section_texts
+            and not self.section_update_tracker.full_update_due()
+        ):
+            return
+
+        # only redraw sections with changed texts
+        for section_index, texts in enumerate(section_texts):
+            if (
+                self.displayed_section_texts is None
+                or texts != self.displayed_section_texts[section_index]
+            ):
+                self.section_requests[section_index] = self.section_request(
+                    section_index, texts
+                )
+        self.displayed_section_texts = section_texts
+
+        # only send sections that changed since the last update
+        requests_data = self.section_update_tracker.changed_requests(
+            self.section_requests
         )
+        if len(requests_data) == 0:
+            return
 
         # send gRPC message
         try:
@@ -212,3 +212,4 @@ class ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers(ViewModelTflTube_192_32)
         # pylint: disable=protected-access
         except (grpc._channel._Rendezvous, grpc._channel._InactiveRpcError):
             logger.warning("connection to board failed")
+            self.section_update_tracker.reset()
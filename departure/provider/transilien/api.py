@@ -4,6 +4,8 @@ import logging
 
 import requests
 
+import departure.commons.http_sessions as http_sessions
+
 from . import commons
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,7 @@ def api_request(url: str):
     commons.check_env_vars()
 
     try:
-        response = requests.get(
+        response = http_sessions.get(
             url,
             timeout=15,
             auth=(os.environ["TRANSILIEN_USER"], os.environ["TRANSILIEN_PASSWORD"]),
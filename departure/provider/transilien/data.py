@@ -1,15 +1,19 @@
 import pathlib
 import json
 
+import departure.commons.lazy as lazy
+import departure.commons.station_search as station_search
+import departure.commons.station_index as station_index
+import departure.provider.sncf.data as sncf_data
+
 
 DATA_DIRNAME = "data"
 IDF_DATA_FILENAME = "sncf-gares-et-arrets-transilien-ile-de-france.json"
-FRANCE_DATA_FILENAME = "referentiel-gares-voyageurs.json"
-
+IDF_DATA_PATH = pathlib.Path(__file__).parents[0] / DATA_DIRNAME / IDF_DATA_FILENAME
+INDEX_FIELDS = ["nom", "libelle"]
 
-def _stations(data_dirname, idf_data_filename):
-    data_path = pathlib.Path(__file__).parents[0] / data_dirname / idf_data_filename
 
+def _stations_from_data_file(data_path):
     # read from stations data file
     with open(data_path) as data_file:
         raw_stations = json.load(data_file)
@@ -27,22 +31,26 @@ def _stations(data_dirname, idf_data_filename):
     return stations
 
 
-def _stations_france(data_dirname, france_data_filename):
-    data_path = pathlib.Path(__file__).parents[0] / data_dirname / france_data_filename
-
-    # read from stations data file
-    with open(data_path) as data_file:
-        raw_stations_france = json.load(data_file)
-
-    stations_france = {}
+# loaded on first access, SNCF stations shared with the SNCF provider
+__getattr__ = lazy.lazy_attributes(
+    __name__,
+    {
+        "STATIONS": lambda: station_index.load_station_index(
+            IDF_DATA_PATH, _stations_from_data_file, INDEX_FIELDS
+        ),
+        "STATIONS_FRANCE": lambda: sncf_data.STATIONS,
+        "STATION_SEARCH_INDEX": lambda: station_search.StationSearchIndex(
+            __getattr__("STATIONS"), lambda station: station["nom"]
+        ),
+    },
+)
 
-    for raw_station in raw_stations_france:
-        station_id = str(raw_station["fields"]["pltf_uic_code"])
-        station_data = {"nom": raw_station["fields"]["gare_alias_libelle_noncontraint"]}
-        stations_france[station_id] = station_data
 
-    return stations_france
+def build_station_index():
+    station_index.write_station_index(
+        _stations_from_data_file(IDF_DATA_PATH), INDEX_FIELDS, IDF_DATA_PATH
+    )
 
 
-STATIONS = _stations(DATA_DIRNAME, IDF_DATA_FILENAME)
-STATIONS_FRANCE = _stations_france(DATA_DIRNAME, FRANCE_DATA_FILENAME)
+if __name__ == "__main__":
+    build_station_index()
@@ -1,11 +1,14 @@
-import threading
-import time
 import logging
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 from starlette.requests import Request
 
+import departure.commons.parallel as parallel
+from departure.board.board_client import DEFAULT_BOARD_ID
+from departure.board.commons import BoardException
+
 from . import transilien, commons, view_model, data_updater
 
 logger = logging.getLogger(__name__)
@@ -13,14 +16,18 @@ logger = logging.getLogger(__name__)
 
 class Station(BaseModel):
     station_id: str
+    board_id: str = DEFAULT_BOARD_ID
+    board_server: Optional[str] = None
 
 
 router = APIRouter()
 
 
 @router.get("/search/{search_string}")
-async def search(search_string):
-    return transilien.stations_by_string(search_string)
+async def search(search_string, limit: int = None):
+    return await parallel.run_blocking(
+        transilien.stations_by_string, search_string, limit
+    )
 
 
 # debugging only
@@ -29,7 +36,7 @@ async def next_trains(station_id):
     # check parameters
     station_id = station_id.upper()
     try:
-        response = transilien.next_trains(station_id)
+        response = await parallel.run_blocking(transilien.next_trains, station_id)
     except commons.TransilienException as e:
         return {"status": "error", "message": str(e)}
 
@@ -44,24 +51,23 @@ async def start_client(station: Station, request: Request):
     station_id = station.station_id
     try:
         commons.check_env_vars()
-        transilien.check_params(station_id)
+        await parallel.run_blocking(transilien.check_params, station_id)
     except commons.TransilienException as e:
         logger.warning(str(e))
         return {"status": "error", "message": str(e)}
 
-    # stop board client if already running
-    if request.app.board_client.running:
-        request.app.board_client.running = False
-        time.sleep(1)
-
-    # start board
-    threading.Thread(
-        target=request.app.board_client.run,
-        args=[
+    # start board, replacing its current session if any
+    try:
+        await parallel.run_blocking(
+            request.app.board_sessions.start,
+            station.board_id,
             view_model.ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers,
             data_updater.DataUpdaterTransilien,
             {"station_id": station_id},
-        ],
-    ).start()
+            board_server=station.board_server,
+        )
+    except BoardException as e:
+        logger.warning(str(e))
+        return {"status": "error", "message": str(e)}
 
     return {"status": "OK"}
@@ -16,18 +16,8 @@ def check_params(station_id: str = None):
             ) from e
 
 
-def stations_by_string(string):
-    string = str(string).lower()
-    results = {}
-    stations = data.STATIONS
-
-    # iterate over stations
-    for station_id in stations:
-        # match?
-        if string in stations[station_id]["nom"].lower():
-            results[station_id] = stations[station_id]
-
-    return results
+def stations_by_string(string, limit: int = None):
+    return data.STATION_SEARCH_INDEX.search(string, limit)
 
 
 def next_trains(station_id: str):
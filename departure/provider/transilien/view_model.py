@@ -21,7 +21,7 @@ class ViewModelTransilien(view_model.ViewModel):
 class ViewModelTransilien_192_32(ViewModelTransilien):
     def __init__(self):
         self.board_text = contents.BoardText(
-            font=contents.read_bdf_font("fonts/6x10_condensed.bdf"),
+            font=contents.load_font("fonts/6x10_condensed.bdf"),
             colour_map={
                 "orange": (255, 204, 0),
                 "red": (255, 0, 0),
@@ -108,6 +108,7 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
     def __init__(self, board_manager_stub: departure_pb2_grpc.BoardManagerStub):
         super().__init__()
         self.board_manager_stub = board_manager_stub
+        self.section_update_tracker = view_model.SectionUpdateTracker()
 
         self.next_train_tracker = [
             departure_pb2.Movement(
@@ -143,8 +144,8 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=0,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(top_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=top_section_content_pixels,
                     content_w=top_section_content_pixels_size[0],
                     content_h=top_section_content_pixels_size[1],
                     repeat_x=False,
@@ -159,8 +160,8 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=1,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(middle_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=middle_section_content_pixels,
                     content_w=middle_section_content_pixels_size[0],
                     content_h=middle_section_content_pixels_size[1],
                     repeat_x=False,
@@ -180,8 +181,8 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
         requests_data.append(
             departure_pb2.BoardSectionUpdateRequest(
                 section_index=2,
-                content=departure_pb2.BoardSectionContent(
-                    pixels=protobuf.serialise_pixels(bottom_section_content_pixels),
+                content=protobuf.serialise_BoardSectionContent(
+                    pixels=bottom_section_content_pixels,
                     content_w=bottom_section_content_pixels_size[0],
                     content_h=bottom_section_content_pixels_size[1],
                     repeat_x=True,
@@ -192,6 +193,11 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
             )
         )
 
+        # only send sections that changed since the last update
+        requests_data = self.section_update_tracker.changed_requests(requests_data)
+        if len(requests_data) == 0:
+            return
+
         # send gRPC message
         try:
             self.board_manager_stub.BoardSectionsUpdate(
@@ -200,3 +206,4 @@ class ViewModelTransilien_192_32_3_Rows_To_ProtocolBuffers(ViewModelTransilien_1
         # pylint: disable=protected-access
         except (grpc._channel._Rendezvous, grpc._channel._InactiveRpcError):
             logger.warning("connection to board failed")
+            self.section_update_tracker.reset()
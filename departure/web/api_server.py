@@ -2,7 +2,6 @@
 # 2) set IP address of board in environment variable DEPARTURE_BOARD_SERVER
 # 3) uvicorn api_server:app --reload --host 0.0.0.0
 
-import time
 import os
 
 from fastapi import FastAPI
@@ -17,6 +16,8 @@ import departure.provider.transilien.server as transilien_server
 import departure.provider.ns.server as ns_server
 from departure.board import board_client
 from departure.commons.log import init_logging
+import departure.commons.http_sessions as http_sessions
+import departure.commons.parallel as parallel
 from . import admin
 
 
@@ -26,8 +27,8 @@ init_logging()
 # initialise app
 app = FastAPI()
 
-# initialise shared board client
-app.board_client = board_client.BoardClient()
+# initialise board sessions (one board client per board ID)
+app.board_sessions = board_client.BoardSessionManager()
 
 ### API routes first
 app.include_router(national_rail_server.router, prefix="/national-rail")
@@ -39,31 +40,45 @@ app.include_router(ns_server.router, prefix="/ns")
 
 
 @app.post("/stop-client")
-async def stop_client():
+async def stop_client(board_id: str = board_client.DEFAULT_BOARD_ID):
     # stop board client if running
-    if app.board_client.running:
-        app.board_client.running = False
-        time.sleep(1)
-
+    await parallel.run_blocking(app.board_sessions.stop, board_id)
     return {"status": "OK"}
 
 
 @app.get("/client-status")
-async def client_status():
-    if app.board_client.running:
+async def client_status(board_id: str = board_client.DEFAULT_BOARD_ID):
+    if app.board_sessions.is_running(board_id):
         return {"client_status": "running"}
     return {"client_status": "stopped"}
 
 
+@app.get("/boards")
+async def boards():
+    return {"boards": app.board_sessions.sessions()}
+
+
+@app.post("/boards/{board_id}/stop")
+async def stop_board(board_id: str):
+    if not await parallel.run_blocking(app.board_sessions.stop, board_id):
+        return {"status": "error", "message": f"no session for board {board_id}"}
+    return {"status": "OK"}
+
+
+@app.get("/http-pool-stats")
+async def http_pool_stats():
+    return http_sessions.pool_stats()
+
+
 @app.get("/board-server-status")
 async def board_server_status():
-    return admin.is_board_server_up()
+    return await parallel.run_blocking(admin.is_board_server_up)
 
 
 @app.post("/shutdown-board-server")
 async def shutdown_board_server():
-    await stop_client()
-    return admin.shutdown_board_server()
+    await parallel.run_blocking(app.board_sessions.stop_all)
+    return await parallel.run_blocking(admin.shutdown_board_server)
 
 
 @app.post("/shutdown-web-server")
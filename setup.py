@@ -27,6 +27,7 @@ setup(
     },
     install_requires=[
         "requests",
+        "urllib3",
         "protobuf<4",
         "grpcio",
         "bdflib",
@@ -37,11 +38,14 @@ setup(
         "fastapi",
         "tabulate",
     ],
+    extras_require={
+        "numpy": ["numpy"],  # framebuffer mode
+    },
     include_package_data=True,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
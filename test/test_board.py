@@ -1,5 +1,11 @@
+import threading
+
+import pytest
+
+import departure.board.animator as animator
 import departure.board.board as board
 import departure.board.movement as movement
+import departure.board.renderer as renderer
 
 # pylint: disable=attribute-defined-outside-init,protected-access
 
@@ -95,3 +101,218 @@ class TestBoardSection:
 
         assert board_section._movement == movement2
         assert board_section._has_changed
+
+
+class TestBoardFramebuffer:
+    def setup_method(self):
+        pytest.importorskip("numpy")
+
+        self.board = board.Board(
+            board_w=12,
+            board_h=12,
+            sections=[
+                board.BoardSection(
+                    output_x=0,
+                    output_y=0,
+                    output_w=12,
+                    output_h=5,
+                    content=board.BoardSectionContent(
+                        content_pixels=[
+                            [0, 0, (255, 0, 0)],
+                            [3, 1, (0, 255, 0)],
+                            [6, 4, (0, 0, 255)],
+                            [8, 2, (255, 255, 255)],  # outside bounding box
+                        ],
+                        content_w=7,
+                        content_h=5,
+                        repeat_x=True,
+                        repeat_y=False,
+                    ),
+                    movement=movement.ScrollingContent(10, 0, -1, 0),
+                ),
+                board.BoardSection(
+                    output_x=2,
+                    output_y=6,
+                    output_w=8,
+                    output_h=6,
+                    content=board.BoardSectionContent(
+                        content_pixels=[
+                            [0, 0, (255, 204, 0)],
+                            [1, 2, (255, 204, 0)],
+                            [7, 3, (0, 255, 0)],
+                        ],
+                        content_w=8,
+                        content_h=4,
+                        repeat_x=False,
+                        repeat_y=True,
+                    ),
+                    movement=movement.MovementCycle(
+                        [
+                            movement.StaticContent(20),
+                            movement.ScrollingContent(10, 4, 0, -1),
+                        ]
+                    ),
+                ),
+            ],
+        )
+
+    def test_framebuffer_matches_pixels(self):
+        self.board.reset()
+
+        for _ in range(40):
+            self.board.update(10)
+            expected = sorted(
+                (x, y, tuple(c))
+                for x, y, c in self.board.pixels()
+                if 0 <= x < self.board.board_w and 0 <= y < self.board.board_h
+            )
+            actual = sorted(board.framebuffer_pixels(self.board.framebuffer()))
+            assert actual == expected
+
+    def test_pixels_after_framebuffer(self):
+        self.board.reset()
+
+        for _ in range(40):
+            self.board.update(10)
+            actual = sorted(board.framebuffer_pixels(self.board.framebuffer()))
+            expected = sorted(
+                (x, y, tuple(c))
+                for x, y, c in self.board.pixels()
+                if 0 <= x < self.board.board_w and 0 <= y < self.board.board_h
+            )
+            assert actual == expected
+
+    def test_framebuffer_unchanged(self):
+        self.board.reset()
+        self.board.sections[1].update_movement(movement.NoMovement())
+        self.board.sections[1].reset()
+
+        framebuffer = self.board.framebuffer()
+        assert framebuffer.shape == (12, 12, 3)
+        assert not self.board.update(0)
+        assert self.board.framebuffer() is framebuffer
+
+        self.board.update(10)
+        assert self.board.framebuffer() is not framebuffer
+
+
+class TestChangedRegions:
+    def setup_method(self):
+        self.board = board.Board(
+            board_w=8,
+            board_h=8,
+            sections=[
+                board.BoardSection(
+                    0,
+                    0,
+                    8,
+                    4,
+                    board.BoardSectionContent([(0, 0, (255, 255, 255))], 8, 4),
+                ),
+                board.BoardSection(
+                    0,
+                    4,
+                    8,
+                    4,
+                    board.BoardSectionContent([(1, 0, (255, 0, 0))], 8, 4),
+                    movement=movement.ScrollingContent(10, 0, -1, 0),
+                ),
+            ],
+        )
+
+    def test_initial(self):
+        self.board.reset()
+        assert self.board.changed_regions() == [
+            ((0, 0, 8, 4), [[0, 0, (255, 255, 255)]]),
+            ((0, 4, 8, 4), [[0, 4, (255, 0, 0)]]),
+        ]
+
+    def test_scrolling_section_only(self):
+        self.board.reset()
+        self.board.changed_regions()
+
+        self.board.update(5)
+        assert self.board.changed_regions() == []
+
+        self.board.update(5)
+        assert self.board.changed_regions() == [((0, 4, 8, 4), [[7, 4, (255, 0, 0)]])]
+        assert not self.board.update(0)
+        assert self.board.pixels() == [[0, 0, (255, 255, 255)], [7, 4, (255, 0, 0)]]
+
+    def test_content_update(self):
+        self.board.reset()
+        self.board.changed_regions()
+
+        self.board.sections[0].update_content(
+            board.BoardSectionContent([(2, 1, (0, 255, 0))], 8, 4)
+        )
+        assert self.board.changed_regions() == [((0, 0, 8, 4), [[2, 1, (0, 255, 0)]])]
+
+
+class FrameRenderer(renderer.Renderer):
+    def __init__(self):
+        self.frames = []
+
+    def render_frame(self, pixels):
+        self.frames.append(pixels)
+
+
+class RegionRenderer(FrameRenderer):
+    def render_regions(self, regions):
+        self.frames.append(regions)
+
+
+class TestAnimatorRegions:
+    def setup_method(self):
+        self.board = board.Board(
+            board_w=8,
+            board_h=8,
+            sections=[
+                board.BoardSection(
+                    0,
+                    0,
+                    8,
+                    4,
+                    board.BoardSectionContent([(0, 0, (255, 255, 255))], 8, 4),
+                ),
+                board.BoardSection(
+                    0,
+                    4,
+                    8,
+                    4,
+                    board.BoardSectionContent([(1, 0, (255, 0, 0))], 8, 4),
+                    movement=movement.ScrollingContent(10, 0, -1, 0),
+                ),
+            ],
+        )
+        self.board.reset()
+
+    def board_animator(self, board_renderer):
+        return animator.BoardAnimator(
+            self.board,
+            board_renderer,
+            time_step_in_s=0.01,
+            board_lock=threading.RLock(),
+            end_event=threading.Event(),
+            use_regions=True,
+        )
+
+    def test_regions(self):
+        region_renderer = RegionRenderer()
+        board_animator = self.board_animator(region_renderer)
+        board_animator.update(10)
+        board_animator.update(10)
+
+        assert region_renderer.frames[-1] == [
+            ((0, 4, 8, 4), [[6, 4, (255, 0, 0)]])
+        ]
+        assert not self.board.update(0)
+
+    def test_full_frames_if_renderer_cant_render_regions(self):
+        frame_renderer = FrameRenderer()
+        board_animator = self.board_animator(frame_renderer)
+        board_animator.update(10)
+
+        assert frame_renderer.frames == [
+            [[0, 0, (255, 255, 255)], [7, 4, (255, 0, 0)]]
+        ]
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from departure.board import board_client
+from departure.board.commons import BoardException
+
+
+class FakeViewModel:
+    instances = []
+
+    def __init__(self, board_manager_stub):
+        self.board_manager_stub = board_manager_stub
+        self.updates = []
+        self.instances.append(self)
+
+    def update(self, data):
+        self.updates.append(data)
+
+
+class FakeDataUpdater(threading.Thread):
+    def __init__(self, target_view_model, data_refresh_delay_in_s, end_event, **kwargs):
+        super().__init__()
+        self.target_view_model = target_view_model
+        self.end_event = end_event
+        self.kwargs = kwargs
+
+    def run(self):
+        self.end_event.wait(5)
+
+
+def start(manager, board_id, board_server="127.0.0.1:50099"):
+    return manager.start(
+        board_id, FakeViewModel, FakeDataUpdater, {"code": board_id}, board_server
+    )
+
+
+def test_board_server_target():
+    assert board_client.board_server_target("10.0.0.1") == "10.0.0.1:50051"
+    assert board_client.board_server_target("10.0.0.1:6000") == "10.0.0.1:6000"
+    assert board_client.board_server_target("::1") == "[::1]:50051"
+    assert board_client.board_server_target("[::1]") == "[::1]:50051"
+    assert board_client.board_server_target("[::1]:6000") == "[::1]:6000"
+
+
+def test_shared_channel():
+    assert board_client.shared_channel("127.0.0.1:50099") is (
+        board_client.shared_channel("127.0.0.1:50099")
+    )
+
+
+def test_sessions_run_independently():
+    manager = board_client.BoardSessionManager()
+    start(manager, "kitchen")
+    start(manager, "hall", "127.0.0.1:50098")
+    try:
+        assert manager.is_running("kitchen")
+        assert manager.is_running("hall")
+
+        assert manager.stop("kitchen")
+        assert not manager.is_running("kitchen")
+        assert manager.is_running("hall")
+
+        sessions = manager.sessions()
+        assert [session["board_id"] for session in sessions] == ["hall"]
+        assert sessions[0]["board_server"] == "127.0.0.1:50098"
+        assert sessions[0]["parameters"] == {"code": "hall"}
+    finally:
+        manager.stop_all()
+
+    assert manager.sessions() == []
+    assert not manager.stop("hall")
+
+
+def test_start_replaces_session_of_same_board():
+    manager = board_client.BoardSessionManager()
+    first_session = start(manager, "kitchen")
+    second_session = start(manager, "kitchen")
+    try:
+        assert not first_session.thread.is_alive()
+        assert second_session.thread.is_alive()
+        assert len(manager.sessions()) == 1
+    finally:
+        manager.stop_all()
+
+
+def test_board_cleared_on_stop_but_not_on_replacement():
+    FakeViewModel.instances.clear()
+    manager = board_client.BoardSessionManager()
+    start(manager, "kitchen")
+    start(manager, "kitchen")
+    manager.stop("kitchen")
+
+    first_view_model, second_view_model = FakeViewModel.instances
+    assert first_view_model.updates == []
+    assert second_view_model.updates == [None]
+
+
+def test_maximum_sessions():
+    manager = board_client.BoardSessionManager(max_sessions=2)
+    start(manager, "kitchen")
+    start(manager, "hall")
+    try:
+        with pytest.raises(BoardException):
+            start(manager, "garage")
+
+        # replacing an existing session is allowed
+        start(manager, "hall")
+    finally:
+        manager.stop_all()
+
+    start(manager, "garage")
+    manager.stop_all()
@@ -0,0 +1,149 @@
+import os
+import pathlib
+import shutil
+
+import departure.board.compiled_font as compiled_font
+import departure.board.contents as contents
+
+# pylint: disable=attribute-defined-outside-init,protected-access
+
+
+class TestBoardText:
+    def setup_method(self):
+        self.font = contents.read_bdf_font("fonts/6x10_proportional.bdf")
+        self.board_text = contents.BoardText(
+            font=self.font,
+            colour_map={"orange": (255, 204, 0), "red": (255, 0, 0)},
+            tabs=[[0, "l"], [10, "l"], [191, "r"]],
+        )
+
+    def test_monochrome_text_pixels(self):
+        pixels, size = self.board_text.monochrome_text_pixels("Bank", (255, 0, 0))
+
+        expected_pixels = []
+        advance = 0
+        for c in "Bank":
+            glyph = self.font[ord(c)]
+            expected_pixels += self.board_text._glyph_pixels(
+                glyph, advance, self.font[b"FONT_ASCENT"] - 1, (255, 0, 0)
+            )
+            advance += glyph.advance
+
+        assert pixels == expected_pixels
+        assert size == (advance, 10)
+
+    def test_max_width(self):
+        _, size = self.board_text.monochrome_text_pixels("Morden", max_width=10)
+        assert 10 < size[0] < self.board_text.monochrome_text_pixels("Morden")[1][0]
+
+    def test_glyph_atlas_shared_by_font(self):
+        self.board_text.monochrome_text_pixels("Oval")
+        other_board_text = contents.BoardText(font=self.font)
+        other_board_text.monochrome_text_pixels("Oval")
+
+        assert other_board_text._glyph_atlas is self.board_text._glyph_atlas
+        assert set(self.board_text._glyph_atlas) == {ord(c) for c in "Oval"}
+
+
+class TestTextRunCache:
+    def setup_method(self):
+        self.font = contents.read_bdf_font("fonts/6x10_proportional.bdf")
+        self.text_run_cache = contents.TextRunCache(max_size=2)
+        self.board_text = contents.BoardText(
+            font=self.font,
+            colour_map={"orange": (255, 204, 0), "red": (255, 0, 0)},
+            tabs=[[0, "l"], [10, "l"], [191, "r"]],
+            text_run_cache=self.text_run_cache,
+        )
+
+    def test_hit(self):
+        run = self.board_text.colour_text_pixels([["Bank", "orange"]])
+        assert self.board_text.colour_text_pixels([["Bank", "orange"]]) is run
+        assert self.text_run_cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_size": 2,
+        }
+
+    def test_key_includes_colour_and_max_width(self):
+        run = self.board_text.colour_text_pixels([["Bank", "orange"]])
+        assert self.board_text.colour_text_pixels([["Bank", "red"]]) != run
+        assert self.board_text.colour_text_pixels([["Bank", "orange", 5]]) != run
+        assert self.text_run_cache.misses == 3
+
+    def test_tabbed_rows_same_as_uncached(self):
+        text_rows = [
+            [["3", "orange"], ["Morden", "orange"], ["2 mins", "orange"]],
+            [["4", "orange"], ["Kennington", "red"], ["5 mins", "orange"]],
+        ]
+        uncached_board_text = contents.BoardText(
+            font=self.font,
+            colour_map=self.board_text.colour_map,
+            tabs=self.board_text.tabs,
+            text_run_cache=contents.TextRunCache(max_size=0),
+        )
+
+        assert self.board_text.colour_text_tabbed_rows_pixels(
+            text_rows, 11
+        ) == uncached_board_text.colour_text_tabbed_rows_pixels(text_rows, 11)
+        assert uncached_board_text.text_run_cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        self.board_text.colour_text_pixels([["Bank", "orange"]])
+        self.board_text.colour_text_pixels([["Oval", "orange"]])
+        self.board_text.colour_text_pixels([["Bank", "orange"]])  # most recent
+        self.board_text.colour_text_pixels([["Angel", "orange"]])  # evicts Oval
+
+        self.board_text.colour_text_pixels([["Bank", "orange"]])
+        assert self.text_run_cache.hits == 2
+        self.board_text.colour_text_pixels([["Oval", "orange"]])
+        assert self.text_run_cache.misses == 4
+
+
+class TestCompiledFont:
+    def setup_method(self):
+        self.bdf_path = (
+            pathlib.Path(contents.__file__).parents[0] / "fonts/6x10_condensed.bdf"
+        )
+
+    def test_same_glyphs_as_bdf(self):
+        bdf_font = contents.read_bdf_font("fonts/6x10_condensed.bdf")
+        font = compiled_font.CompiledFont(compiled_font.compile_bdf_font(self.bdf_path))
+
+        assert font[b"FONT_ASCENT"] == bdf_font[b"FONT_ASCENT"]
+        assert font[b"FONT_DESCENT"] == bdf_font[b"FONT_DESCENT"]
+        for c in "Arrêts : Mâcon (12:00)":
+            glyph, bdf_glyph = font[ord(c)], bdf_font[ord(c)]
+            assert (glyph.advance, glyph.bbY, glyph.bbW, glyph.bbH) == (
+                bdf_glyph.advance,
+                bdf_glyph.bbY,
+                bdf_glyph.bbW,
+                bdf_glyph.bbH,
+            )
+            assert glyph.data == list(bdf_glyph.data)
+
+    def test_compiled_on_first_use_then_mapped(self, tmp_path):
+        bdf_path = tmp_path / "font.bdf"
+        shutil.copy(self.bdf_path, bdf_path)
+
+        font = compiled_font.load_compiled_font(bdf_path)
+        assert (tmp_path / "font.dfont").exists()
+        assert isinstance(font._buffer, bytes)
+
+        font = compiled_font.load_compiled_font(bdf_path)
+        assert not isinstance(font._buffer, bytes)  # memory-mapped
+        assert font[ord("A")].bbW > 0
+
+    def test_stale(self, tmp_path):
+        bdf_path = tmp_path / "font.bdf"
+        shutil.copy(self.bdf_path, bdf_path)
+        compiled_font.load_compiled_font(bdf_path)
+
+        os.utime(bdf_path, ns=(0, 0))
+        assert compiled_font.load_compiled_font(bdf_path).source_mtime == 0
+
+    def test_load_font_shared(self):
+        assert contents.load_font("fonts/6x10_condensed.bdf") is contents.load_font(
+            "fonts/6x10_condensed.bdf"
+        )
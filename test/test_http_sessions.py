@@ -0,0 +1,88 @@
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+import departure.commons.http_sessions as http_sessions
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    failures_left = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path == "/slow":
+            time.sleep(0.5)
+        if Handler.failures_left > 0:
+            Handler.failures_left -= 1
+            self.send_response(503)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "2")
+        try:
+            self.end_headers()
+            self.wfile.write(b"{}")
+        except BrokenPipeError:  # client timed out
+            pass
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestHttpSessions:
+    def setup_method(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.host = f"127.0.0.1:{self.server.server_address[1]}"
+        self.url = f"http://{self.host}/"
+        http_sessions.configure_host(
+            self.host, http_sessions.SessionConfig(retries=2, backoff_factor=0)
+        )
+
+    def teardown_method(self):
+        http_sessions.close_sessions()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        for _ in range(3):
+            assert http_sessions.get(self.url, timeout=5).status_code == 200
+
+        stats = http_sessions.pool_stats()[self.host]
+        assert stats["requests"] == 3
+        assert stats["connections"] == 1
+        assert stats["idle_connections"] == 1
+
+    def test_session_is_shared(self):
+        assert http_sessions.session(self.url) is http_sessions.session(
+            self.url + "other/path"
+        )
+
+    def test_retry_on_transient_errors(self):
+        Handler.failures_left = 2
+        assert http_sessions.get(self.url, timeout=5).status_code == 200
+
+        Handler.failures_left = 3
+        assert http_sessions.get(self.url, timeout=5).status_code == 503
+        Handler.failures_left = 0
+
+    def test_read_timeout_not_retried(self):
+        start_time = time.monotonic()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            http_sessions.get(self.url + "slow", timeout=0.2)
+        assert time.monotonic() - start_time < 0.4
+
+
+def test_retry_on_urllib3_before_1_26(monkeypatch):
+    class OldRetry:  # no allowed_methods argument
+        def __init__(self, method_whitelist, **kwargs):
+            self.method_whitelist = method_whitelist
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(http_sessions, "Retry", OldRetry)
+    retry = http_sessions._retry(http_sessions.SessionConfig(retries=2))
+
+    assert retry.method_whitelist == {"GET", "HEAD"}
+    assert retry.kwargs["total"] == 2
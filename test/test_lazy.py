@@ -0,0 +1,38 @@
+import sys
+import types
+
+import departure.commons.lazy as lazy
+import departure.provider.sncf.data as sncf_data
+import departure.provider.transilien.data as transilien_data
+
+
+def test_lazy_attributes():
+    module = types.ModuleType("lazy_test_module")
+    sys.modules[module.__name__] = module
+    calls = []
+
+    module.__getattr__ = lazy.lazy_attributes(
+        module.__name__,
+        {
+            "DATA": lambda: calls.append("DATA") or [1, 2],
+            "TOTAL": lambda: sum(module.__getattr__("DATA")),
+        },
+    )
+
+    try:
+        assert calls == []
+        assert module.TOTAL == 3
+        assert module.DATA == [1, 2]
+        assert calls == ["DATA"]  # loaded once
+
+        try:
+            module.MISSING  # pylint: disable=pointless-statement
+            assert False
+        except AttributeError:
+            pass
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_sncf_stations_shared_with_transilien():
+    assert transilien_data.STATIONS_FRANCE is sncf_data.STATIONS
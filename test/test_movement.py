@@ -333,3 +333,74 @@ class TestMovementCycle:  # pylint: disable=attribute-defined-outside-init
         assert self.tracker.anim_sequence[1].y_offset == 2
         assert self.tracker.anim_sequence[1].elapsed_time == 55
         assert self.tracker.anim_sequence[1].current_step_num == 3
+
+
+class TestOffsetAt:
+    def integrated_offsets(self, single_movement, delta_times):
+        single_movement.reset()
+        offsets = [(single_movement.x_offset, single_movement.y_offset)]
+        for delta_time in delta_times:
+            single_movement.update(delta_time)
+            offsets.append((single_movement.x_offset, single_movement.y_offset))
+        return offsets
+
+    def closed_form_offsets(self, single_movement, delta_times):
+        offsets = [single_movement.offset_at(0)]
+        elapsed_time = 0
+        for delta_time in delta_times:
+            elapsed_time += delta_time
+            offsets.append(single_movement.offset_at(elapsed_time))
+        return offsets
+
+    def check(self, movement_factory, delta_times):
+        assert self.closed_form_offsets(
+            movement_factory(), delta_times
+        ) == self.integrated_offsets(movement_factory(), delta_times)
+
+    def test_no_movement(self):
+        assert movement.NoMovement(2, 3).offset_at(1000) == (2, 3)
+
+    def test_static_content(self):
+        self.check(lambda: movement.StaticContent(50, 2, 3), [10, 45, 100])
+
+    def test_perpetual_scroll(self):
+        self.check(lambda: movement.ScrollingContent(50, 0, -1, 0), [7, 50, 13, 999])
+
+    def test_bounded_scroll(self):
+        self.check(
+            lambda: movement.ScrollingContent(15, 4, 0, -1, 2, 3), [1, 14, 20, 15, 500]
+        )
+
+    def test_cycle(self):
+        self.check(
+            lambda: movement.MovementCycle(
+                [movement.StaticContent(200), movement.ScrollingContent(15, 4, -1, 0)]
+            ),
+            [10] * 60 + [7, 199, 260, 261, 1, 59],
+        )
+
+    def test_cycle_large_delta(self):
+        self.check(
+            lambda: movement.MovementCycle(
+                [
+                    movement.StaticContent(2000),
+                    movement.ScrollingContent(100, 11, 0, -1),
+                ]
+            ),
+            [2050, 3100 * 1000 + 40, 10, 3100, 5000],
+        )
+
+    def test_cycle_ending_forever(self):
+        self.check(
+            lambda: movement.MovementCycle(
+                [movement.StaticContent(20), movement.ScrollingContent(10, 0, -1, 0)]
+            ),
+            [5, 15, 10, 1000],
+        )
+
+    def test_cycle_duration(self):
+        tracker = movement.MovementCycle(
+            [movement.StaticContent(200), movement.ScrollingContent(15, 4, -1, 0)]
+        )
+        assert tracker.cycle_duration() == 260
+        assert tracker.cycle_displacement() == (-4, 0)
@@ -0,0 +1,63 @@
+import threading
+
+import departure.provider.ns.ns as ns
+
+
+def journey_json(train_number):
+    return {
+        "payload": {
+            "stops": [
+                {
+                    "stop": {"name": f"Stop {train_number}", "uicCode": "8400621"},
+                    "departures": [{"plannedTime": "2020-10-10T10:00:00+0200"}],
+                }
+            ]
+        }
+    }
+
+
+class TestDeparturesWithSchedule:
+    def setup_method(self):
+        self.trains = [{"train_number": str(n)} for n in range(4)]
+
+    def test_schedules_in_order(self, monkeypatch):
+        monkeypatch.setattr(ns, "departures", lambda station_code: self.trains)
+        monkeypatch.setattr(ns.api, "journey", journey_json)
+
+        trains = ns.departures_with_schedule("UT", timetable_for_all_trains=True)
+
+        assert [train["schedule"][0]["stop_name"] for train in trains] == [
+            "Stop 0",
+            "Stop 1",
+            "Stop 2",
+            "Stop 3",
+        ]
+
+    def test_first_train_only(self, monkeypatch):
+        monkeypatch.setattr(ns, "departures", lambda station_code: self.trains)
+        monkeypatch.setattr(ns.api, "journey", journey_json)
+
+        trains = ns.departures_with_schedule("UT")
+
+        assert len(trains[0]["schedule"]) == 1
+        assert all("schedule" not in train for train in trains[1:])
+
+    def test_failed_and_late_lookups(self, monkeypatch):
+        release = threading.Event()
+
+        def journey(train_number):
+            if train_number == "1":
+                return None  # failed request
+            if train_number == "2":
+                release.wait(5)
+            return journey_json(train_number)
+
+        monkeypatch.setattr(ns, "departures", lambda station_code: self.trains)
+        monkeypatch.setattr(ns.api, "journey", journey)
+
+        trains = ns.departures_with_schedule(
+            "UT", timetable_for_all_trains=True, max_workers=4, timeout_in_s=0.2
+        )
+        release.set()
+
+        assert [len(train["schedule"]) for train in trains] == [1, 0, 0, 1]
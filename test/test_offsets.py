@@ -134,3 +134,110 @@ class TestVisiblePixelsMultipleOffsets:
         )
 
         assert output_pixels == [(0, 0, (255, 255, 255))]
+
+
+class TestCycleOffsets:
+    def test_no_movement(self):
+        assert board.cycle_offsets(0, 0, [], False, 20, 10, 10) == {(0, 0)}
+
+    def test_bounded_scroll(self):
+        assert board.cycle_offsets(0, 0, [(0, -1)] * 3, False, 20, 10, 10) == {
+            (0, 0),
+            (0, -1),
+            (0, -2),
+            (0, -3),
+        }
+
+    def test_repeating_wraps(self):
+        # 2 cycles of 2 steps to get back to 0 after wrapping
+        assert board.cycle_offsets(0, 0, [(0, -1)] * 2, True, 20, 4, 10) == {
+            (0, 0),
+            (0, -1),
+            (0, -2),
+            (0, -3),
+        }
+
+    def test_too_many_offsets(self):
+        assert board.cycle_offsets(0, 0, [(-1, 0)], True, 20, 10, 10) is None
+
+    def test_non_periodic(self):
+        assert board.cycle_offsets(0, 0, [(1, 0)], True, 20, 10, 100) is None
+
+
+class TestFrameCache:
+    def setup_method(self):
+        self.board_section = board.BoardSection(
+            0,
+            0,
+            8,
+            4,
+            board.BoardSectionContent(
+                [(0, 0, (255, 0, 0)), (0, 2, (0, 255, 0))], 8, 4
+            ),
+            movement=movement.MovementCycle(
+                [
+                    movement.StaticContent(20),
+                    movement.ScrollingContent(10, 2, 0, -1),
+                ]
+            ),
+        )
+
+    def test_filled_as_offsets_visited(self):
+        self.board_section.reset()
+        _ = self.board_section.pixels()
+        assert set(self.board_section._frame_cache) == {(0, 0)}
+
+        self.board_section.update(20)
+        _ = self.board_section.pixels()
+        assert set(self.board_section._frame_cache) == {(0, 0), (0, -1)}
+
+    def test_not_enabled_for_long_period(self):
+        board_section = board.BoardSection(
+            0,
+            0,
+            8,
+            4,
+            board.BoardSectionContent([(0, 0, (255, 0, 0))], 8, 4),
+            movement=movement.ScrollingContent(10, 0, -1, 0),
+            frame_cache_size=4,
+        )
+        board_section.reset()
+        for _ in range(3):
+            board_section.update(10)
+            _ = board_section.pixels()
+        assert len(board_section._frame_cache) == 0
+
+    def test_replay(self):
+        self.board_section.reset()
+        frames = []
+        for _ in range(20):
+            self.board_section.update(10)
+            frames.append(self.board_section.pixels())
+
+        assert frames[0] == [[0, 0, (255, 0, 0)], [0, 2, (0, 255, 0)]]
+        assert frames[1] == [[0, 1, (0, 255, 0)], [0, 3, (255, 0, 0)]]
+        assert frames[1] is frames[9]
+        assert len(self.board_section._frame_cache) == 4
+
+    def test_cleared_on_content_update(self):
+        self.board_section.reset()
+        _ = self.board_section.pixels()
+        self.board_section.update_content(
+            board.BoardSectionContent([(1, 1, (0, 0, 255))], 8, 4)
+        )
+        assert self.board_section.pixels() == [[1, 1, (0, 0, 255)]]
+
+    def test_disabled(self):
+        board_section = board.BoardSection(
+            0,
+            0,
+            8,
+            4,
+            board.BoardSectionContent([(0, 0, (255, 0, 0))], 8, 4),
+            movement=movement.ScrollingContent(10, 0, -1, 0),
+            frame_cache_size=0,
+        )
+        board_section.reset()
+        board_section.update(10)
+        assert board_section.pixels() == [[6, 0, (255, 0, 0)]]
+        assert len(board_section._frame_cache) == 0
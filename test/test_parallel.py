@@ -0,0 +1,48 @@
+import threading
+import time
+
+import departure.commons.parallel as parallel
+
+
+class TestMapWithDeadline:
+    def setup_method(self):
+        self.executor = parallel.shared_executor("test", 4)
+
+    def test_results_in_order(self):
+        def slow_square(n):
+            time.sleep((5 - n) * 0.01)
+            return n * n
+
+        assert parallel.map_with_deadline(
+            slow_square, range(5), self.executor, timeout_in_s=5
+        ) == [0, 1, 4, 9, 16]
+
+    def test_runs_concurrently(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        # would time out if tasks were run one after the other
+        assert parallel.map_with_deadline(
+            lambda n: barrier.wait() >= 0, range(4), self.executor, timeout_in_s=5
+        ) == [True] * 4
+
+    def test_failed_and_late_tasks(self):
+        release = threading.Event()
+
+        def task(n):
+            if n == 1:
+                raise ValueError()
+            if n == 2:
+                release.wait(5)
+            return n
+
+        start_time = time.monotonic()
+        results = parallel.map_with_deadline(
+            task, range(4), self.executor, timeout_in_s=0.2, default=[]
+        )
+        release.set()
+
+        assert results == [0, [], [], 3]
+        assert time.monotonic() - start_time < 1
+
+    def test_shared_executor(self):
+        assert parallel.shared_executor("test", 4) is self.executor
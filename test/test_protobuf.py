@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+import departure.board.board as board
+import departure.board.board_updater as board_updater
+import departure.board.departure_pb2 as departure_pb2
+import departure.board.protobuf as protobuf
+
+
+def sorted_pixels(pixels):
+    return sorted(pixels, key=lambda pixel: (pixel[1], pixel[0]))
+
+
+class TestPackedPixels:
+    def test_round_trip(self):
+        pixels = [
+            (0, 0, (255, 0, 0)),
+            (5, 0, (255, 204, 0)),
+            (2, 3, (0, 255, 0)),
+            (9, 1, (255, 0, 0)),
+        ]
+
+        packed_pixels = protobuf.serialise_packed_pixels(pixels)
+        assert packed_pixels.bits_per_pixel == 2
+        assert (packed_pixels.x, packed_pixels.y) == (0, 0)
+        assert (packed_pixels.w, packed_pixels.h) == (10, 4)
+        assert len(packed_pixels.data) == 3 * 4
+
+        assert sorted_pixels(
+            protobuf.deserialise_PackedPixels(packed_pixels)
+        ) == sorted_pixels(pixels)
+
+    def test_offset_bounding_box(self):
+        pixels = [(-3, 2, (255, 255, 255)), (4, 7, (255, 255, 255))]
+
+        packed_pixels = protobuf.serialise_packed_pixels(pixels)
+        assert packed_pixels.bits_per_pixel == 1
+        assert (packed_pixels.x, packed_pixels.y) == (-3, 2)
+        assert (packed_pixels.w, packed_pixels.h) == (8, 6)
+
+        assert sorted_pixels(
+            protobuf.deserialise_PackedPixels(packed_pixels)
+        ) == sorted_pixels(pixels)
+
+    def test_unsupported_bits_per_pixel(self):
+        packed_pixels = protobuf.serialise_packed_pixels([(0, 0, (255, 0, 0))])
+        packed_pixels.bits_per_pixel = 3
+
+        with pytest.raises(ValueError):
+            protobuf.deserialise_PackedPixels(packed_pixels)
+
+    def test_too_many_colours(self):
+        pixels = [(i, 0, (i, 0, 0)) for i in range(256)]
+        assert protobuf.serialise_packed_pixels(pixels) is None
+
+        # falls back to repeated pixels
+        content = protobuf.serialise_BoardSectionContent(
+            pixels, 256, 1, False, False, packed=True
+        )
+        assert not content.HasField("packed_pixels")
+        assert len(content.pixels) == 256
+
+
+class TestBoardSectionContent:
+    pixels = [(0, 0, (255, 0, 0)), (1, 1, (255, 204, 0)), (7, 9, (0, 0, 0))]
+
+    def deserialised(self, packed):
+        content = protobuf.serialise_BoardSectionContent(
+            self.pixels, 20, 10, True, False, packed=packed
+        )
+
+        # round trip through the wire format
+        parsed_content = departure_pb2.BoardSectionContent()
+        parsed_content.ParseFromString(content.SerializeToString())
+        assert parsed_content.HasField("packed_pixels") == packed
+
+        return protobuf.deserialise_BoardSectionContent(parsed_content)
+
+    def test_packed_and_legacy_encodings_match(self):
+        packed_content = self.deserialised(packed=True)
+        legacy_content = self.deserialised(packed=False)
+
+        assert sorted_pixels(packed_content.content_pixels) == sorted_pixels(
+            legacy_content.content_pixels
+        )
+        for content in (packed_content, legacy_content):
+            assert (content.content_w, content.content_h) == (20, 10)
+            assert (content.repeat_x, content.repeat_y) == (True, False)
+
+    def test_empty_packed_content(self):
+        content = protobuf.serialise_BoardSectionContent([], 0, 0, False, False, True)
+        assert content.HasField("packed_pixels")
+        assert protobuf.deserialise_BoardSectionContent(content).content_pixels == []
+
+    def test_packed_pixels_opt_in(self, monkeypatch):
+        monkeypatch.delenv("DEPARTURE_PACKED_PIXELS", raising=False)
+        content = protobuf.serialise_BoardSectionContent(self.pixels, 8, 10, 0, 0)
+        assert not content.HasField("packed_pixels")
+
+        monkeypatch.setenv("DEPARTURE_PACKED_PIXELS", "1")
+        content = protobuf.serialise_BoardSectionContent(self.pixels, 8, 10, 0, 0)
+        assert content.HasField("packed_pixels")
+
+
+def test_board_updater_from_packed_pixels():
+    target_board = board.Board(192, 32)
+    updater = board_updater.BoardUpdater_192_32_3_Rows_From_ProtocolBuffers(
+        target_board, threading.RLock()
+    )
+    pixels = [(0, 0, (255, 0, 0)), (3, 2, (0, 255, 0))]
+
+    response = updater.update(
+        departure_pb2.BoardSectionsUpdateRequest(
+            requests=[
+                departure_pb2.BoardSectionUpdateRequest(
+                    section_index=1,
+                    content=protobuf.serialise_BoardSectionContent(
+                        pixels, 4, 3, False, False, packed=True
+                    ),
+                )
+            ]
+        )
+    )
+
+    assert response.status[0].status == departure_pb2.BoardSectionOperationStatus.OK
+    assert sorted_pixels(
+        target_board.sections[1]._content.content_pixels  # pylint: disable=W0212
+    ) == sorted_pixels(pixels)
@@ -0,0 +1,68 @@
+import threading
+import time
+
+import departure.commons.response_cache as response_cache
+
+
+class Fetcher:
+    def __init__(self):
+        self.calls = 0
+        self.fetched = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.fetched.set()
+        return {"call": self.calls}
+
+
+class TestResponseCache:
+    def test_fresh_response(self):
+        cache = response_cache.ResponseCache(ttl_in_s=60)
+        fetch = Fetcher()
+
+        assert cache.get("a", fetch) == {"call": 1}
+        assert cache.get("a", fetch) == {"call": 1}
+        assert cache.get("b", fetch) == {"call": 2}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_expired_response(self):
+        cache = response_cache.ResponseCache(ttl_in_s=0)
+        fetch = Fetcher()
+
+        cache.get("a", fetch)
+        assert cache.get("a", fetch) == {"call": 2}
+
+    def test_stale_while_revalidate(self):
+        cache = response_cache.ResponseCache(ttl_in_s=0.05, stale_ttl_in_s=60)
+        fetch = Fetcher()
+
+        cache.get("a", fetch)
+        time.sleep(0.05)
+        fetch.fetched.clear()
+
+        # stale response returned immediately, refreshed in the background
+        assert cache.get("a", fetch) == {"call": 1}
+        assert fetch.fetched.wait(5)
+        for _ in range(100):
+            if cache.get("a", fetch) == {"call": 2}:
+                break
+            time.sleep(0.01)
+        assert cache.get("a", fetch) == {"call": 2}
+        assert cache.stats()["stale_hits"] >= 1
+
+    def test_failures_are_not_cached(self):
+        cache = response_cache.ResponseCache(ttl_in_s=60)
+
+        assert cache.get("a", lambda: None) is None
+        assert cache.get("a", lambda: "ok") == "ok"
+
+    def test_size_bounded(self):
+        cache = response_cache.ResponseCache(ttl_in_s=60, max_size=2)
+        fetch = Fetcher()
+
+        for key in "abc":
+            cache.get(key, fetch)
+
+        assert cache.stats()["size"] == 2
+        assert cache.get("a", fetch) == {"call": 4}  # evicted
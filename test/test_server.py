@@ -0,0 +1,40 @@
+import asyncio
+import threading
+import time
+
+import departure.commons.parallel as parallel
+import departure.provider.sncf.server as sncf_server
+
+
+def test_run_blocking():
+    async def main():
+        return await parallel.run_blocking(lambda a, b=0: a + b, 1, b=2)
+
+    assert asyncio.run(main()) == 3
+
+
+def test_slow_provider_call_does_not_block_event_loop(monkeypatch):
+    release = threading.Event()
+
+    def slow_next_trains(stop_area_id):
+        release.wait(5)
+        return [stop_area_id]
+
+    monkeypatch.setattr(sncf_server.sncf, "next_trains", slow_next_trains)
+
+    async def main():
+        slow_request = asyncio.ensure_future(sncf_server.next_trains("87393702"))
+        await asyncio.sleep(0.05)
+
+        # other requests are still served while the slow request is pending
+        start_time = time.monotonic()
+        search_response = await sncf_server.search("montparnasse", 1)
+        assert time.monotonic() - start_time < 1
+        assert not slow_request.done()
+
+        release.set()
+        return search_response, await slow_request
+
+    search_response, slow_response = asyncio.run(main())
+    assert len(search_response) == 1
+    assert slow_response == {"status": "OK", "response": ["87393702"]}
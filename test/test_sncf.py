@@ -0,0 +1,92 @@
+import threading
+
+import departure.provider.sncf.sncf as sncf
+
+
+def departure_json(n):
+    return {
+        "stop_date_time": {
+            "departure_date_time": "20201010T100000",
+            "base_departure_date_time": "20201010T100000",
+        },
+        "stop_point": {"id": "stop_point:OCE:SP:TGV-87686006"},
+        "display_informations": {
+            "direction": f"Destination {n} (City)",
+            "headsign": str(n),
+            "commercial_mode": "TGV INOUI",
+            "links": [],
+        },
+        "links": [{"type": "vehicle_journey", "id": f"vehicle_journey:{n}"}],
+    }
+
+
+def vehicle_journeys_json(vehicle_journey_id):
+    return {
+        "vehicle_journeys": [
+            {
+                "stop_times": [
+                    {
+                        "departure_time": "100000",
+                        "stop_point": {
+                            "id": "stop_point:OCE:SP:TGV-87686006",
+                            "name": f"Stop {vehicle_journey_id[-1]}",
+                        },
+                    }
+                ]
+            }
+        ]
+    }
+
+
+class TestNextTrains:
+    def setup_method(self):
+        self.departures = {"departures": [departure_json(n) for n in range(4)]}
+
+    def patch_api(self, monkeypatch, vehicle_journeys):
+        monkeypatch.setattr(sncf, "check_params", lambda stop_area_id: None)
+        monkeypatch.setattr(
+            sncf.api, "departures", lambda station_id: self.departures
+        )
+        monkeypatch.setattr(sncf.api, "vehicle_journeys", vehicle_journeys)
+
+    def test_timetables_in_order(self, monkeypatch):
+        self.patch_api(monkeypatch, vehicle_journeys_json)
+
+        trains = sncf.next_trains("stop_area:OCE:SA:87686006", True)
+
+        assert [train["direction"] for train in trains] == [
+            f"Destination {n}" for n in range(4)
+        ]
+        assert [train["timetable"][0]["name"] for train in trains] == [
+            "Stop 0",
+            "Stop 1",
+            "Stop 2",
+            "Stop 3",
+        ]
+
+    def test_first_train_only(self, monkeypatch):
+        self.patch_api(monkeypatch, vehicle_journeys_json)
+
+        trains = sncf.next_trains("stop_area:OCE:SA:87686006")
+
+        assert len(trains[0]["timetable"]) == 1
+        assert all("timetable" not in train for train in trains[1:])
+
+    def test_failed_and_late_timetables(self, monkeypatch):
+        release = threading.Event()
+
+        def vehicle_journeys(vehicle_journey_id):
+            if vehicle_journey_id == "vehicle_journey:1":
+                return None  # failed request
+            if vehicle_journey_id == "vehicle_journey:2":
+                release.wait(5)
+            return vehicle_journeys_json(vehicle_journey_id)
+
+        self.patch_api(monkeypatch, vehicle_journeys)
+
+        trains = sncf.next_trains(
+            "stop_area:OCE:SA:87686006", True, timetable_timeout_in_s=0.2
+        )
+        release.set()
+
+        assert [len(train["timetable"]) for train in trains] == [1, 0, 0, 1]
@@ -0,0 +1,27 @@
+import threading
+
+import departure.commons.soap as soap
+import departure.provider.ratp.api as ratp_api
+
+
+class TestSoapClient:
+    def setup_method(self):
+        soap.clear_soap_clients()
+
+    def test_client_is_shared(self):
+        client = ratp_api.soap_client()
+        assert ratp_api.soap_client() is client
+
+    def test_client_is_shared_across_threads(self):
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(ratp_api.soap_client()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 8
+        assert all(client is clients[0] for client in clients)
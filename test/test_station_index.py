@@ -0,0 +1,94 @@
+import json
+import os
+
+import departure.commons.station_index as station_index
+
+
+def extract(source_path):
+    with source_path.open(encoding="utf-8") as source_file:
+        return {
+            str(station["id"]): {"nom": station["name"]}
+            for station in json.load(source_file)
+        }
+
+
+class TestStationIndex:
+    def setup_method(self):
+        self.calls = 0
+
+    def counting_extract(self, source_path):
+        self.calls += 1
+        return extract(source_path)
+
+    def write_source(self, source_path, stations):
+        source_path.write_text(json.dumps(stations), encoding="utf-8")
+
+    def test_index_is_built_then_used(self, tmp_path):
+        source_path = tmp_path / "stations.json"
+        self.write_source(source_path, [{"id": 1, "name": "Orly\tVille"}])
+
+        stations = station_index.load_station_index(
+            source_path, self.counting_extract, ["nom"]
+        )
+        assert stations == {"1": {"nom": "Orly\tVille"}}
+        assert station_index.index_path(source_path).exists()
+
+        stations = station_index.load_station_index(
+            source_path, self.counting_extract, ["nom"]
+        )
+        assert stations == {"1": {"nom": "Orly Ville"}}
+        assert self.calls == 1
+
+    def test_stale_index(self, tmp_path):
+        source_path = tmp_path / "stations.json"
+        self.write_source(source_path, [{"id": 1, "name": "Orly"}])
+        station_index.load_station_index(source_path, self.counting_extract, ["nom"])
+
+        self.write_source(source_path, [{"id": 2, "name": "Rungis"}])
+        assert station_index.read_station_index(source_path) is None
+
+        stations = station_index.load_station_index(
+            source_path, self.counting_extract, ["nom"]
+        )
+        assert stations == {"2": {"nom": "Rungis"}}
+        assert self.calls == 2
+
+    def test_raw_dataset_not_hashed_once_checked(self, tmp_path, monkeypatch):
+        source_path = tmp_path / "stations.json"
+        self.write_source(source_path, [{"id": 1, "name": "Orly"}])
+        station_index.load_station_index(source_path, self.counting_extract, ["nom"])
+        assert station_index.read_station_index(source_path) is not None
+
+        def fail(source_path):
+            raise AssertionError(f"{source_path} hashed again")
+
+        monkeypatch.setattr(station_index, "_source_signature", fail)
+        assert station_index.read_station_index(source_path) == {
+            "1": {"nom": "Orly"}
+        }
+
+    def test_index_checked_again_if_raw_dataset_touched(self, tmp_path):
+        # e.g. checkout: same content, new mtime
+        source_path = tmp_path / "stations.json"
+        self.write_source(source_path, [{"id": 1, "name": "Orly"}])
+        station_index.load_station_index(source_path, self.counting_extract, ["nom"])
+        stamp = station_index.stamp_path(source_path).read_text(encoding="utf-8")
+
+        stat = source_path.stat()
+        os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert station_index.read_station_index(source_path) is not None
+        assert station_index.stamp_path(source_path).read_text(
+            encoding="utf-8"
+        ) != stamp
+        assert self.calls == 1
+
+    def test_shipped_indexes_are_up_to_date(self):
+        # pylint: disable=import-outside-toplevel
+        import departure.provider.sncf.data as sncf_data
+        import departure.provider.transilien.data as transilien_data
+
+        assert station_index.read_station_index(sncf_data.DATA_PATH) is not None
+        assert (
+            station_index.read_station_index(transilien_data.IDF_DATA_PATH)
+            is not None
+        )
@@ -0,0 +1,53 @@
+import departure.commons.station_search as station_search
+
+STATIONS = {
+    "1": {"nom": "Paris Est"},
+    "2": {"nom": "Évry Courcouronnes"},
+    "3": {"nom": "Gare de l'Est"},
+    "4": {"nom": "Juvisy"},
+    "5": {"nom": "Est"},
+    "6": {"nom": "Bry-sur-Marne"},
+}
+
+
+class TestStationSearchIndex:
+    def setup_method(self):
+        self.index = station_search.StationSearchIndex(
+            STATIONS, lambda station: station["nom"]
+        )
+
+    def search(self, query, limit=None):
+        return list(self.index.search(query, limit))
+
+    def test_substring_match(self):
+        assert set(self.search("courco")) == {"2"}
+        assert set(self.search("ry")) == {"2", "6"}
+        assert set(self.search("de l'est")) == {"3"}
+        assert self.search("lyon") == []
+
+    def test_accent_and_case_folding(self):
+        assert self.search("EVRY") == ["2"]
+        assert self.search("évry") == ["2"]
+        assert self.search("juvïsy") == ["4"]
+
+    def test_ranking(self):
+        # exact match, name prefix, word prefix, anywhere
+        assert self.search("est") == ["5", "1", "3"]
+        assert self.search("e") == ["5", "2", "1", "3", "6"]
+
+    def test_limit(self):
+        assert self.search("est", limit=2) == ["5", "1"]
+        assert self.search("paris est", limit=0) == []
+        assert self.search("", limit=2) == ["1", "2"]
+
+    def test_empty_query(self):
+        assert self.search("") == list(STATIONS)
+
+    def test_matches_substring_scan(self):
+        for query in ["a", "ar", "ris e", "st", "sur-m", "y c", "xyz"]:
+            expected = {
+                station_id
+                for station_id, station in STATIONS.items()
+                if station_search.fold(query) in station_search.fold(station["nom"])
+            }
+            assert set(self.search(query)) == expected
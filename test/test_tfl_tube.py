@@ -1,6 +1,8 @@
 import json
 import pathlib
+import threading
 
+import departure.provider.tfl_tube.data as data
 import departure.provider.tfl_tube.tfl_tube as tfl_tube
 
 # pylint: disable=too-many-lines
@@ -1236,3 +1238,263 @@ class TestInverseCanonicalDirection:
 
     def test_random(self):
         assert tfl_tube.inverse_canonical_direction("random") is None
+
+
+class TestStationsByLine:
+    def test_line_data_loaded_once(self, monkeypatch):
+        stations = tfl_tube.stations_by_line("victoria")
+        assert "940GZZLUOXC" in stations
+
+        def fail(line_id):
+            raise AssertionError(f"{line_id} line data loaded again")
+
+        monkeypatch.setattr(data, "_load_stoppoints", fail)
+        assert tfl_tube.stations_by_line("victoria") == stations
+        assert data.naptan_ids_by_line("victoria") == tuple(stations)
+
+    def test_slow_line_does_not_block_other_lines(self, monkeypatch):
+        monkeypatch.setattr(data, "_stoppoints_by_line", {})
+        monkeypatch.setattr(data, "_naptan_ids_by_line", {})
+        monkeypatch.setattr(data, "_line_data_locks", {})
+
+        download_started = threading.Event()
+        download_released = threading.Event()
+
+        def load_stoppoints(line_id):
+            if line_id == "victoria":
+                download_started.set()
+                download_released.wait(5)
+            return [{"naptanId": f"{line_id}-stoppoint"}]
+
+        monkeypatch.setattr(data, "_load_stoppoints", load_stoppoints)
+
+        slow_thread = threading.Thread(
+            target=data.stoppoints_by_line, args=["victoria"]
+        )
+        slow_thread.start()
+        download_started.wait(5)
+        try:
+            assert data.naptan_ids_by_line("district") == ("district-stoppoint",)
+            assert slow_thread.is_alive()
+        finally:
+            download_released.set()
+            slow_thread.join()
+
+        assert data.naptan_ids_by_line("victoria") == ("victoria-stoppoint",)
+
+
+class TestArrivalsAroundStation:
+    # Victoria line, from Walthamstow Central to Highbury & Islington
+    ROUTES = [
+        [
+            "940GZZLUWWL",
+            "940GZZLUBLR",
+            "940GZZLUTMH",
+            "940GZZLUSVS",
+            "940GZZLUFPK",
+            "940GZZLUHAI",
+        ]
+    ]
+
+    def test_adjacent_station_ids(self, monkeypatch):
+        monkeypatch.setitem(data._routes_by_line, "victoria", self.ROUTES)
+
+        assert data.adjacent_station_ids("victoria", "940GZZLUTMH") == (
+            "940GZZLUWWL",
+            "940GZZLUBLR",
+            "940GZZLUTMH",
+            "940GZZLUSVS",
+            "940GZZLUFPK",
+        )
+        assert data.adjacent_station_ids("victoria", "940GZZLUWWL", 1) == (
+            "940GZZLUWWL",
+            "940GZZLUBLR",
+        )
+
+    def test_adjacent_stations_only(self, monkeypatch):
+        monkeypatch.setitem(data._routes_by_line, "victoria", self.ROUTES)
+
+        requested_station_ids = []
+
+        def stoppoint_arrivals(station_ids):
+            requested_station_ids.extend(station_ids)
+            return [
+                {"lineId": "victoria", "vehicleId": "1"},
+                {"lineId": "piccadilly", "vehicleId": "2"},
+            ]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("all arrivals downloaded")
+
+        monkeypatch.setattr(tfl_tube.api, "stoppoint_arrivals", stoppoint_arrivals)
+        monkeypatch.setattr(tfl_tube.api, "line_arrivals", fail)
+        monkeypatch.setattr(tfl_tube.api, "tube_arrivals", fail)
+
+        arrivals = tfl_tube.arrivals_around_station(
+            ["victoria"], "940GZZLUFPK", "adjacent"
+        )
+
+        assert requested_station_ids == [
+            "940GZZLUFPK",
+            "940GZZLUTMH",
+            "940GZZLUSVS",
+            "940GZZLUHAI",
+        ]
+        assert arrivals == [{"lineId": "victoria", "vehicleId": "1"}]
+
+    def test_unknown_routes_fall_back_to_line(self, monkeypatch):
+        monkeypatch.setattr(data, "_load_routes", lambda line_id: None)
+        monkeypatch.setattr(
+            tfl_tube.api,
+            "line_arrivals",
+            lambda line_ids: [{"lineId": line_ids[0], "vehicleId": "1"}],
+        )
+
+        assert tfl_tube.arrivals_around_station(
+            ["waterloo-city"], "940GZZLUBNK", "adjacent"
+        ) == [{"lineId": "waterloo-city", "vehicleId": "1"}]
+
+
+class TestDirectionTables:
+    def test_termini(self):
+        tables = data.DIRECTION_TABLES
+
+        terminus = tables.terminus("central", "940GZZLUWCY")
+        assert terminus.is_inline
+        assert terminus.arrival_canonical_direction == "inbound"
+        assert "940GZZLUEBY" in terminus.inverse_terminating_stations
+
+        assert tables.terminus("central", "940GZZLUBNK") is None
+        assert tables.terminus("unknown", "940GZZLUBNK") is None
+        assert tables.terminus("circle", "940GZZLUHSC").arrival_rail == "Inner Rail"
+
+    def test_platform_direction(self):
+        tables = data.DIRECTION_TABLES
+
+        assert tables.platform_direction("Northbound Fast - Platform 2") == (
+            "Northbound"
+        )
+        assert tables.platform_direction("WestBound - Platform 3") == "Westbound"
+        assert tables.platform_direction("Platform 2/3") is None
+        # memoised
+        assert tables.platform_direction("Platform 2/3") is None
+
+    def test_towards_memoised(self, monkeypatch):
+        assert tfl_tube.station_id_from_towards("Edgware via CX", "northern") == (
+            "940GZZLUEGW"
+        )
+
+        def fail(towards, line_id):
+            raise AssertionError(f"{towards} resolved again")
+
+        monkeypatch.setattr(tfl_tube, "_station_id_from_towards", fail)
+        assert tfl_tube.station_id_from_towards("Edgware via CX", "northern") == (
+            "940GZZLUEGW"
+        )
+
+
+class TestBatchFiltering:
+    @staticmethod
+    def arrivals():
+        arrivals = []
+        for file_name in (
+            "line-arrivals-circle_district-BKF.json",
+            "line-arrivals-circle_district-BST.json",
+            "tube-arrivals-at_BKF.json",
+            "tube-arrivals-at_BST.json",
+        ):
+            with open(pathlib.Path(__file__).parent / "data" / file_name) as file:
+                arrivals.extend(json.load(file))
+        for arrival in arrivals:  # trimmed records
+            arrival.setdefault("timeToStation", 0)
+        return arrivals
+
+    def test_by_direction_of_departure(self):
+        arrivals = self.arrivals()
+        columns = tfl_tube.ArrivalColumns(arrivals)
+
+        for direction in ("Westbound", "Eastbound"):
+            assert tfl_tube.filter_trains_by_direction_of_departure_batch(
+                columns, direction
+            ) == tfl_tube.filter_trains_by_direction_of_departure(arrivals, direction)
+
+    def test_currently_at_platform(self):
+        arrivals = self.arrivals()
+        columns = tfl_tube.ArrivalColumns(arrivals)
+
+        for line_ids, station_id, direction in (
+            (["district", "circle"], "940GZZLUBKF", "Eastbound"),
+            (["district", "circle"], "940GZZLUBST", "Westbound"),
+            (["circle"], None, "Eastbound"),
+            (None, None, None),
+        ):
+            trains = tfl_tube.filter_trains_currently_at_platform_batch(
+                columns, line_ids, station_id, direction
+            )
+            expected_trains = tfl_tube.filter_trains_currently_at_platform(
+                arrivals, line_ids, station_id, direction
+            )
+            assert trains == expected_trains
+            assert list(trains) == list(expected_trains)
+
+        assert len(
+            tfl_tube.filter_trains_currently_at_platform_batch(
+                columns, ["district", "circle"], "940GZZLUBKF", "Eastbound"
+            )
+        ) == 1
+
+    def test_empty(self):
+        columns = tfl_tube.ArrivalColumns([])
+
+        assert len(columns) == 0
+        assert tfl_tube.filter_trains_by_direction_of_departure_batch(
+            columns, "Eastbound"
+        ) == {}
+        assert tfl_tube.filter_trains_currently_at_platform_batch(columns) == {}
+
+
+class TestRoutes:
+    def test_unwritable_data_dir(self, monkeypatch, tmp_path):
+        # routes can't be saved (e.g. read-only install): kept in memory
+        monkeypatch.setattr(data, "DATA_PATH", tmp_path / "missing")
+        monkeypatch.setattr(
+            data.api,
+            "line_route_sequence",
+            lambda line_id: {
+                "orderedLineRoutes": [{"naptanIds": ["940GZZLUWWL", "940GZZLUBLR"]}]
+            },
+        )
+        monkeypatch.setattr(data, "_routes_by_line", {})
+
+        assert data.adjacent_station_ids("victoria", "940GZZLUWWL") == (
+            "940GZZLUWWL",
+            "940GZZLUBLR",
+        )
+
+    def test_failed_download_not_retried_before_delay(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(data, "DATA_PATH", tmp_path)
+        monkeypatch.setattr(data, "_routes_by_line", {})
+        monkeypatch.setattr(data, "_routes_failure_times", {})
+
+        requested_line_ids = []
+
+        def line_route_sequence(line_id):
+            requested_line_ids.append(line_id)
+
+        monkeypatch.setattr(data.api, "line_route_sequence", line_route_sequence)
+
+        assert data.routes_by_line("victoria") is None
+        assert data.routes_by_line("victoria") is None
+        assert requested_line_ids == ["victoria"]
+
+        monkeypatch.setattr(data, "ROUTES_RETRY_DELAY_IN_S", 0)
+        assert data.routes_by_line("victoria") is None
+        assert requested_line_ids == ["victoria", "victoria"]
+
+    def test_not_waiting_for_download_in_progress(self, monkeypatch):
+        monkeypatch.setattr(data, "_routes_by_line", {})
+        monkeypatch.setattr(data, "_line_data_locks", {})
+
+        # pylint: disable=protected-access
+        with data._line_data_lock("routes", "victoria"):
+            assert data.routes_by_line("victoria") is None
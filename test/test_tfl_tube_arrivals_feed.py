@@ -0,0 +1,112 @@
+import json
+import pathlib
+
+import departure.provider.tfl_tube.arrivals_feed as arrivals_feed
+import departure.provider.tfl_tube.tfl_tube as tfl_tube
+
+DATA_PATH = pathlib.Path(__file__).parent / "data"
+LINE_IDS = ["circle", "district", "hammersmith-city"]
+
+
+def bkf_arrivals():
+    with open(DATA_PATH / "line-arrivals-circle_district-BKF.json", "r") as file:
+        line_arrivals = json.load(file)
+    with open(DATA_PATH / "tube-arrivals-at_BKF.json", "r") as file:
+        tube_arrivals = json.load(file)
+    for arrival in tube_arrivals:  # trimmed records
+        arrival.setdefault("timeToStation", 0)
+    return line_arrivals + tube_arrivals
+
+
+def test_snapshot_indexes():
+    arrivals = bkf_arrivals()
+    snapshot = arrivals_feed.ArrivalsSnapshot(LINE_IDS, arrivals)
+
+    assert snapshot.arrivals_at(LINE_IDS, "940GZZLUBKF") == [
+        arrival
+        for line_id in LINE_IDS
+        for arrival in arrivals
+        if arrival["lineId"] == line_id and arrival["naptanId"] == "940GZZLUBKF"
+    ]
+    assert {
+        f"{arrival['lineId']}-{arrival['vehicleId']}"
+        for arrival in snapshot.arrivals_currently_at(LINE_IDS, "940GZZLUBKF")
+    } >= {"district-106", "circle-201"}
+
+
+def test_next_trains_from_snapshot():
+    arrivals = bkf_arrivals()
+    snapshot = arrivals_feed.ArrivalsSnapshot(LINE_IDS, arrivals)
+
+    for direction in ("Eastbound", "Westbound"):
+        expected_trains = tfl_tube.filter_trains_by_direction_of_departure(
+            [arrival for arrival in arrivals if arrival["naptanId"] == "940GZZLUBKF"],
+            direction,
+        )
+        expected_trains.update(
+            tfl_tube.filter_trains_currently_at_platform(
+                arrivals, LINE_IDS, "940GZZLUBKF", direction
+            )
+        )
+
+        assert (
+            tfl_tube.next_trains_from_snapshot(
+                snapshot, "circle", "940GZZLUBKF", direction
+            )
+            == expected_trains
+        )
+
+
+class TestArrivalsFeed:
+    def test_fetched_once_for_all_subscribers(self, monkeypatch):
+        requested_line_ids = []
+
+        def line_arrivals(line_ids):
+            requested_line_ids.append(line_ids)
+            return bkf_arrivals()
+
+        monkeypatch.setattr(arrivals_feed.api, "line_arrivals", line_arrivals)
+
+        feed = arrivals_feed.ArrivalsFeed(max_age_in_s=60)
+        feed.subscribe(["circle", "district"])
+        feed.subscribe(["district"])
+
+        snapshot = feed.snapshot(["circle", "district"])
+        assert feed.snapshot(["district"]) is snapshot
+        assert requested_line_ids == [["circle", "district"]]
+
+        # lines not in snapshot yet
+        feed.snapshot(["victoria"])
+        assert requested_line_ids[-1] == ["circle", "district", "victoria"]
+        assert feed.fetch_count == 2
+
+        feed.unsubscribe(["district"])
+        assert feed.subscribed_line_ids() == ["circle", "district"]
+        feed.unsubscribe(["circle", "district"])
+        assert feed.subscribed_line_ids() == []
+
+    def test_refreshed_after_max_age(self, monkeypatch):
+        monkeypatch.setattr(arrivals_feed.api, "line_arrivals", lambda line_ids: [])
+
+        feed = arrivals_feed.ArrivalsFeed(max_age_in_s=0)
+        feed.snapshot(["circle"])
+        feed.snapshot(["circle"])
+        assert feed.fetch_count == 2
+
+    def test_failure_not_retried_before_max_age(self, monkeypatch):
+        monkeypatch.setattr(
+            arrivals_feed.api, "line_arrivals", lambda line_ids: None
+        )
+
+        feed = arrivals_feed.ArrivalsFeed(max_age_in_s=60)
+        assert feed.snapshot(["circle"]) is None
+        assert feed.snapshot(["circle"]) is None
+        assert feed.fetch_count == 1
+
+
+def test_shared_arrivals_opt_in(monkeypatch):
+    monkeypatch.delenv("TFL_SHARED_ARRIVALS", raising=False)
+    assert not arrivals_feed.use_shared_arrivals()
+
+    monkeypatch.setenv("TFL_SHARED_ARRIVALS", "true")
+    assert arrivals_feed.use_shared_arrivals()
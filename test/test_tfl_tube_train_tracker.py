@@ -0,0 +1,101 @@
+import threading
+
+import departure.provider.tfl_tube.data_updater as data_updater
+import departure.provider.tfl_tube.train_tracker as train_tracker
+
+
+def train(vehicle_id, time_to_station, towards="Upminster"):
+    return {
+        "line_id": "district",
+        "vehicle_id": vehicle_id,
+        "station_id": "940GZZLUBKF",
+        "towards": towards,
+        "time_to_station": time_to_station,
+    }
+
+
+def kinds(events):
+    return [(event.kind, event.train_id) for event in events]
+
+
+class TestTrainTracker:
+    def test_events(self):
+        tracker = train_tracker.TrainTracker()
+
+        assert kinds(
+            tracker.update(
+                {"district-1": train("1", 120), "district-2": train("2", 300)}, now=0
+            )
+        ) == [("arrived", "district-1"), ("arrived", "district-2")]
+
+        # counted down as expected: no event
+        assert (
+            tracker.update(
+                {"district-1": train("1", 105), "district-2": train("2", 285)}, now=15
+            )
+            == []
+        )
+
+        assert kinds(
+            tracker.update(
+                {
+                    "district-2": train("2", 330, "Barking"),
+                    "district-3": train("3", 600),
+                },
+                now=30,
+            )
+        ) == [
+            ("changed", "district-2"),
+            ("time_changed", "district-2"),
+            ("arrived", "district-3"),
+            ("departed", "district-1"),
+        ]
+
+    def test_interpolation(self):
+        tracker = train_tracker.TrainTracker()
+        assert tracker.trains(now=0) == {}
+
+        tracker.update(
+            {"district-1": train("1", 20), "district-2": train("2", 0)}, now=100
+        )
+
+        trains = tracker.trains(now=112.5)
+        assert trains["district-1"]["time_to_station"] == 8
+        assert trains["district-2"]["time_to_station"] == 0
+        assert tracker.trains(now=200)["district-1"]["time_to_station"] == 0
+
+
+class FakeViewModel:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, trains):
+        self.updates.append(trains)
+
+
+def test_board_refreshed_between_updates(monkeypatch):
+    updater = data_updater.DataUpdaterTflTube(
+        FakeViewModel(),
+        data_refresh_delay_in_s=15,
+        end_event=threading.Event(),
+        line_id="district",
+        station_id="940GZZLUBKF",
+        direction="Eastbound",
+        feed=None,
+    )
+    monkeypatch.setattr(updater, "next_trains", lambda: {"district-1": train("1", 90)})
+
+    now = [0]
+    updater.train_tracker.clock = lambda: now[0]
+
+    updater.update()
+    assert updater.view_model.updates[-1]["district-1"]["time_to_station"] == 90
+
+    # nothing to count down yet
+    updater.tick()
+    assert len(updater.view_model.updates) == 1
+
+    now[0] = 5
+    updater.tick()
+    assert len(updater.view_model.updates) == 2
+    assert updater.view_model.updates[-1]["district-1"]["time_to_station"] == 85
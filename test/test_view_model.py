@@ -0,0 +1,108 @@
+import departure.board.departure_pb2 as departure_pb2
+import departure.board.view_model as view_model
+import departure.provider.tfl_tube.view_model as tfl_tube_view_model
+
+
+def section_update_request(section_index, text):
+    return departure_pb2.BoardSectionUpdateRequest(
+        section_index=section_index,
+        content=departure_pb2.BoardSectionContent(
+            content_w=len(text),
+            pixels=[departure_pb2.Pixel(x=i, r=ord(c)) for i, c in enumerate(text)],
+        ),
+    )
+
+
+class TestSectionUpdateTracker:
+    def test_only_changed_sections(self):
+        tracker = view_model.SectionUpdateTracker()
+
+        requests = [section_update_request(i, text) for i, text in enumerate("abc")]
+        assert tracker.changed_requests(requests) == requests
+
+        requests = [section_update_request(i, text) for i, text in enumerate("abd")]
+        assert tracker.changed_requests(requests) == [requests[2]]
+        assert tracker.changed_requests(requests) == []
+
+    def test_reset(self):
+        tracker = view_model.SectionUpdateTracker()
+
+        requests = [section_update_request(0, "a")]
+        tracker.changed_requests(requests)
+        tracker.reset()
+        assert tracker.changed_requests(requests) == requests
+
+    def test_full_update_interval(self):
+        tracker = view_model.SectionUpdateTracker(full_update_interval_in_s=0)
+
+        requests = [section_update_request(0, "a")]
+        tracker.changed_requests(requests)
+        assert tracker.full_update_due()
+        assert tracker.changed_requests(requests) == requests
+
+    def test_full_update_due(self):
+        tracker = view_model.SectionUpdateTracker()
+        assert tracker.full_update_due()
+
+        tracker.changed_requests([section_update_request(0, "a")])
+        assert not tracker.full_update_due()
+
+
+class StubBoardManager:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.requests = []
+
+    # pylint: disable=invalid-name
+    def BoardSectionsUpdate(self, board_sections_update_request):
+        self.requests.append(board_sections_update_request)
+
+
+def test_tfl_tube_view_model_sends_changed_sections():
+    stub = StubBoardManager()
+    target_view_model = tfl_tube_view_model.ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers(
+        stub
+    )
+
+    trains = {
+        "1": {"towards": "Morden", "time_to_station": 60},
+        "2": {"towards": "Kennington", "time_to_station": 180},
+    }
+    target_view_model.update(trains)
+    assert [r.section_index for r in stub.requests[-1].requests] == [0, 1, 2]
+
+    target_view_model.update(trains)
+    assert len(stub.requests) == 1
+
+    trains["2"]["time_to_station"] = 240
+    target_view_model.update(trains)
+    assert [r.section_index for r in stub.requests[-1].requests] == [1]
+
+
+def test_tfl_tube_view_model_skips_unchanged_displayed_text(monkeypatch):
+    stub = StubBoardManager()
+    target_view_model = tfl_tube_view_model.ViewModelTflTube_192_32_3_Rows_To_ProtocolBuffers(
+        stub
+    )
+
+    trains = {"1": {"towards": "Morden", "time_to_station": 150}}
+    target_view_model.update(trains)
+
+    rendered_sections = []
+    section_request = target_view_model.section_request
+
+    def tracked_section_request(section_index, section_texts):
+        rendered_sections.append(section_index)
+        return section_request(section_index, section_texts)
+
+    monkeypatch.setattr(target_view_model, "section_request", tracked_section_request)
+
+    # counted down, still displayed as the same minute: nothing rendered or sent
+    trains["1"]["time_to_station"] = 145
+    target_view_model.update(trains)
+    assert rendered_sections == []
+    assert len(stub.requests) == 1
+
+    trains["1"]["time_to_station"] = 60
+    target_view_model.update(trains)
+    assert rendered_sections == [0]
+    assert [r.section_index for r in stub.requests[-1].requests] == [0]